@@ -1,41 +1,98 @@
+import argparse
+import concurrent.futures
 import hashlib
+import multiprocessing
 import os
+import signal
 import threading
 from thrift.transport import TSocket, TTransport
 from thrift.protocol import TBinaryProtocol
 from thrift.server import TServer
-import socket
-import numpy as np
 import sys
 sys.path.append("gen-py")
 import ML.ML
+import ML.worker
 from compute_node.ComputeNode import (
     Processor, 
     Client as ComputeNodeClient,
-    Model 
+    Model,
+    QueueStatus,
+    Aggregate
 )
 import ML
 from supernode.Supernode import Client as SupernodeClient
+from model_store import ModelStore
+from job_queue import JobQueue, QueueFull
+from connection_pool import ConnectionPool
+from compute_node.ModelReceiver import Client as ModelReceiverClient
+from chain_broadcast import ChainBroadcast
+import tensor_codec
+from thrift.TSerialization import deserialize
 
 class ComputeNodeHandler:
-    def __init__(self, node_port, supernode_ip, supernode_port):
+    def __init__(self, node_port, supernode_ip, supernode_port, precision='float64',
+                 batch_size=None, eta=0.0001, stream_threshold=256 * 2**20, max_stack=8,
+                 workers=None, queue_capacity=1024, queue_order='fifo', model_dir=None,
+                 max_resident=64, job_ttl=0):
         self.node_port = node_port
         self.supernode_ip = supernode_ip
         self.supernode_port = supernode_port
+        self.precision = precision
+        self.batch_size = batch_size
+        self.eta = eta
+        # shards larger than this many bytes are streamed instead of loaded
+        self.stream_threshold = stream_threshold
+        # at most this many queued shards are trained together as one stack
+        self.max_stack = max_stack
         self.predecessor = None
         self.successor = None
         self.finger_table = {}
         self.active_nodes = {}
-        self.model = ML.ML.mlp()
-        self.models = {}
-        self.training_status = {}
+        # Trained models and training status, shared by RPC and training threads,
+        # written to model_dir so a restarted node still serves them.
+        self.models = ModelStore(model_dir, max_resident, job_ttl)
         self.m = 6  # Chord ring size (2^6 = 64)
         self.node_path = []
-
-        # Flag to indicate whether the global model has been initialized.
-        self.global_model_initialized = False
-        # Lock to protect model initialization and updates across threads.
+        # Cache of node id -> "ip:port", filled from the supernode on a miss.
+        self.node_addresses = {}
+        self.address_lock = threading.Lock()
+        # Open connections to other compute nodes, reused across calls.
+        self.connections = ConnectionPool(ComputeNodeClient)
+        # Open connections to the clients' ModelReceiver callbacks.
+        self.receivers = ConnectionPool(ModelReceiverClient)
+        # What top-k compression dropped from each job's gradients of a file,
+        # sent with the job's next model of the file (error feedback).
+        self.residuals = {}
+        self.residual_lock = threading.Lock()
+
+        # Global models published for warm-started rounds, (V, W) by job and
+        # version, the newest max_global_versions of every job are kept.
+        self.global_models = {}
+        self.max_global_versions = 2
+        # The (init, config) each queued (job, filename) trains with, init is
+        # the (V, W) global model it starts from or None for a random init.
+        self.file_tasks = {}
+        # Lock to protect the global models and file inits across threads.
         self.model_lock = threading.Lock()
+        # Global models being received in chunks, by (job, version), and how
+        # long the last chunk waits for the rest of the chain in seconds.
+        self.broadcasts = {}
+        self.broadcast_lock = threading.Lock()
+        self.broadcast_timeout = 60
+        # (job, filename) pairs waiting for a worker, the trainer thread coalesces them into stacks.
+        self.jobs = JobQueue(queue_capacity, queue_order)
+        # Training runs in worker processes, each group of files in a free worker.
+        self.workers = workers or os.cpu_count() or 1
+        self.worker_slots = threading.Semaphore(self.workers)
+        self.executor = self.new_executor()
+        self.executor_lock = threading.Lock()
+        # Stores finished results off the pool's management thread, since
+        # storing writes to disk and pushes to callbacks.
+        self.finisher = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        # Number of files handed to the workers and not finished yet.
+        self.running = 0
+        self.running_lock = threading.Lock()
+        threading.Thread(target=self.run_trainer, daemon=True).start()
 
         if self.join_network():
             self.confirm_join()
@@ -43,8 +100,7 @@ class ComputeNodeHandler:
     def hash_filename(self, filename):
         """Return a hashed integer ID for the given filename modulo 2**m."""
         return int(hashlib.sha1(filename.encode()).hexdigest(), 16) % (2 ** self.m)
-    
-    
+
     def print_info(self, filename):
         print(f"\n=== Node {self.node_id} ===")
         print(f"Processing file: {filename}")
@@ -57,8 +113,26 @@ class ComputeNodeHandler:
         print("=======================")
 
 
-    def put_data(self, filename):
-        """Route file data to the correct node for training."""
+    def put_data(self, filename, callback_address="", compression=""):
+        """Route file data to the correct node for training.
+
+        If callback_address ("host:port" of a ModelReceiver) is given, the
+        owner pushes the finished model there, compressed as compression asks.
+        """
+        self.submit_data(filename, 0, 0, forward_oneway=True, callback_address=callback_address,
+                         compression=compression)
+
+
+    def submit_data(self, filename, priority, deadline_ms, forward_oneway=False, callback_address="",
+                    compression=""):
+        """Route file data to the correct node for training and return its queue status.
+
+        Higher priorities train first, and with the 'edf' queue order earlier
+        deadlines (ms since the epoch, 0 for none) train first within a priority.
+        Returns 'queued', 'cached' if the file's model is already known,
+        'training' if the file is already queued or training,
+        'saturated' if the owner's queue is full, or 'error'.
+        """
         hashed_id = self.hash_filename(filename)
         successor, path = self.find_successor_with_path(hashed_id)
         
@@ -68,66 +142,269 @@ class ComputeNodeHandler:
         if successor == self.node_id:
             print(f"Starting training for {filename} on node {self.node_id}")
             print("Put Data -  Model - filename: ", filename, "ID:", hashed_id)
-            self.start_training(filename)
-        else:
-            self.forward_to_node(successor, filename)
+            if callback_address:
+                self.models.add_callback("", filename, callback_address, compression)
+            return self.start_training(filename, priority, deadline_ms)
+        if forward_oneway:
+            return self.forward_to_node(successor, filename, callback_address=callback_address,
+                                        compression=compression)
+        return self.forward_to_node(successor, filename, priority=priority, deadline_ms=deadline_ms)
     
     
-    def start_training(self, filename):
-        """Begin training for the file if not already training."""
-        if self.training_status.get(filename) == 'training':
-            return
-        self.training_status[filename] = 'training'
-        threading.Thread(target=self.train_model, args=(filename,)).start()
+    def start_training(self, filename, priority=0, deadline_ms=0, job="", version=0, settings=None):
+        """Queue the file for training for job if not already queued or training.
+
+        With a version the file trains from the job's published global model
+        of that version, 'error' is returned if this node does not have it.
+        The file trains with the node's settings, overridden by the
+        TrainingSettings given, see training_config.
+        A file whose content was already trained from the same weights with
+        the same settings is not queued, it gets the stored model and
+        'cached' is returned.
+        """
+        init = None
+        if version:
+            init = self.global_model(job, version)
+            if init is None:
+                print(f"No global model version {version} of job {job} for {filename}")
+                return 'error'
+
+        config = self.training_config(settings)
+        key = ML.worker.training_key(self.shard_path(filename), config, init)
+        cached = self.models.find(key) if key else None
+        if not self.models.start(job, filename, key):
+            return 'training'
+        if cached is not None:
+            print(f"Reusing the trained model of {filename}")
+            self.store_model(job, filename, cached)
+            return 'cached'
+
+        with self.model_lock:
+            self.file_tasks[(job, filename)] = (init, config)
+        try:
+            self.jobs.push((job, filename), priority, deadline_ms)
+        except QueueFull as e:
+            print(f"Rejected {filename}: {e}")
+            self.store_model(job, filename, Model(status='saturated'))
+            return 'saturated'
+        return 'queued'
+
+
+    def get_queue_status(self):
+        """Return the depth and capacity of the training queue."""
+        with self.running_lock:
+            running = self.running
+        return QueueStatus(
+            depth=self.jobs.depth(),
+            capacity=self.jobs.capacity,
+            running=running,
+            workers=self.workers,
+            saturated=self.jobs.is_full()
+        )
+
+
+    def run_trainer(self):
+        """Hand queued files to the worker pool, up to max_stack at a time.
+
+        A group is only taken once a worker is free, so files that arrive
+        while all workers are busy are coalesced into the next stack.
+        """
+        while True:
+            self.worker_slots.acquire()
+            group = self.jobs.pop_many(self.max_stack)
+            with self.running_lock:
+                self.running += len(group)
+
+            # files of different rounds start from different weights, files
+            # of different requests may train with different settings, jobs
+            # sharing a shard, its weights and settings train it once
+            tasks = {}
+            with self.model_lock:
+                for job, filename in group:
+                    init, config = self.file_tasks.pop((job, filename), (None, self.training_config()))
+                    task = (id(init), tuple(sorted(config.items())))
+                    shards = tasks.setdefault(task, (init, config, {}))[2]
+                    shards.setdefault(self.shard_path(filename), []).append((job, filename))
+            groups = [(list(shards), init, config) for init, config, shards in tasks.values()]
+            shards = [(shards, config) for _, config, shards in tasks.values()]
+            executor = self.executor
+            try:
+                future = executor.submit(ML.worker.train_groups, groups)
+            except Exception as e:
+                # a dead worker breaks the whole pool, start a new one
+                print(f"Could not hand {len(group)} files to the workers: {e}")
+                self.replace_executor(executor)
+                self.free_worker(group)
+                for job, filename in group:
+                    self.training_failed(job, filename, str(e))
+                continue
+            future.add_done_callback(lambda future, group=group, shards=shards, executor=executor:
+                                     self.training_done(group, shards, future, executor))
+
+
+    def new_executor(self):
+        """Return a new pool of training worker processes."""
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context('spawn'))
+
+
+    def replace_executor(self, broken):
+        """Replace the broken worker pool with a new one, unless that was done already."""
+        with self.executor_lock:
+            if self.executor is not broken:
+                return
+            print("Worker pool broken, starting new workers")
+            self.executor = self.new_executor()
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+    def free_worker(self, group):
+        """Count the group as no longer running and free its worker slot."""
+        with self.running_lock:
+            self.running -= len(group)
+        self.worker_slots.release()
+
+
+    def training_done(self, group, shards, future, executor):
+        """Free the worker of a finished group and store its results on the finisher thread."""
+        self.free_worker(group)
+        if not future.cancelled() and isinstance(future.exception(), concurrent.futures.BrokenExecutor):
+            self.replace_executor(executor)
+        self.finisher.submit(self.finish_training, shards, future)
+
+
+    def publish_model(self, job, version, V_tensor, W_tensor):
+        """Cache the job's global model of a round, files submitted with its version train from it.
+
+        Returns False if the version is older than the versions kept.
+        """
+        init = (tensor_codec.unpack(V_tensor).astype(float), tensor_codec.unpack(W_tensor).astype(float))
+        with self.model_lock:
+            versions = self.global_models.setdefault(job, {})
+            versions[version] = init
+            for old in sorted(versions)[:-self.max_global_versions]:
+                del versions[old]
+            kept = version in versions
+        print(f"Published global model version {version} of job {job}")
+        return kept
+
+
+    def broadcast_chunk(self, job, version, origin, index, total, data):
+        """Receive chunk index of total of a global model broadcast along the ring.
+
+        The chunks make up a serialized Model holding the V and W tensors.
+        Every chunk is forwarded to the successor while the next ones arrive,
+        until the chain reaches origin, the node the broadcast started at.
+        Once all chunks are in the model is published as version of job. The
+        call with the last chunk returns when the rest of the chain has the
+        model, True if every node down the chain published it.
+        """
+        key = (job, version)
+        with self.broadcast_lock:
+            broadcast = self.broadcasts.get(key)
+            if broadcast is None:
+                if self.global_model(job, version) is not None:
+                    # the chain came back around, or the broadcast was repeated
+                    return True
+                successor = self.successor
+                send = None
+                if successor is not None and successor not in (origin, self.node_id):
+                    send = lambda i, chunk: self.forward_chunk(successor, job, version, origin, i, total, chunk)
+                broadcast = self.broadcasts[key] = ChainBroadcast(total, send)
+            complete = broadcast.add(index, data)
+            if complete:
+                del self.broadcasts[key]
+        if not complete:
+            return True
+
+        model = deserialize(Model(), broadcast.payload())
+        published = self.publish_model(job, version, model.V_tensor, model.W_tensor)
+        return broadcast.wait(self.broadcast_timeout) and published
+
+
+    def global_model(self, job, version):
+        """Return the (V, W) global model of the job's version, None for version 0 or if unknown."""
+        with self.model_lock:
+            return self.global_models.get(job, {}).get(version)
+
+
+    def shard_path(self, filename):
+        """Return the path of the training file on this node."""
+        return f"letters/{filename}"
+
+
+    def training_config(self, settings=None):
+        """Return the settings the worker processes train with.
+
+        Fields set in the TrainingSettings of a request override the node's.
+        """
+        precision = settings.precision if settings and settings.precision else self.precision
+        batch_size = settings.batch_size if settings and settings.batch_size else self.batch_size
+        return dict(ML.worker.DEFAULT_CONFIG, eta=self.eta, precision=precision,
+                    batch_size=batch_size, stream_threshold=self.stream_threshold)
+
+
+    def finish_training(self, shards, future):
+        """Store the results of a group trained by the worker pool.
+
+        shards holds the (job, filename) pairs of every shard path and the
+        config they trained with, for every group handed to the workers.
+        """
+        try:
+            results = future.result()
+        except Exception as e:
+            results = [dict.fromkeys(paths, str(e)) for paths, _ in shards]
+
+        for (paths, config), group_results in zip(shards, results):
+            for path, entries in paths.items():
+                result = group_results.get(path, "No result from worker")
+                for job, filename in entries:
+                    if isinstance(result, str):
+                        self.training_failed(job, filename, result)
+                    else:
+                        self.store_gradients(job, filename, config['precision'], *result)
+
 
+    def store_gradients(self, job, filename, precision, error_rate, grad_V, grad_W, samples):
+        """Save the gradients (final - initial weights) of a file trained for job."""
+        # Save the computed gradients and training error in our local structure.
+        self.store_model(job, filename, Model(
+            V_tensor=tensor_codec.pack(grad_V),
+            W_tensor=tensor_codec.pack(grad_W),
+            error_rate=error_rate,
+            status='done',
+            samples=samples
+        ))
+        print(f"Computed gradients for {filename} (error rate: {error_rate:.4f}, precision: {precision})")
 
-    def train_model(self, filename):
-        """Train the model using the file and compute weight gradients."""
+
+    def training_failed(self, job, filename, error):
+        """Mark training of the job's file as failed."""
+        print(f"Training failed for {filename}: {error}")
+        self.store_model(job, filename, Model(status='failed'))
+
+
+    def store_model(self, job, filename, model):
+        """Store the job's model of a file and push it to the file's callbacks."""
+        for address, compression in self.models.put(job, filename, model):
+            self.push_model(address, filename, self.compress_model(job, filename, model, compression))
+
+
+    def push_model(self, address, filename, model):
+        """Send the model of a file to the ModelReceiver at address ("host:port")."""
         try:
-            K = 26
-            H = 20
-            eta = 0.0001
-            epochs = 250
-
-            filepath = f"letters/{filename}"
-            if not os.path.exists(filepath):
-                raise FileNotFoundError(f"Training file {filepath} not found")
-
-            self.model.init_training_random(filepath, K, H)
-            # Save the initial weights (before training on this file)
-            init_V, init_W = self.model.get_weights()
-
-            # Convert initial weights to numpy arrays for later gradient computation.
-            init_V = np.array(init_V)
-            init_W = np.array(init_W)
-
-            # Train the model on the current file.
-            error_rate = self.model.train(eta=eta, epochs=epochs)
-
-            # Compute gradients as the difference: (final - initial)
-            final_V, final_W = self.model.get_weights()
-            final_V_np = np.array(final_V, dtype=float)
-            final_W_np = np.array(final_W, dtype=float)
-
-            grad_V = (final_V_np - init_V).tolist()
-            grad_W = (final_W_np - init_W).tolist()
-
-            # Save the computed gradients and training error in our local structure.
-            self.models[filename] = Model(
-                V=grad_V,
-                W=grad_W,
-                error_rate=error_rate,
-                status='done'
-            )
-            self.training_status[filename] = 'done'
-            print(f"Computed gradients for {filename} (error rate: {error_rate:.4f})")
+            ip, port = address.rsplit(':', 1)
+            client, transport = self.receivers.connect(ip, int(port))
+        except Exception as e:
+            print(f"Error connecting to callback {address} - {e}")
+            return
 
+        try:
+            client.model_ready(filename, model)
         except Exception as e:
-            print(f"Training failed for {filename}: {str(e)}")
-            self.models[filename] = Model(status='failed')
-            self.training_status[filename] = 'failed'
-            import traceback
-            traceback.print_exc()
+            print(f"Error pushing {filename} to callback {address} - {e}")
+        finally:
+            transport.close()
      
           
     def get_model(self, filename):
@@ -141,14 +418,369 @@ class ComputeNodeHandler:
         if successor != self.node_id:
             return self.forward_to_node(successor, filename, get_model=True)
             
-        model = self.models.get(filename)
         print("Get Model - filename: ", filename, "ID:", hashed_id)
+        return self.local_model("", filename)
+
+
+    def wait_model(self, filename, timeout_ms, compression="", job=""):
+        """Retrieve the job's model for a given filename, waiting up to timeout_ms for training to finish.
 
+        Returns as soon as the model is done or failed, with status 'wait'
+        if it is still training after timeout_ms.
+        """
+        owner = self.find_owner(self.hash_filename(filename))
+        if owner is None:
+            return Model(status='error')
+        if owner != self.node_id:
+            return self.forward_to_node(owner, filename, get_model=True, timeout_ms=timeout_ms,
+                                        compression=compression, job=job)
+
+        self.models.wait(job, filename, timeout_ms / 1000)
+        return self.local_model(job, filename, compression)
+
+
+    def local_model(self, job, filename, compression=""):
+        """Return the job's model of a file owned by this node, or its status."""
+        model = self.models.get(job, filename)
         if not model:
-            status = 'wait' if self.training_status.get(filename) == 'training' else 'not_found'
+            status = 'wait' if self.models.status(job, filename) == 'training' else 'not_found'
             return Model(status=status)
-            
-        return model
+        return self.compress_model(job, filename, model, compression)
+
+
+    def local_status(self, job, filename):
+        """Return the status of the job's file owned by this node as get_model reports it."""
+        status = self.models.status(job, filename)
+        if status == 'training':
+            return 'wait'
+        return status or 'not_found'
+
+
+    def compress_model(self, job, filename, model, compression):
+        """Return the model with its gradients compressed as the receiver asked.
+
+        See tensor_codec.compress for the compression specs. Each stored model
+        is compressed once per spec, so top-k error feedback advances once per
+        trained model however often it is fetched.
+        """
+        if not compression or model.status != 'done' or model.V_tensor is None:
+            return model
+        try:
+            method = tensor_codec.parse_compression(compression)[0]
+        except ValueError as e:
+            print(f"Cannot send {filename}: {e}")
+            return Model(status='error')
+
+        with self.residual_lock:
+            compressed = self.models.get_variant(job, filename, compression, model)
+            if compressed:
+                return compressed
+
+            key = (job, filename, compression)
+            res_V, res_W = self.residuals.get(key, (None, None))
+            V, res_V = tensor_codec.compress(tensor_codec.unpack(model.V_tensor), compression, res_V)
+            W, res_W = tensor_codec.compress(tensor_codec.unpack(model.W_tensor), compression, res_W)
+            if method == 'topk':
+                self.residuals[key] = (res_V, res_W)
+
+            compressed = Model(V_tensor=V, W_tensor=W, error_rate=model.error_rate, status=model.status,
+                               samples=model.samples)
+            return self.models.put_variant(job, filename, compression, model, compressed)
+
+
+    def put_data_batch(self, filenames, callback_address="", compression="", job="", version=0, settings=None):
+        """Route many files for training with one call per owner node.
+
+        Returns the queue status of every file, as submit_data would. If
+        callback_address is given, the owners push the finished models there.
+        The models are kept as part of job, see delete_job. With a version
+        the files train from the job's global model of that version, see
+        publish_model. TrainingSettings override the owners' settings for
+        these files.
+        """
+        if settings and settings.precision and settings.precision not in ML.ML.PRECISION_MODES:
+            print(f"Rejected {len(filenames)} files: unknown precision {settings.precision}")
+            return {f: 'error' for f in filenames}
+        if settings and settings.batch_size and settings.batch_size < 0:
+            print(f"Rejected {len(filenames)} files: batch size {settings.batch_size}")
+            return {f: 'error' for f in filenames}
+
+        statuses = {}
+        for owner, group in self.group_by_owner(filenames).items():
+            if owner is None:
+                statuses.update((f, 'error') for f in group)
+            elif owner == self.node_id:
+                print(f"Starting training for {len(group)} files on node {self.node_id}")
+                for f in group:
+                    if callback_address:
+                        self.models.add_callback(job, f, callback_address, compression)
+                    statuses[f] = self.start_training(f, job=job, version=version, settings=settings)
+            else:
+                forwarded = self.forward_batch(owner, group, callback_address=callback_address,
+                                               compression=compression, job=job, version=version,
+                                               settings=settings)
+                statuses.update(forwarded or {f: 'error' for f in group})
+        return statuses
+
+
+    def get_models(self, filenames, compression="", job=""):
+        """Retrieve the job's models of many files with one call per owner node."""
+        models = {}
+        for owner, group in self.group_by_owner(filenames).items():
+            if owner is None:
+                models.update((f, Model(status='error')) for f in group)
+            elif owner == self.node_id:
+                models.update((f, self.local_model(job, f, compression)) for f in group)
+            else:
+                forwarded = self.forward_batch(owner, group, get_models=True, compression=compression,
+                                               job=job)
+                models.update(forwarded or {f: Model(status='error') for f in group})
+        return models
+
+
+    def get_statuses(self, filenames, job=""):
+        """Return the training status of the job's files with one call per owner node.
+
+        Statuses are those of get_model, without the gradients.
+        """
+        statuses = {}
+        for owner, group in self.group_by_owner(filenames).items():
+            if owner is None:
+                statuses.update((f, 'error') for f in group)
+            elif owner == self.node_id:
+                statuses.update((f, self.local_status(job, f)) for f in group)
+            else:
+                forwarded = self.forward_batch(owner, group, get_statuses=True, job=job)
+                statuses.update(forwarded or {f: 'error' for f in group})
+        return statuses
+
+
+    def get_aggregate(self, job, filenames):
+        """Return the sum of job's finished gradients of the files this node owns among filenames.
+
+        The aggregate counts the summed models and their training samples,
+        and lists the files it includes. Files owned by other nodes, not
+        trained for job or still training are left out, the caller collects
+        them elsewhere. Models of files this node no longer owns are skipped
+        so the new owner's copy is not counted twice, ownership is read from
+        the predecessor without any lookup.
+        """
+        sum_V = None
+        sum_W = None
+        aggregate = Aggregate(count=0, samples=0, filenames=[])
+        for filename in filenames:
+            if not self.owns(self.hash_filename(filename)):
+                continue
+            model = self.models.get(job, filename)
+            if model is None or model.status != 'done' or model.V_tensor is None:
+                continue
+
+            if sum_V is None:
+                sum_V = tensor_codec.unpack(model.V_tensor).astype(float)
+                sum_W = tensor_codec.unpack(model.W_tensor).astype(float)
+            else:
+                sum_V += tensor_codec.unpack(model.V_tensor)
+                sum_W += tensor_codec.unpack(model.W_tensor)
+            aggregate.count += 1
+            aggregate.samples += model.samples or 0
+            aggregate.filenames.append(filename)
+
+        if sum_V is not None:
+            aggregate.V_tensor = tensor_codec.pack(sum_V)
+            aggregate.W_tensor = tensor_codec.pack(sum_W)
+        print(f"Aggregated {aggregate.count} of {len(filenames)} models for job {job}")
+        return aggregate
+
+
+    def reduce_aggregate(self, job, filenames, limit):
+        """Return the sum of the finished gradients among filenames owned by
+        the nodes from this one up to, but not including, the ring id limit.
+
+        The range is split along the finger table, every finger inside it
+        reduces the part from itself to the next farther finger in parallel,
+        so the partial sums meet in a tree about log(nodes) deep. Parts whose
+        node cannot be reached are left out.
+        """
+        children = []
+        end = limit
+        for i in range(self.m - 1, -1, -1):
+            finger = self.finger_table.get(i, {}).get('node')
+            if finger in (None, self.node_id, end) or not self.node_in_interval(self.node_id, finger, end):
+                continue
+            children.append((finger, end))
+            end = finger
+
+        aggregate = self.get_aggregate(job, filenames)
+        if not children:
+            return aggregate
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(children)) as pool:
+            partials = pool.map(lambda child: self.forward_reduce(child[0], job, filenames, child[1]), children)
+            for partial in partials:
+                if partial is not None and partial.count:
+                    aggregate = self.merge_aggregates(aggregate, partial)
+        return aggregate
+
+
+    def all_reduce(self, job, filenames):
+        """Reduce the finished gradients among filenames over the whole ring.
+
+        Returns one Aggregate holding their average, with the number of
+        models averaged and the files they came from.
+        """
+        aggregate = self.reduce_aggregate(job, filenames, self.node_id)
+        if aggregate.count:
+            aggregate.V_tensor = tensor_codec.pack(tensor_codec.unpack(aggregate.V_tensor) / aggregate.count)
+            aggregate.W_tensor = tensor_codec.pack(tensor_codec.unpack(aggregate.W_tensor) / aggregate.count)
+        print(f"Reduced {aggregate.count} of {len(filenames)} models over the ring for job {job}")
+        return aggregate
+
+
+    def merge_aggregates(self, total, partial):
+        """Add the partial aggregate into total, return the result.
+
+        A partial sharing files with total is left out, as its sum cannot be
+        split per file, so no model is averaged twice. Its files stay out of
+        the result's filenames for the caller to collect again.
+        """
+        if not total.count:
+            return partial
+        overlap = set(total.filenames) & set(partial.filenames)
+        if overlap:
+            print(f"Skipping a partial aggregate of {partial.count} models, {len(overlap)} already counted")
+            return total
+        total.V_tensor = tensor_codec.pack(tensor_codec.unpack(total.V_tensor) + tensor_codec.unpack(partial.V_tensor))
+        total.W_tensor = tensor_codec.pack(tensor_codec.unpack(total.W_tensor) + tensor_codec.unpack(partial.W_tensor))
+        total.count += partial.count
+        total.samples += partial.samples
+        total.filenames.extend(partial.filenames)
+        return total
+
+
+    def delete_job(self, job, forward=True):
+        """Delete the stored models and global models of job, return how many models were deleted.
+
+        The top-k residuals of the job's models are dropped with them. With
+        forward, every other node known to the supernode deletes its models
+        of the job too, and their counts are included.
+        """
+        deleted = self.models.delete_job(job)
+        with self.model_lock:
+            self.global_models.pop(job, None)
+        with self.residual_lock:
+            for key in [key for key in self.residuals if key[0] == job]:
+                del self.residuals[key]
+        print(f"Deleted {deleted} models of job {job}")
+        if not forward:
+            return deleted
+
+        self.refresh_node_addresses()
+        with self.address_lock:
+            addresses = [addr for node_id, addr in self.node_addresses.items() if node_id != self.node_id]
+        for addr in addresses:
+            ip, port = addr.split(':')
+            client, transport = self.connect_to_compute_node(ip, int(port))
+            if not client:
+                continue
+            try:
+                deleted += client.delete_job(job, False)
+            except Exception as e:
+                print(f"Error deleting job {job} on {addr}: {e}")
+            finally:
+                transport.close()
+        return deleted
+
+
+    def group_by_owner(self, filenames):
+        """Group filenames by the node that owns them, None if it could not be found.
+
+        Every ring id is resolved once, however many files hash to it.
+        """
+        owners = {}
+        groups = {}
+        for filename in filenames:
+            hashed_id = self.hash_filename(filename)
+            if hashed_id not in owners:
+                owners[hashed_id] = self.find_owner(hashed_id)
+            groups.setdefault(owners[hashed_id], []).append(filename)
+        return groups
+
+
+    def find_owner(self, hashed_id):
+        """Return the node responsible for the ring id, None if it could not be found.
+
+        Ids between the predecessor and this node are answered without a
+        lookup, so batches forwarded to their owner are not routed again.
+        """
+        if self.owns(hashed_id):
+            return self.node_id
+        found = self.find_successor_with_path(hashed_id)
+        return found[0] if found else None
+
+
+    def owns(self, hashed_id):
+        """Return whether the ring id lies between the predecessor and this node."""
+        predecessor = self.predecessor
+        return predecessor is not None and self.node_in_interval(predecessor, hashed_id, self.node_id)
+
+
+    def forward_batch(self, node_id, filenames, get_models=False, callback_address="", compression="", job="",
+                      version=0, get_statuses=False, settings=None):
+        """Forward a batch of files, model or status requests to the specified node, None on error."""
+        addr = self.get_node_address(node_id)
+        if not addr: return None
+
+        ip, port = addr.split(':')
+        client, transport = self.connect_to_compute_node(ip, int(port))
+        if not client: return None
+
+        try:
+            if get_models:
+                return client.get_models(filenames, compression, job)
+            if get_statuses:
+                return client.get_statuses(filenames, job)
+            return client.put_data_batch(filenames, callback_address, compression, job, version, settings)
+        except Exception as e:
+            print(f"Error forwarding batch to node {node_id}: {e}")
+            return None
+        finally:
+            transport.close()
+
+
+    def forward_reduce(self, node_id, job, filenames, limit):
+        """Have the specified node reduce its part of the ring up to limit, None on error."""
+        addr = self.get_node_address(node_id)
+        if not addr: return None
+
+        ip, port = addr.split(':')
+        client, transport = self.connect_to_compute_node(ip, int(port))
+        if not client: return None
+
+        try:
+            return client.reduce_aggregate(job, filenames, limit)
+        except Exception as e:
+            print(f"Error reducing on node {node_id}: {e}")
+            return None
+        finally:
+            transport.close()
+
+
+    def forward_chunk(self, node_id, job, version, origin, index, total, data):
+        """Send a broadcast chunk on to the specified node, False on error."""
+        addr = self.get_node_address(node_id)
+        if not addr: return False
+
+        ip, port = addr.split(':')
+        client, transport = self.connect_to_compute_node(ip, int(port))
+        if not client: return False
+
+        try:
+            return client.broadcast_chunk(job, version, origin, index, total, data)
+        except Exception as e:
+            print(f"Error broadcasting to node {node_id}: {e}")
+            return False
+        finally:
+            transport.close()
 
 
     def find_successor_with_path(self, node_id):
@@ -176,20 +808,31 @@ class ComputeNodeHandler:
                 transport.close()
     
     
-    def forward_to_node(self, node_id, filename, get_model=False):
-        """Forward the file or model request to the specified node."""
+    def forward_to_node(self, node_id, filename, get_model=False, priority=None, deadline_ms=0,
+                        timeout_ms=None, callback_address="", compression="", job=""):
+        """Forward the file or model request to the specified node.
+
+        Files are forwarded with put_data, or with submit_data when a
+        priority is given, which returns the owner's queue status. Model
+        requests with a timeout_ms are forwarded with wait_model.
+        """
+        error = Model(status='error') if get_model else 'error'
         addr = self.get_node_address(node_id)
-        if not addr: return {'status': 'error'}
+        if not addr: return error
         
         ip, port = addr.split(':')
         client, transport = self.connect_to_compute_node(ip, int(port))
-        if not client: return {'status': 'error'}
+        if not client: return error
         
         try:
+            if get_model and timeout_ms is not None:
+                return client.wait_model(filename, timeout_ms, compression, job)
             if get_model:
                 return client.get_model(filename)
-            client.put_data(filename)
-            return {'status': 'forwarded'}
+            if priority is not None:
+                return client.submit_data(filename, priority, deadline_ms)
+            client.put_data(filename, callback_address, compression)
+            return 'forwarded'
         finally:
             transport.close()
 
@@ -251,6 +894,7 @@ class ComputeNodeHandler:
 
     def set_successor(self, node_id):
         self.successor = node_id
+        self.invalidate_node_addresses()
         return True
 
 
@@ -260,6 +904,7 @@ class ComputeNodeHandler:
 
     def set_predecessor(self, node_id):
         self.predecessor = int(node_id)
+        self.invalidate_node_addresses()
         return True
 
 
@@ -332,16 +977,17 @@ class ComputeNodeHandler:
 
 
     def connect_to_compute_node(self, ip, port):
-        """Establish a connection to a compute node at the given IP and port."""
+        """Lease a pooled connection to a compute node at the given IP and port.
+
+        Closing the returned transport hands the connection back to the pool.
+        """
         try:
-            transport = TSocket.TSocket(ip, int(port))
-            transport = TTransport.TBufferedTransport(transport)
-            protocol = TBinaryProtocol.TBinaryProtocol(transport)
-            client = ComputeNodeClient(protocol)
-            transport.open()
-            return client, transport
+            return self.connections.connect(ip, port)
         except Exception as e:
             print(f"Error connecting to compute node {ip}:{port} - {e}")
+            # The node may have left or moved, look it up again next time.
+            self.connections.discard(ip, port)
+            self.invalidate_node_addresses()
             return None, None
 
 
@@ -362,7 +1008,8 @@ class ComputeNodeHandler:
     def find_successor(self, node_id):
         """Find and return the successor for the given node ID in the network."""
         if self.node_id == node_id:
-            return self.successor if self.successor != self.node_id else self.successor
+            # a node is responsible for its own id
+            return self.node_id
             
         predecessor_node_id = self.find_predecessor(node_id)
         if predecessor_node_id == self.node_id:
@@ -450,17 +1097,43 @@ class ComputeNodeHandler:
 
 
     def get_node_address(self, node_id):
-        """Retrieve the compute node address for the given node ID from the supernode."""
+        """Retrieve the compute node address for the given node ID.
+
+        Addresses come from a local cache, which is refilled from the
+        supernode in one call when it does not know the node.
+        """
+        node_id = int(node_id)
+        with self.address_lock:
+            addr = self.node_addresses.get(node_id)
+        if addr:
+            return addr
+
+        self.refresh_node_addresses()
+        with self.address_lock:
+            return self.node_addresses.get(node_id)
+
+
+    def refresh_node_addresses(self):
+        """Replace the address cache with every node address known to the supernode."""
         client, transport = self.connect_to_super_node()
         if not client:
             print("Failed to connect to supernode")
-            return None
+            return
             
         try:
-            return client.get_compute_node_address(int(node_id))
+            addresses = client.get_compute_node_addresses()
         finally:
             transport.close()
 
+        with self.address_lock:
+            self.node_addresses = addresses
+
+
+    def invalidate_node_addresses(self):
+        """Drop the address cache, the next lookup refills it from the supernode."""
+        with self.address_lock:
+            self.node_addresses = {}
+
 
     def update_others(self):
         """Update the finger tables of all other nodes in the network."""
@@ -525,6 +1198,8 @@ class ComputeNodeHandler:
         
         if self.node_in_interval(self.node_id, node_id, current_node) or current_node == self.node_id:
             print(f"Updating finger[{index}] from {current_node} to {node_id}")
+            # A node joined the ring, cached addresses may be stale.
+            self.invalidate_node_addresses()
             self.finger_table[index]['node'] = int(node_id)
             
             # If this is finger[0], update successor
@@ -561,19 +1236,60 @@ class ComputeNodeHandler:
             transport.close()
 
 
-def start_compute_node(port, supernode_ip, supernode_port):
-    handler = ComputeNodeHandler(port, supernode_ip, supernode_port)
+def start_compute_node(port, supernode_ip, supernode_port, precision='float64',
+                       batch_size=None, eta=0.0001, stream_threshold=256 * 2**20, max_stack=8,
+                       workers=None, queue_capacity=1024, queue_order='fifo', model_dir=None,
+                       max_resident=64, job_ttl=0):
+    handler = ComputeNodeHandler(port, supernode_ip, supernode_port, precision,
+                                 batch_size, eta, stream_threshold, max_stack, workers,
+                                 queue_capacity, queue_order, model_dir, max_resident, job_ttl)
     processor = Processor(handler)
     transport = TSocket.TServerSocket(port=port)
     tfactory = TTransport.TBufferedTransportFactory()
     pfactory = TBinaryProtocol.TBinaryProtocolFactory()
     server = TServer.TThreadedServer(processor, transport, tfactory, pfactory)
     print(f"Compute Node {handler.node_id} running on port {port}")
-    server.serve()
+    try:
+        server.serve()
+    finally:
+        # stop the training workers with the node
+        handler.executor.shutdown(wait=False, cancel_futures=True)
+        handler.finisher.shutdown(wait=False, cancel_futures=True)
+        handler.connections.close_all()
+        handler.receivers.close_all()
 
 
 if __name__ == "__main__":
-    port = int(sys.argv[1])
-    supernode_ip = sys.argv[2]
-    supernode_port = int(sys.argv[3])
-    start_compute_node(port, supernode_ip, supernode_port)
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run a compute node")
+    parser.add_argument("port", type=int)
+    parser.add_argument("supernode_ip")
+    parser.add_argument("supernode_port", type=int)
+    parser.add_argument("--precision", choices=sorted(ML.ML.PRECISION_MODES), default='float64',
+                        help="training precision, mixed trains in float32 with float64 master weights")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="train on shuffled mini-batches of this many rows instead of the full shard")
+    parser.add_argument("--eta", type=float, default=0.0001,
+                        help="learning rate applied to the summed gradient")
+    parser.add_argument("--stream-threshold-mb", type=int, default=256,
+                        help="stream shards larger than this in chunks instead of loading them")
+    parser.add_argument("--max-stack", type=int, default=8,
+                        help="train up to this many queued shards together as one stacked model")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="training processes, defaults to the number of CPUs")
+    parser.add_argument("--queue-capacity", type=int, default=1024,
+                        help="queued files before new ones are rejected as saturated")
+    parser.add_argument("--queue-order", choices=JobQueue.ORDERS, default='fifo',
+                        help="order within a priority, edf trains the earliest deadline first")
+    parser.add_argument("--model-dir", default=None,
+                        help="directory the trained models are kept in, defaults to .model_store/<port>")
+    parser.add_argument("--max-resident", type=int, default=64,
+                        help="trained models kept in memory, the rest are read from the model directory")
+    parser.add_argument("--job-ttl", type=float, default=0,
+                        help="delete the models of jobs unused for this many seconds, 0 keeps them")
+    args = parser.parse_args()
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    start_compute_node(args.port, args.supernode_ip, args.supernode_port, args.precision,
+                       args.batch_size, args.eta, args.stream_threshold_mb * 2**20, args.max_stack,
+                       args.workers, args.queue_capacity, args.queue_order,
+                       args.model_dir or os.path.join(".model_store", str(args.port)),
+                       args.max_resident, args.job_ttl)
\ No newline at end of file
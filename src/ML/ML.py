@@ -3,8 +3,11 @@
 
 
 import csv
+import time
 import numpy as np
 
+from . import shard_cache
+
 ##
 ###  Matrix functions
 ##
@@ -23,6 +26,22 @@ def calc_gradient(curr, orig):
     return np.subtract(curr, orig)
 
 
+# Precision modes, name -> (compute dtype, master weights dtype)
+# "mixed" trains in float32 but accumulates the weight updates in float64
+PRECISION_MODES = {
+    'float64': (np.float64, None),
+    'float32': (np.float32, None),
+    'mixed': (np.float32, np.float64),
+}
+
+# Mini-batch training checks for convergence after this many passes,
+# full-batch training waits 25 epochs
+MINIBATCH_MIN_EPOCHS = 3
+
+# Buffers with one row per sample, the rest are shaped like the weights
+ROW_BUFFERS = ('R', 'X', 'XW', 'mask', 'Z', 'O', 'Y', 'RY', 'RYV', 'E')
+
+
 ##
 ###  mlp class
 ##
@@ -35,6 +54,18 @@ class mlp:
     def __init__(self):
         self.initialized = False
         self.momentum = 0.7
+        self.vectorized = True
+        self.cache_dir = shard_cache.CACHE_DIR
+        self.dtype = np.float64
+        self.master_dtype = None
+        self.V_master = None
+        self.W_master = None
+        self.batch_size = None
+        self.shuffle_seed = None
+        self.weight_seed = 1
+        self.batch_workspace = None
+        self.history = None
+        self.streaming = False
 
 
     def is_initialized(self):
@@ -58,15 +89,13 @@ class mlp:
         self.X = X
         self.labels = labels
         self.n, self.d = np.shape(X)
+        self.streaming = False
 
-        # set k and h variables
-        self.k = _k
-        self.h = _h
+        # set k and h variables, randomly fill W and V
+        self.init_random_weights(_k, _h)
 
-        # randomly fill W and V
-        np.random.seed(1)  # seed for reproducability
-        self.V = (np.random.rand(self.h+1, self.k) * 0.02) - 0.01
-        self.W = (np.random.rand(self.d+1, self.h) * 0.02) - 0.01
+        # cache R and the bias column, allocate buffers for training
+        self.init_workspace()
 
         # forward propogate to build Z and Y
         self.forward_propogate(self.X)
@@ -75,6 +104,39 @@ class mlp:
         return self.initialized
 
 
+    # initialize the training model with random weights of dimensions _k and _h
+    # without loading fname, training streams it in chunks of _chunk_rows rows
+    # gives the same result as init_training_random for shards of any size
+    # returns self.initialized, false on error, true on success
+    def init_training_stream(self, fname, _k, _h, _chunk_rows=shard_cache.CHUNK_ROWS):
+
+        # read the first chunk to find d
+        try:
+            X, labels = next(self.read_chunks(fname, _chunk_rows))
+        except:
+            print("Failed to open file %s" % fname)
+            self.initialized = False
+            return self.initialized
+
+        # n is counted by every pass over the data
+        self.X = None
+        self.labels = None
+        self.n = None
+        self.d = np.size(X, 1)
+        self.streaming = True
+        self.stream_fname = fname
+        self.chunk_rows = _chunk_rows
+
+        # set k and h variables, randomly fill W and V
+        self.init_random_weights(_k, _h)
+
+        # allocate buffers for one chunk
+        self.init_stream_workspace()
+
+        self.initialized = True
+        return self.initialized
+
+
     # initialize the training model with input weights matricies
     # returns self.initialized, false on error, true on success
     def init_training_model(self, fname, V, W):
@@ -92,10 +154,14 @@ class mlp:
         self.X = X
         self.labels = labels
         self.n, self.d = np.shape(X)
+        self.streaming = False
 
         # set the model's weights
         self.set_weights(V, W)
 
+        # cache R and the bias column, allocate buffers for training
+        self.init_workspace()
+
         # forward propogation to build Z and Y
         self.forward_propogate(self.X)
 
@@ -110,40 +176,151 @@ class mlp:
         if not(self.initialized):
             return -1
 
+        if self.streaming:
+            return self.train_stream(eta, epochs)
+
+        if self.batch_size and self.vectorized and self.batch_size < self.n:
+            return self.train_minibatch(eta, epochs)
+
         # forwards propogate, initialize Y and Z
+        start = time.perf_counter()
         self.forward_propogate(self.X)
-        err = error_func(self.Y, self.labels)
+        err = self.training_error()
+        self.record_history(start, err)
 
         # get weight updates for momentum
-        old_dV, old_dW = self.backward_propogate(eta)
+        ws = self.workspace
+        old_dV, old_dW = ws['old_dV'], ws['old_dW']
+        dV, dW = self.backward_propogate(eta)
+        np.copyto(old_dV, dV)
+        np.copyto(old_dW, dW)
 
         for i in range(epochs):
             
             # backwards propogate
             dV, dW = self.backward_propogate(eta)
 
-            # update with momentum
-            dV = dV + self.momentum * old_dV
-            dW = dW + self.momentum * old_dW
-
-            # update old weights for momentum
-            old_dV = dV
-            old_dW = dW
+            # update with momentum, old_dV and old_dW become the new updates
+            old_dV *= self.momentum
+            old_dV += dV
+            old_dW *= self.momentum
+            old_dW += dW
             
             # update weights
-            self.update_weights(dV, dW)
+            self.update_weights(old_dV, old_dW)
 
             # forwards propogate
             self.forward_propogate(self.X)
 
             # re-calc error, exit if the difference is too small
-            err_upd = error_func(self.Y, self.labels)
+            err_upd = self.training_error()
+            self.record_history(start, err_upd)
             if(abs(err - err_upd) <= 0.2 and i >= 25):
                 break
             err = err_upd
             
         # return the error rate in predictions
         return error_rate(self.Y, self.labels)
+
+
+    # train the MLP model on shuffled mini-batches of self.batch_size rows
+    # epochs counts passes over the data, momentum carries across batches
+    # returns -1 on error, training error rate on success
+    def train_minibatch(self, eta, epochs):
+
+        if not(self.initialized):
+            return -1
+
+        ws = self.workspace
+        bws = self.init_batch_workspace()
+        rng = np.random.default_rng(self.shuffle_seed)
+
+        # forwards propogate, initialize Y and Z
+        start = time.perf_counter()
+        self.forward_propogate(self.X)
+        err = self.training_error()
+        self.record_history(start, err)
+
+        # momentum starts from rest
+        old_dV, old_dW = ws['old_dV'], ws['old_dW']
+        old_dV.fill(0)
+        old_dW.fill(0)
+
+        for i in range(epochs):
+
+            order = rng.permutation(self.n)
+            for b in range(0, self.n, self.batch_size):
+
+                # forwards and backwards propogate the batch
+                batch = self.gather_batch(bws, order[b:b+self.batch_size])
+                self.forward_kernel(batch)
+                dV, dW = self.backward_kernel(batch, eta)
+
+                # update with momentum
+                old_dV *= self.momentum
+                old_dV += dV
+                old_dW *= self.momentum
+                old_dW += dW
+                self.update_weights(old_dV, old_dW)
+
+            # re-calc error on all the data, exit if the difference is too small
+            self.forward_propogate(self.X)
+            err_upd = self.training_error()
+            self.record_history(start, err_upd)
+            if(abs(err - err_upd) <= 0.2 and i >= MINIBATCH_MIN_EPOCHS):
+                break
+            err = err_upd
+
+        # return the error rate in predictions
+        return error_rate(self.Y, self.labels)
+
+
+    # train the MLP model on a streamed shard, one pass over the data per epoch
+    # gradients are summed over the chunks, so this matches full-batch training
+    # returns -1 on error, training error rate on success
+    def train_stream(self, eta, epochs):
+
+        if not(self.initialized):
+            return -1
+
+        # error and gradients at the initial weights
+        start = time.perf_counter()
+        err, rate, dV, dW = self.stream_pass(eta)
+        self.record_history(start, err, rate)
+
+        # get weight updates for momentum
+        ws = self.workspace
+        old_dV, old_dW = ws['old_dV'], ws['old_dW']
+        np.copyto(old_dV, dV)
+        np.copyto(old_dW, dW)
+
+        for i in range(epochs):
+
+            # update with momentum, dV and dW are from the current weights
+            old_dV *= self.momentum
+            old_dV += dV
+            old_dW *= self.momentum
+            old_dW += dW
+            self.update_weights(old_dV, old_dW)
+
+            # error and gradients at the new weights
+            err_upd, rate, dV, dW = self.stream_pass(eta)
+            self.record_history(start, err_upd, rate)
+            if(abs(err - err_upd) <= 0.2 and i >= 25):
+                break
+            err = err_upd
+
+        # return the error rate in predictions
+        return rate
+
+
+    # append (seconds since start, error, error rate) to self.history
+    # only when history tracking was turned on with set_history
+    def record_history(self, start, err, rate=None):
+        if self.history is not None:
+            if rate is None:
+                rate = error_rate(self.Y, self.labels)
+            self.history.append((time.perf_counter() - start, err, rate))
     
 
     # run the current model on validation data
@@ -186,33 +363,93 @@ class mlp:
 ##
 
 
+    # set k and h, and randomly fill the weights for them
+    def init_random_weights(self, _k, _h):
+        self.k = _k
+        self.h = _h
+
+        # private generator, seeded for reproducability across models
+        rng = np.random.RandomState(self.weight_seed)
+        V = (rng.rand(self.h+1, self.k) * 0.02) - 0.01
+        W = (rng.rand(self.d+1, self.h) * 0.02) - 0.01
+        self.set_weights(V, W)
+
+
     # set the model's weights
     def set_weights(self, V, W):
 
-        # set h and k
-        h, k = np.shape(V)
+        # set h and k, the last two axes also for stacked weights
+        h, k = np.shape(V)[-2:]
         self.h = h - 1
         self.k = k
 
-        # set W and V
-        self.W = W
-        self.V = V
+        # set W and V, copied since training updates them in place
+        self.W = np.array(W, dtype=self.dtype)
+        self.V = np.array(V, dtype=self.dtype)
+
+        # keep full precision copies when training with master weights
+        if self.master_dtype is None:
+            self.W_master = None
+            self.V_master = None
+        else:
+            self.W_master = np.array(W, dtype=self.master_dtype)
+            self.V_master = np.array(V, dtype=self.master_dtype)
 
 
     # get the model's current weights
     def get_weights(self):
-        return self.V, self.W
+        if self.master_dtype is not None:
+            return self.V_master.copy(), self.W_master.copy()
+        return self.V.copy(), self.W.copy()
 
 
-    # update the model's weights
+    # update the model's weights in place
     def update_weights(self, dV, dW):
-        self.V = self.V + dV
-        self.W = self.W + dW
+        if self.master_dtype is None:
+            self.V += dV
+            self.W += dW
+            return
+
+        # accumulate into the master weights, then refresh the compute copies
+        self.V_master += dV
+        self.W_master += dW
+        np.copyto(self.V, self.V_master, casting='same_kind')
+        np.copyto(self.W, self.W_master, casting='same_kind')
+
+    # set the seed of the random initial weights
+    # models averaged together must start from the same weights
+    def set_weight_seed(self, _seed):
+        self.weight_seed = _seed
 
     # set momentum factor
     def set_momentum(self, _momentum):
         self.momentum = _momentum
 
+    # select the vectorized forward pass (default) or the original loops
+    def set_vectorized(self, _vectorized):
+        self.vectorized = _vectorized
+
+    # set the binary shard cache directory, None always parses the csv
+    def set_cache_dir(self, _cache_dir):
+        self.cache_dir = _cache_dir
+
+    # train on mini-batches of _batch_size rows, None trains on the full batch
+    # _seed seeds the shuffling so a shard always sees the same batches
+    def set_batching(self, _batch_size, _seed=None):
+        self.batch_size = _batch_size
+        self.shuffle_seed = _seed
+
+    # record the training error of every epoch in self.history
+    def set_history(self, _enabled):
+        self.history = [] if _enabled else None
+
+    # set the dtype used for training math, and optionally a wider dtype
+    # for master weights that accumulate the updates
+    # call before init_training_*
+    def set_precision(self, _dtype, _master_dtype=None):
+        self.dtype = _dtype
+        self.master_dtype = _master_dtype
+
 
 ##
 ###  Propogation functions
@@ -220,8 +457,169 @@ class mlp:
 ##
 
 
+    # cache the one-hot labels R and the bias-augmented training X
+    # and preallocate the buffers reused by every training epoch
+    # X is stored compactly, it is only upcast here for the matmuls
+    def init_workspace(self):
+        n, d, h, k = self.n, self.d, self.h, self.k
+        dtype = self.dtype
+
+        # momentum terms are accumulated at master precision when set
+        acc_dtype = dtype if self.master_dtype is None else self.master_dtype
+
+        R = np.zeros((n, k), dtype=dtype)
+        for c in range(k):
+            R[:,c] = (self.labels == c)
+
+        Xb = np.ones((n, d+1), dtype=dtype)
+        Xb[:,1:] = self.X
+
+        Z = np.ones((n, h+1), dtype=dtype)
+
+        self.workspace = {
+            'R': R,
+            'X': Xb,
+            'XW': np.zeros((n, h), dtype=dtype),
+            'mask': np.zeros((n, h), dtype=bool),
+            'Z': Z,
+            'O': np.zeros((n, k), dtype=dtype),
+            'Y': np.zeros((n, k), dtype=dtype),
+            'RY': np.zeros((n, k), dtype=dtype),
+            'RYV': np.zeros((n, h), dtype=dtype),
+            'E': np.zeros((n, k), dtype=dtype),
+            'dV': np.zeros((h+1, k), dtype=dtype),
+            'dW': np.zeros((d+1, h), dtype=dtype),
+            'old_dV': np.zeros((h+1, k), dtype=acc_dtype),
+            'old_dW': np.zeros((d+1, h), dtype=acc_dtype),
+        }
+
+
     # forwards propogate, build Z and Y
     def forward_propogate(self, _X):
+        if not(self.vectorized):
+            return self.forward_propogate_loop(_X)
+
+        # training data goes through the preallocated buffers
+        if _X is self.X:
+            return self.forward_propogate_training()
+
+        _n, _d = np.shape(_X)
+
+        _X = np.append(np.ones((_n, 1), dtype=self.dtype), _X, axis=1)
+        Z = ReLU_matrix(np.dot(_X, self.W))
+        self.Z = np.append(np.ones((_n, 1), dtype=self.dtype), Z, axis=1)
+
+        O = np.dot(self.Z, self.V)
+        self.Y = softmax(O)
+
+
+    # allocate the buffers used to stream chunks of self.chunk_rows rows
+    def init_stream_workspace(self):
+        m, d, h, k = self.chunk_rows, self.d, self.h, self.k
+        dtype = self.dtype
+        acc_dtype = dtype if self.master_dtype is None else self.master_dtype
+
+        self.workspace = {
+            'R': np.zeros((m, k), dtype=dtype),
+            'X': np.ones((m, d+1), dtype=dtype),
+            'XW': np.zeros((m, h), dtype=dtype),
+            'mask': np.zeros((m, h), dtype=bool),
+            'Z': np.ones((m, h+1), dtype=dtype),
+            'O': np.zeros((m, k), dtype=dtype),
+            'Y': np.zeros((m, k), dtype=dtype),
+            'RY': np.zeros((m, k), dtype=dtype),
+            'RYV': np.zeros((m, h), dtype=dtype),
+            'E': np.zeros((m, k), dtype=dtype),
+            'dV': np.zeros((h+1, k), dtype=dtype),
+            'dW': np.zeros((d+1, h), dtype=dtype),
+            'sum_dV': np.zeros((h+1, k), dtype=acc_dtype),
+            'sum_dW': np.zeros((d+1, h), dtype=acc_dtype),
+            'old_dV': np.zeros((h+1, k), dtype=acc_dtype),
+            'old_dW': np.zeros((d+1, h), dtype=acc_dtype),
+            'classes': np.arange(k),
+        }
+
+
+    # one pass over the streamed shard at the current weights
+    # returns (error, error rate, dV, dW) with dV and dW summed over the chunks
+    def stream_pass(self, eta):
+        ws = self.workspace
+        sum_dV, sum_dW = ws['sum_dV'], ws['sum_dW']
+        sum_dV.fill(0)
+        sum_dW.fill(0)
+
+        err = 0.0
+        wrong = 0
+        n = 0
+        for X, labels in self.read_chunks(self.stream_fname, self.chunk_rows):
+            m = len(labels)
+            chunk = {name: (buf[:m] if name in ROW_BUFFERS else buf) for name, buf in ws.items()}
+            chunk['X'][:,1:] = X
+            np.equal(labels[:,None], ws['classes'], out=chunk['R'])
+
+            self.forward_kernel(chunk)
+            err += cross_entropy(chunk['Y'], chunk['R'], chunk['E'])
+            wrong += np.count_nonzero(np.argmax(chunk['Y'], axis=1) != labels)
+
+            dV, dW = self.backward_kernel(chunk, eta)
+            sum_dV += dV
+            sum_dW += dW
+            n += m
+
+        self.n = n
+        return err, wrong / n, sum_dV, sum_dW
+
+
+    # allocate the row buffers used for mini-batches of self.batch_size rows
+    # dV and dW are shared with the main workspace
+    def init_batch_workspace(self):
+        m = self.batch_size
+        ws = self.workspace
+        bws = self.batch_workspace
+        if bws is not None and len(bws['X']) == m and bws['X'].dtype == ws['X'].dtype:
+            return bws
+
+        bws = {}
+        for name in ROW_BUFFERS:
+            bws[name] = np.zeros((m,) + ws[name].shape[1:], dtype=ws[name].dtype)
+        bws['Z'][:,0] = 1
+        bws['dV'] = ws['dV']
+        bws['dW'] = ws['dW']
+
+        self.batch_workspace = bws
+        return bws
+
+
+    # copy the training rows into the batch buffers
+    # returns views of the buffers sized to the number of rows
+    def gather_batch(self, bws, rows):
+        m = len(rows)
+        batch = {name: (buf if name in ('dV', 'dW') else buf[:m]) for name, buf in bws.items()}
+        np.take(self.workspace['X'], rows, axis=0, out=batch['X'], mode='clip')
+        np.take(self.workspace['R'], rows, axis=0, out=batch['R'], mode='clip')
+        return batch
+
+
+    # forwards propogate the training data into the workspace buffers
+    def forward_propogate_training(self):
+        ws = self.workspace
+        self.forward_kernel(ws)
+
+        self.Z = ws['Z']
+        self.Y = ws['Y']
+
+
+    # forwards propogate the rows in buffer set ws, X into Z and Y
+    def forward_kernel(self, ws):
+        np.dot(ws['X'], self.W, out=ws['XW'])
+        ws['Z'][:,1:] = ReLU_matrix(ws['XW'])
+        np.dot(ws['Z'], self.V, out=ws['O'])
+        softmax(ws['O'], out=ws['Y'])
+
+
+    # forwards propogate one element at a time, build Z and Y
+    # reference implementation for forward_propogate
+    def forward_propogate_loop(self, _X):
         _n, _d = np.shape(_X)
 
         _X = np.append(np.ones((_n, 1)), _X, axis=1)
@@ -237,7 +635,44 @@ class mlp:
     
 
     # backwards propogate, Return dV and dW
+    # the returned arrays are workspace buffers, overwritten on the next call
     def backward_propogate(self, eta):
+        if not(self.vectorized):
+            return self.backward_propogate_loop(eta)
+
+        return self.backward_kernel(self.workspace, eta)
+
+
+    # backwards propogate the rows in buffer set ws, Return dV and dW
+    # X*W, Z and Y come from the last forward_kernel on the same buffers
+    def backward_kernel(self, ws, eta):
+
+        # dV = eta * Z' * (R - Y)
+        RY = np.subtract(ws['R'], ws['Y'], out=ws['RY'])
+        np.dot(ws['Z'].T, RY, out=ws['dV'])
+        ws['dV'] *= eta
+
+        # dW = eta * X' * (((R - Y) * V(2:end,:)') .* (X*W >= 0))
+        np.dot(RY, self.V[1:,:].T, out=ws['RYV'])
+        np.greater_equal(ws['XW'], 0, out=ws['mask'])
+        ws['RYV'] *= ws['mask']
+        np.dot(ws['X'].T, ws['RYV'], out=ws['dW'])
+        ws['dW'] *= eta
+
+        return ws['dV'], ws['dW']
+
+
+    # cross entropy error of the current predictions on the training data
+    def training_error(self):
+        if not(self.vectorized):
+            return error_func(self.Y, self.labels)
+
+        return cross_entropy(self.Y, self.workspace['R'], self.workspace['E'])
+
+
+    # backwards propogate with freshly built R and X, Return dV and dW
+    # reference implementation for backward_propogate
+    def backward_propogate_loop(self, eta):
         R = np.zeros((self.n, self.k))
         for k in range(self.k):
             R[:,k] = (self.labels == k)
@@ -255,8 +690,29 @@ class mlp:
         return dV, dW
 
 
-    # read data
+    # iterate over fname in chunks of chunk_rows samples
+    # yields X, labels
+    def read_chunks(self, fname, chunk_rows):
+        return shard_cache.iter_chunks(fname, chunk_rows, self.cache_dir)
+
+
+    # read data, through the binary shard cache when enabled
     def read_data(self, fname):
+        if self.cache_dir is None:
+            return self.read_data_csv(fname)
+
+        X = []
+        labels = []
+        try:
+            X, labels = shard_cache.load(fname, self.cache_dir)
+        except:
+            print("Failed to open file %s" % fname)
+
+        return X, labels
+
+
+    # read data straight from the csv file
+    def read_data_csv(self, fname):
         X = []
         labels = []
         try:
@@ -265,8 +721,8 @@ class mlp:
             for line in data:
                 labels.append(int(line[-1]))
                 X.append([int(item) for item in line[:-1]])
-            X = np.array(X)
-            labels = np.array(labels)
+            X = shard_cache.compact(np.array(X))
+            labels = shard_cache.compact(np.array(labels))
         except:
             print("Failed to open file %s" % fname)
 
@@ -286,6 +742,31 @@ def ReLU(x):
     return x
 
 
+# ReLU activation applied to a whole matrix at once
+# matches ReLU above, which returns x on both branches
+def ReLU_matrix(M):
+    return M
+
+
+# Row-wise softmax of O, shifted by the row max for numerical stability
+# equivalent to Y[t,i] = 1/sum(exp(O[t,:] - O[t,i]))
+# writes into out when given, so training can reuse its buffer
+def softmax(O, out=None):
+    Y = np.subtract(O, np.max(O, axis=1, keepdims=True), out=out)
+    np.exp(Y, out=Y)
+    Y /= np.sum(Y, axis=1, keepdims=True)
+    return Y
+
+
+# Calculate current error of predictions Y against one-hot labels R
+# E is a buffer shaped like Y
+def cross_entropy(Y, R, E):
+    np.add(Y, 0.000001, out=E)
+    np.log(E, out=E)
+    E *= R
+    return -np.sum(E)
+
+
 # Calculate current error of predictions
 def error_func(Y, labels):
     _n, _k = np.shape(Y)
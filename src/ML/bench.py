@@ -0,0 +1,106 @@
+##  Benchmarks comparing the mlp training modes on one shard
+##  usage: python -m ML.bench <command> <shard> <validation_file>
+
+
+import sys
+import time
+
+from .ML import mlp, PRECISION_MODES
+
+
+# hyperparameters used by the compute nodes
+K = 26
+H = 20
+ETA = 0.0001
+EPOCHS = 250
+
+# batch sizes compared against full-batch training, and their learning rate
+# eta scales a summed gradient, smaller batches take proportionally smaller steps
+BATCH_SIZES = (32, 64, 128)
+MINIBATCH_ETA = 0.0004
+
+# training error rates timed by the minibatch command
+TARGETS = (0.5, 0.4, 0.3)
+
+
+# train a fresh model on shard after configure(model) has set it up
+# returns (training error rate, validation error rate, training seconds)
+def run(shard, validation, configure, eta=ETA):
+    model, train_err, elapsed = train(shard, configure, eta)
+    return train_err, model.validate(validation), elapsed
+
+
+# train a fresh model on shard after configure(model) has set it up
+# returns (model, training error rate, training seconds)
+def train(shard, configure, eta=ETA):
+    model = mlp()
+    configure(model)
+    if not model.init_training_random(shard, K, H):
+        raise ValueError("Could not load %s" % shard)
+
+    start = time.perf_counter()
+    train_err = model.train(eta, EPOCHS)
+    return model, train_err, time.perf_counter() - start
+
+
+# first (epoch, seconds) in a training history with error rate <= target
+# returns None if the target was never reached
+def time_to_target(history, target):
+    for epoch, (seconds, err, rate) in enumerate(history):
+        if rate <= target:
+            return epoch, seconds
+    return None
+
+
+##
+###  Commands
+##
+
+
+# validation error of every precision mode, and its delta against float64
+def bench_precision(shard, validation):
+    base_err = None
+    for name, (dtype, master_dtype) in PRECISION_MODES.items():
+        train_err, val_err, elapsed = run(
+            shard, validation, lambda model: model.set_precision(dtype, master_dtype))
+        if base_err is None:
+            base_err = val_err
+        print("%-8s train %.4f  validate %.4f  delta %+.4f  %.3fs"
+              % (name, train_err, val_err, val_err - base_err, elapsed))
+
+
+# passes and time for mini-batch and full-batch training to reach each
+# of the TARGETS training error rates
+def bench_minibatch(shard, validation):
+    def configure(batch_size):
+        def apply(model):
+            model.set_batching(batch_size, 1)
+            model.set_history(True)
+        return apply
+
+    for batch_size in (None,) + BATCH_SIZES:
+        eta = ETA if batch_size is None else MINIBATCH_ETA
+        model, train_err, elapsed = train(shard, configure(batch_size), eta)
+
+        reached = []
+        for target in TARGETS:
+            hit = time_to_target(model.history, target)
+            reached.append("%.2f: %s" % (target, "-" if hit is None else "%d/%.3fs" % hit))
+
+        print("%-5s eta %.4f  %s  final %.4f after %d passes %.3fs  validate %.4f"
+              % (batch_size or "full", eta, "  ".join(reached), train_err,
+                 len(model.history) - 1, elapsed, model.validate(validation)))
+
+
+COMMANDS = {
+    'precision': bench_precision,
+    'minibatch': bench_minibatch,
+}
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] not in COMMANDS:
+        print("Usage: python -m ML.bench <%s> <shard> <validation_file>" % "|".join(COMMANDS))
+        sys.exit(1)
+
+    COMMANDS[sys.argv[1]](sys.argv[2], sys.argv[3])
@@ -0,0 +1,237 @@
+##  Binary cache for letter shards
+##  each csv shard is parsed once and stored as a .npy file, later reads
+##  memory-map the cached array instead of parsing the text again
+
+
+import hashlib
+import itertools
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+# directory holding the cached shards, relative to the working directory
+CACHE_DIR = ".shard_cache"
+
+# bytes of loaded shards kept in memory by this process
+MAX_RESIDENT_BYTES = 64 * 2**20
+
+# rows parsed at a time when streaming a shard
+CHUNK_ROWS = 65536
+
+# bumped whenever the layout of cached arrays changes
+CACHE_VERSION = 2
+
+_resident = OrderedDict()
+_resident_bytes = 0
+_resident_lock = threading.Lock()
+
+
+##
+###  Cache keys
+##
+
+
+# the cache key of fname: its absolute path plus mtime and size
+# returns (prefix, key), every version of a file shares the same prefix
+def cache_key(fname):
+    st = os.stat(fname)
+    prefix = hashlib.sha1(os.path.abspath(fname).encode()).hexdigest()
+    return prefix, "%s-%d-%d-v%d" % (prefix, st.st_mtime_ns, st.st_size, CACHE_VERSION)
+
+
+##
+###  Reading shards
+##
+
+
+# parse a csv shard, one sample per line with the label in the last column
+# returns a single (n, d+1) array of samples and labels
+def parse_csv(fname):
+    data = np.loadtxt(fname, delimiter=',', dtype=np.int64, ndmin=2)
+    if np.size(data) < 1 or np.size(data, 1) < 2:
+        raise ValueError("No samples in %s" % fname)
+    return compact(data)
+
+
+# parse a csv shard chunk_rows lines at a time
+# yields (n, d+1) arrays of samples and labels, never holding the whole file
+def parse_csv_chunks(fname, chunk_rows=CHUNK_ROWS):
+    with open(fname, 'r') as file:
+        while True:
+            lines = list(itertools.islice(file, chunk_rows))
+            if not lines:
+                return
+            data = np.loadtxt(lines, delimiter=',', dtype=np.int64, ndmin=2)
+            if np.size(data) > 0:
+                yield data
+
+
+# store small non-negative integers as uint8, 8x smaller than int64
+# arrays with values outside 0-255 are returned unchanged
+def compact(a):
+    if np.size(a) > 0 and np.min(a) >= 0 and np.max(a) <= 255:
+        return a.astype(np.uint8)
+    return a
+
+
+# split a (n, d+1) shard array into X and labels
+def split(data):
+    return data[:,:-1], data[:,-1]
+
+
+# load the shard fname, from memory, the binary cache or the csv file
+# returns X, labels
+def load(fname, cache_dir=CACHE_DIR):
+    global _resident_bytes
+    prefix, key = cache_key(fname)
+
+    with _resident_lock:
+        if key in _resident:
+            _resident.move_to_end(key)
+            return split(_resident[key])
+
+    path = os.path.join(cache_dir, key + ".npy")
+    try:
+        data = np.load(path, mmap_mode='r')
+    except (OSError, ValueError):
+        data = parse_csv(fname)
+        store(data, cache_dir, prefix, key)
+
+    with _resident_lock:
+        if key not in _resident:
+            _resident[key] = data
+            _resident_bytes += data.nbytes
+        while _resident_bytes > MAX_RESIDENT_BYTES and len(_resident) > 1:
+            _, evicted = _resident.popitem(last=False)
+            _resident_bytes -= evicted.nbytes
+
+    return split(data)
+
+
+# iterate over the shard fname in chunks of chunk_rows samples
+# the shard is memory-mapped from the cache, which is built without loading
+# the whole file, or parsed chunk by chunk when cache_dir is None
+# yields X, labels
+def iter_chunks(fname, chunk_rows=CHUNK_ROWS, cache_dir=CACHE_DIR):
+    if cache_dir is None:
+        for data in parse_csv_chunks(fname, chunk_rows):
+            yield split(data)
+        return
+
+    prefix, key = cache_key(fname)
+    path = os.path.join(cache_dir, key + ".npy")
+    if not os.path.exists(path):
+        store_chunks(fname, cache_dir, prefix, key, chunk_rows)
+    data = np.load(path, mmap_mode='r')
+
+    for start in range(0, len(data), chunk_rows):
+        yield split(data[start:start+chunk_rows])
+
+
+##
+###  Writing shards
+##
+
+
+# write data under key and remove cached versions of the same file
+# failures only cost the cache, the parsed data is still returned by load
+def store(data, cache_dir, prefix, key):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = temp_path(cache_dir, key)
+        with open(tmp_path, 'wb') as file:
+            np.save(file, data)
+        publish(tmp_path, cache_dir, prefix, key)
+    except OSError as e:
+        print("Failed to cache shard %s - %s" % (key, e))
+
+
+# write the csv shard fname under key one chunk at a time
+# the cached array is uint8 unless a value does not fit, then int64
+def store_chunks(fname, cache_dir, prefix, key, chunk_rows=CHUNK_ROWS):
+    rows = 0
+    cols = 0
+    with open(fname, 'r') as file:
+        for line in file:
+            if line.strip():
+                rows += 1
+                cols = cols or line.count(',') + 1
+    if rows < 1 or cols < 2:
+        raise ValueError("No samples in %s" % fname)
+
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = temp_path(cache_dir, key)
+    for dtype in (np.uint8, np.int64):
+        out = np.lib.format.open_memmap(tmp_path, mode='w+', dtype=dtype, shape=(rows, cols))
+        start = 0
+        for data in parse_csv_chunks(fname, chunk_rows):
+            if dtype == np.uint8 and compact(data).dtype != np.uint8:
+                break
+            out[start:start+len(data)] = data
+            start += len(data)
+        else:
+            out.flush()
+            del out
+            publish(tmp_path, cache_dir, prefix, key)
+            return
+        del out
+
+    raise ValueError("Could not cache %s" % fname)
+
+
+# a temporary file name for writing key in cache_dir
+def temp_path(cache_dir, key):
+    return os.path.join(cache_dir, "%s.npy.%d.tmp" % (key, os.getpid()))
+
+
+# move a written cache file into place under key
+# and remove older cached versions of the same file, temp files other
+# processes are still writing are left alone
+def publish(tmp_path, cache_dir, prefix, key):
+    os.replace(tmp_path, os.path.join(cache_dir, key + ".npy"))
+
+    for entry in os.listdir(cache_dir):
+        if entry.startswith(prefix) and entry.endswith(".npy") and entry != key + ".npy":
+            try:
+                os.remove(os.path.join(cache_dir, entry))
+            except FileNotFoundError:
+                pass
+
+
+# parse every shard under paths (files or directories) into the cache
+# returns the number of shards converted
+def convert(paths, cache_dir=CACHE_DIR):
+    fnames = []
+    for path in paths:
+        if os.path.isdir(path):
+            fnames += [os.path.join(path, entry) for entry in sorted(os.listdir(path))]
+        else:
+            fnames.append(path)
+
+    converted = 0
+    for fname in fnames:
+        if not os.path.isfile(fname):
+            continue
+        try:
+            prefix, key = cache_key(fname)
+            if os.path.exists(os.path.join(cache_dir, key + ".npy")):
+                continue
+            store_chunks(fname, cache_dir, prefix, key)
+            converted += 1
+        except (OSError, ValueError) as e:
+            print("Skipping %s - %s" % (fname, e))
+
+    return converted
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python -m ML.shard_cache <file_or_dir> [<file_or_dir> ...]")
+        sys.exit(1)
+
+    converted = convert(sys.argv[1:])
+    print("Cached %d shard(s) in %s" % (converted, CACHE_DIR))
@@ -0,0 +1,257 @@
+##  Stacked training of many shards with the same architecture
+##  the shards' matrices share a leading shard axis, so each epoch runs a
+##  few batched matmuls for all of them instead of one mlp.train per shard
+
+
+import numpy as np
+
+from .ML import mlp, cross_entropy, ReLU_matrix
+
+
+##
+###  stacked_mlp class
+##
+
+
+class stacked_mlp(mlp):
+
+    # initialize the model, reads data and sets options like mlp
+    def __init__(self):
+        mlp.__init__(self)
+        self.fnames = []
+        self.failed = []
+
+
+    # initialize training for every shard in fnames with the random weights
+    # mlp.init_training_random would use for dimensions _k and _h
+    # shards that cannot be read, or whose d differs from the first shard,
+    # are listed in self.failed and left out
+    # returns self.initialized, true if any shard was loaded
+    def init_training_random(self, fnames, _k, _h):
+        if not(self.load_shards(fnames)):
+            return self.initialized
+
+        # every shard starts from the same weights
+        self.init_random_weights(_k, _h)
+        self.init_workspace()
+        self.forward_propogate_training()
+
+        self.initialized = True
+        return self.initialized
+
+
+    # initialize training for every shard in fnames with input weights
+    # V and W are shared by all shards or stacked with one entry per shard
+    # returns self.initialized, true if any shard was loaded
+    def init_training_model(self, fnames, V, W):
+        if not(self.load_shards(fnames)):
+            return self.initialized
+
+        self.set_weights(V, W)
+        self.init_workspace()
+        self.forward_propogate_training()
+
+        self.initialized = True
+        return self.initialized
+
+
+    # train every shard like mlp.train, each with its own early stop
+    # returns -1 on error, list of training error rates, one per shard
+    def train(self, eta, epochs):
+
+        if not(self.initialized):
+            return -1
+
+        ws = self.workspace
+
+        # forwards propogate, initialize Y and Z
+        self.forward_propogate_training()
+        err = self.training_error()
+
+        # get weight updates for momentum
+        old_dV, old_dW = ws['old_dV'], ws['old_dW']
+        dV, dW = self.backward_propogate(eta)
+        np.copyto(old_dV, dV)
+        np.copyto(old_dW, dW)
+
+        # shards still training, stopped shards keep their weights
+        active = np.ones(self.S, dtype=bool)
+
+        for i in range(epochs):
+
+            # backwards propogate
+            dV, dW = self.backward_propogate(eta)
+
+            # update with momentum, only for active shards
+            old_dV *= self.momentum
+            old_dV += dV
+            old_dW *= self.momentum
+            old_dW += dW
+            old_dV *= active[:,None,None]
+            old_dW *= active[:,None,None]
+            self.update_weights(old_dV, old_dW)
+
+            # forwards propogate
+            self.forward_propogate_training()
+
+            # re-calc error, stop shards whose difference is too small
+            err_upd = self.training_error()
+            if i >= 25:
+                active &= np.abs(err - err_upd) > 0.2
+                if not(active.any()):
+                    break
+            err = err_upd
+
+        # return the error rate in predictions of every shard
+        return list(self.error_rates())
+
+
+    # the weights of the shard at index s
+    def get_shard_weights(self, s):
+        V, W = self.get_weights()
+        return V[s], W[s]
+
+
+##
+###  Weights functions
+##
+
+
+    # set the weights of every shard
+    # V and W are shared by all shards or stacked with one entry per shard
+    def set_weights(self, V, W):
+        V = np.asarray(V, dtype=float)
+        W = np.asarray(W, dtype=float)
+        if V.ndim == 2:
+            V = np.broadcast_to(V, (self.S,) + V.shape)
+            W = np.broadcast_to(W, (self.S,) + W.shape)
+        mlp.set_weights(self, V, W)
+
+
+##
+###  Propogation functions
+##
+
+
+    # read every shard and pad them to the same number of rows
+    # returns true if any shard was loaded
+    def load_shards(self, fnames):
+        self.initialized = False
+        self.fnames = []
+        self.failed = []
+
+        shards = []
+        for fname in fnames:
+            X, labels = self.read_data(fname)
+            if np.size(labels) < 1 or (shards and np.size(X, 1) != np.size(shards[0][0], 1)):
+                self.failed.append(fname)
+                continue
+            self.fnames.append(fname)
+            shards.append((X, labels))
+
+        if not(shards):
+            return False
+
+        self.S = len(shards)
+        self.d = np.size(shards[0][0], 1)
+        self.n = max(len(labels) for X, labels in shards)
+        self.shards = shards
+        self.streaming = False
+        return True
+
+
+    # cache the one-hot labels R and the bias-augmented X of every shard
+    # padded rows have zero X, R and row mask so they add nothing to training
+    def init_workspace(self):
+        S, n, d, h, k = self.S, self.n, self.d, self.h, self.k
+        dtype = self.dtype
+        acc_dtype = dtype if self.master_dtype is None else self.master_dtype
+
+        R = np.zeros((S, n, k), dtype=dtype)
+        Xb = np.zeros((S, n, d+1), dtype=dtype)
+        rows = np.zeros((S, n, 1), dtype=dtype)
+        labels = np.full((S, n), -1)
+        for s, (X, shard_labels) in enumerate(self.shards):
+            m = len(shard_labels)
+            for c in range(k):
+                R[s,:m,c] = (shard_labels == c)
+            Xb[s,:m,0] = 1
+            Xb[s,:m,1:] = X
+            rows[s,:m] = 1
+            labels[s,:m] = shard_labels
+
+        self.counts = np.array([len(shard_labels) for X, shard_labels in self.shards])
+        self.padded = bool(np.any(self.counts < n))
+        self.labels = labels
+        self.shards = None
+
+        self.workspace = {
+            'R': R,
+            'X': Xb,
+            'rows': rows,
+            'XW': np.zeros((S, n, h), dtype=dtype),
+            'mask': np.zeros((S, n, h), dtype=bool),
+            'Z': np.ones((S, n, h+1), dtype=dtype),
+            'O': np.zeros((S, n, k), dtype=dtype),
+            'Y': np.zeros((S, n, k), dtype=dtype),
+            'RY': np.zeros((S, n, k), dtype=dtype),
+            'RYV': np.zeros((S, n, h), dtype=dtype),
+            'E': np.zeros((S, n, k), dtype=dtype),
+            'dV': np.zeros((S, h+1, k), dtype=dtype),
+            'dW': np.zeros((S, d+1, h), dtype=dtype),
+            'old_dV': np.zeros((S, h+1, k), dtype=acc_dtype),
+            'old_dW': np.zeros((S, d+1, h), dtype=acc_dtype),
+        }
+
+
+    # forwards propogate every shard into the workspace buffers
+    def forward_propogate_training(self):
+        ws = self.workspace
+
+        np.matmul(ws['X'], self.W, out=ws['XW'])
+        ws['Z'][:,:,1:] = ReLU_matrix(ws['XW'])
+        np.matmul(ws['Z'], self.V, out=ws['O'])
+
+        # row-wise softmax
+        Y = np.subtract(ws['O'], np.max(ws['O'], axis=2, keepdims=True), out=ws['Y'])
+        np.exp(Y, out=Y)
+        Y /= np.sum(Y, axis=2, keepdims=True)
+
+        self.Z = ws['Z']
+        self.Y = ws['Y']
+
+
+    # backwards propogate every shard, Return stacked dV and dW
+    # the returned arrays are workspace buffers, overwritten on the next call
+    def backward_propogate(self, eta):
+        ws = self.workspace
+
+        # dV = eta * Z' * (R - Y), with padded rows zeroed
+        RY = np.subtract(ws['R'], ws['Y'], out=ws['RY'])
+        if self.padded:
+            RY *= ws['rows']
+        np.matmul(ws['Z'].transpose(0, 2, 1), RY, out=ws['dV'])
+        ws['dV'] *= eta
+
+        # dW = eta * X' * (((R - Y) * V(2:end,:)') .* (X*W >= 0))
+        np.matmul(RY, self.V[:,1:,:].transpose(0, 2, 1), out=ws['RYV'])
+        np.greater_equal(ws['XW'], 0, out=ws['mask'])
+        ws['RYV'] *= ws['mask']
+        np.matmul(ws['X'].transpose(0, 2, 1), ws['RYV'], out=ws['dW'])
+        ws['dW'] *= eta
+
+        return ws['dV'], ws['dW']
+
+
+    # cross entropy error of every shard's predictions, padded rows add 0
+    def training_error(self):
+        ws = self.workspace
+        cross_entropy(ws['Y'], ws['R'], ws['E'])
+        return -np.sum(ws['E'], axis=(1, 2))
+
+
+    # the fraction of wrongly classified samples in every shard
+    def error_rates(self):
+        wrong = np.not_equal(np.argmax(self.workspace['Y'], axis=2), self.labels)
+        wrong &= self.labels >= 0
+        return np.sum(wrong, axis=1) / self.counts
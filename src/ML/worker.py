@@ -0,0 +1,188 @@
+##  Training tasks run in the compute nodes' worker processes
+##  every task builds its own models and returns plain arrays, so tasks
+##  can run in parallel and their results can be pickled back to the node
+
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from . import shard_cache
+from .ML import mlp, PRECISION_MODES
+from .stacked import stacked_mlp
+
+
+# settings of a training task, the compute node overrides them per node
+DEFAULT_CONFIG = {
+    'k': 26,
+    'h': 20,
+    'eta': 0.0001,
+    'epochs': 250,
+    'precision': 'float64',
+    'batch_size': None,
+    'stream_threshold': 256 * 2**20,
+}
+
+
+# content hashes of shard versions kept in memory by this process
+MAX_CONTENT_HASHES = 4096
+
+
+# content hashes of the shards, by shard cache key, least recently used first
+_content_hashes = OrderedDict()
+_content_hashes_lock = threading.Lock()
+
+
+# the seed used to shuffle the mini-batches of a shard
+def shard_seed(filepath):
+    return int(hashlib.sha1(os.path.basename(filepath).encode()).hexdigest(), 16) % (2 ** 32)
+
+
+# whether the shard can be trained in a stack with others under config
+def is_stackable(filepath, config):
+    return (not config['batch_size'] and os.path.exists(filepath)
+            and os.path.getsize(filepath) <= config['stream_threshold'])
+
+
+# the content hash of a shard, computed once per version of the file
+# while it is among the MAX_CONTENT_HASHES most recently hashed
+def content_hash(filepath):
+    _, key = shard_cache.cache_key(filepath)
+    with _content_hashes_lock:
+        if key in _content_hashes:
+            _content_hashes.move_to_end(key)
+            return _content_hashes[key]
+
+    digest = hashlib.sha256()
+    with open(filepath, 'rb') as file:
+        for block in iter(lambda: file.read(2**20), b''):
+            digest.update(block)
+
+    with _content_hashes_lock:
+        _content_hashes[key] = digest.hexdigest()
+        _content_hashes.move_to_end(key)
+        while len(_content_hashes) > MAX_CONTENT_HASHES:
+            _content_hashes.popitem(last=False)
+    return digest.hexdigest()
+
+
+# the key of the result of training the shard under config from init
+# training is deterministic, so shards with the same content, initial weights
+# and config give the same result, mini-batches also shuffle by the shard's
+# name so its seed is part of the key then
+# returns None if the shard cannot be read
+def training_key(filepath, config, init=None):
+    try:
+        digest = hashlib.sha256(content_hash(filepath).encode())
+    except OSError:
+        return None
+    if init is None:
+        digest.update(b"random-init-%d" % mlp().weight_seed)
+    else:
+        for weights in init:
+            weights = np.asarray(weights, dtype=float)
+            digest.update(repr(weights.shape).encode())
+            digest.update(weights.tobytes())
+    if config['batch_size']:
+        digest.update(b"shuffle-seed-%d" % shard_seed(filepath))
+    digest.update(json.dumps(config, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+# train a model on one shard, from the (V, W) weights init or a fresh random init
+# returns (error rate, grad_V, grad_W, samples), gradients are final - initial weights
+def train_shard(filepath, config, init=None):
+    if not os.path.exists(filepath):
+        raise FileNotFoundError("Training file %s not found" % filepath)
+
+    model = mlp()
+    model.set_precision(*PRECISION_MODES[config['precision']])
+    model.set_batching(config['batch_size'], shard_seed(filepath))
+    if os.path.getsize(filepath) > config['stream_threshold']:
+        print("Streaming %s in chunks" % filepath)
+        loaded = model.init_training_stream(filepath, config['k'], config['h'])
+        if loaded and init is not None:
+            model.set_weights(*init)
+    elif init is not None:
+        loaded = model.init_training_model(filepath, *init)
+    else:
+        loaded = model.init_training_random(filepath, config['k'], config['h'])
+    if not loaded:
+        raise ValueError("Could not load training file %s" % filepath)
+
+    init_V, init_W = model.get_weights()
+    error_rate = model.train(config['eta'], config['epochs'])
+    final_V, final_W = model.get_weights()
+
+    return error_rate, gradient(final_V, init_V), gradient(final_W, init_W), model.n
+
+
+# train several shards at once as one stacked model, all from init if given
+# returns {filepath: (error rate, grad_V, grad_W, samples) or error message}
+def train_stacked(filepaths, config, init=None):
+    model = stacked_mlp()
+    model.set_precision(*PRECISION_MODES[config['precision']])
+    if init is not None:
+        model.init_training_model(filepaths, *init)
+    else:
+        model.init_training_random(filepaths, config['k'], config['h'])
+
+    results = {}
+    for filepath in model.failed:
+        results[filepath] = "Could not load training file %s" % filepath
+    if not model.fnames:
+        return results
+
+    init_V, init_W = model.get_weights()
+    error_rates = model.train(config['eta'], config['epochs'])
+    final_V, final_W = model.get_weights()
+
+    for s, filepath in enumerate(model.fnames):
+        results[filepath] = (error_rates[s], gradient(final_V[s], init_V[s]),
+                             gradient(final_W[s], init_W[s]), int(model.counts[s]))
+    return results
+
+
+# train a group of shards, stacking the ones that can be stacked
+# every shard starts from the (V, W) weights init, or a fresh random init
+# a failing shard does not fail the rest of the group
+# returns {filepath: (error rate, grad_V, grad_W, samples) or error message}
+def train_group(filepaths, config, init=None):
+    stackable = [f for f in filepaths if is_stackable(f, config)]
+    if len(stackable) < 2:
+        stackable = []
+
+    results = {}
+    if stackable:
+        try:
+            results.update(train_stacked(stackable, config, init))
+        except Exception as e:
+            results.update((f, str(e)) for f in stackable)
+
+    for filepath in filepaths:
+        if filepath in stackable:
+            continue
+        try:
+            results[filepath] = train_shard(filepath, config, init)
+        except Exception as e:
+            results[filepath] = str(e)
+
+    return results
+
+
+# train several groups of shards in turn, each group from its own initial weights
+# and with its own settings
+# groups is a list of (filepaths, init, config), as for train_group, a shard
+# may be in several groups
+# returns the results of train_group for every group, in order
+def train_groups(groups):
+    return [train_group(filepaths, config, init) for filepaths, init, config in groups]
+
+
+# the change from initial to final weights, as float64
+def gradient(final, initial):
+    return np.asarray(final, dtype=float) - np.asarray(initial, dtype=float)
@@ -94,6 +94,13 @@ class SupernodeHandler:
         node_info = self.active_nodes[node_id]
         return f"{node_info[0]}:{node_info[1]}"
 
+
+    def get_compute_node_addresses(self):
+        
+        """Returns the address of every known node, for the nodes' address caches."""
+        return {node_id: f"{node_info[0]}:{node_info[1]}"
+                for node_id, node_info in list(self.active_nodes.items())}
+
 # Set up the Supernode server
 handler = SupernodeHandler()
 processor = Processor(handler)
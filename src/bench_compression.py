@@ -0,0 +1,68 @@
+import os
+import sys
+import time
+import numpy as np
+sys.path.append("gen-py")
+from thrift.transport import TTransport
+from thrift.protocol import TBinaryProtocol
+from compute_node.ComputeNode import Model
+from ML.ML import mlp
+import ML.worker
+import tensor_codec
+from client import average_models
+
+# Compression specs compared against uncompressed gradients.
+SPECS = ("", "zlib", "float16", "float16+zlib", "int8", "int8+zlib",
+         "topk:0.1", "topk:0.1+zlib", "topk:0.01+zlib")
+
+
+def train_gradients(filepaths):
+    """Train every shard like the compute nodes do, return (filepath, grad_V, grad_W) tuples."""
+    results = ML.worker.train_stacked(filepaths, ML.worker.DEFAULT_CONFIG)
+    return [(f, r[1], r[2]) for f, r in results.items() if not isinstance(r, str)]
+
+
+def wire_size(model):
+    """Return the bytes a Model takes on the wire with the binary protocol."""
+    buffer = TTransport.TMemoryBuffer()
+    model.write(TBinaryProtocol.TBinaryProtocol(buffer))
+    return len(buffer.getvalue())
+
+
+def validate(models, validation):
+    """Validation error of the models aggregated the way client.py does."""
+    avg_V, avg_W = average_models(models)
+    final_model = mlp()
+    final_model.init_training_model(validation, np.multiply(avg_V, 0.1), avg_W)
+    return final_model.validate(validation)
+
+
+def bench(shard_dir, validation, n_shards):
+    filepaths = [os.path.join(shard_dir, f) for f in sorted(os.listdir(shard_dir))][:n_shards]
+    gradients = train_gradients(filepaths)
+
+    base_size = None
+    base_err = None
+    for spec in SPECS:
+        models = []
+        start = time.perf_counter()
+        for _, grad_V, grad_W in gradients:
+            V, _ = tensor_codec.compress(grad_V, spec)
+            W, _ = tensor_codec.compress(grad_W, spec)
+            models.append(Model(V_tensor=V, W_tensor=W, error_rate=0.0, status='done'))
+        elapsed = (time.perf_counter() - start) / len(models)
+
+        size = np.mean([wire_size(model) for model in models])
+        err = validate(models, validation)
+        if base_size is None:
+            base_size, base_err = size, err
+        print("%-16s %7.0f bytes  x%5.1f  encode %6.0fus  validate %.4f  delta %+.4f"
+              % (spec or "none", size, base_size / size, elapsed * 1e6, err, err - base_err))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python bench_compression.py <shard_dir> <validation_file> [<n_shards>]")
+        sys.exit(1)
+
+    bench(sys.argv[1], sys.argv[2], int(sys.argv[3]) if len(sys.argv) == 4 else 20)
@@ -0,0 +1,61 @@
+import queue
+import threading
+
+
+class ChainBroadcast:
+    """A payload received in chunks and forwarded chunk by chunk down a chain.
+
+    A forwarder thread hands the chunks to send(index, data) in arrival
+    order, so the next node receives chunk i while this one receives chunk
+    i + 1. Without send this node ends the chain.
+    """
+
+    def __init__(self, total, send=None):
+        self.total = total
+        self.chunks = [None] * total
+        self.received = 0
+        self.send = send
+        self.pending = queue.Queue()
+        self.ok = True
+        # set once every chunk was forwarded, or failed to be
+        self.forwarded = threading.Event()
+        if send:
+            threading.Thread(target=self.forward, daemon=True).start()
+        else:
+            self.forwarded.set()
+
+    def add(self, index, data):
+        """Store chunk index and queue it for forwarding, return True once every chunk arrived.
+
+        Chunks received before are ignored, so a chain that loops back does
+        not forward them again.
+        """
+        if not 0 <= index < self.total:
+            raise ValueError(f"Chunk {index} out of {self.total}")
+        if self.chunks[index] is None:
+            self.received += 1
+            self.chunks[index] = data
+            if self.send:
+                self.pending.put(index)
+        return self.received == self.total
+
+    def payload(self):
+        """Return the chunks joined back together."""
+        return b''.join(self.chunks)
+
+    def forward(self):
+        """Send every chunk on, a failed chunk stops the rest from being sent."""
+        for _ in range(self.total):
+            index = self.pending.get()
+            if not self.ok:
+                continue
+            try:
+                self.ok = bool(self.send(index, self.chunks[index]))
+            except Exception as e:
+                print(f"Error forwarding chunk {index} - {e}")
+                self.ok = False
+        self.forwarded.set()
+
+    def wait(self, timeout):
+        """Wait up to timeout seconds for the forwarding to finish, return whether every chunk got through."""
+        return self.forwarded.wait(timeout) and self.ok
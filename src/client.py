@@ -1,15 +1,23 @@
+import argparse
 import hashlib
 import os
+import queue
+import socket
 import sys
+import threading
 import time
 import numpy as np
 import sys
 sys.path.append("gen-py")
 from thrift.transport import TSocket, TTransport
 from thrift.protocol import TBinaryProtocol
-from compute_node.ComputeNode import Client as ComputeNodeClient
+from thrift.server import TServer
+from thrift.TSerialization import serialize
+from compute_node.ComputeNode import Client as ComputeNodeClient, Model, TrainingSettings
+from compute_node.ModelReceiver import Processor as ModelReceiverProcessor
 from supernode.Supernode import Client as SupernodeClient
-from ML.ML import mlp
+from ML.ML import PRECISION_MODES, mlp
+from tensor_codec import model_weights, pack, parse_compression, unpack
 
 
 def connect_to_supernode(ip, port):
@@ -30,6 +38,53 @@ def connect_to_compute_node(ip, port):
     return client, transport
 
 
+class ModelReceiverHandler:
+    """Receives the models the compute nodes push when training finishes."""
+
+    def __init__(self):
+        self.pushed = queue.Queue()
+
+    def model_ready(self, filename, model):
+        self.pushed.put((filename, model))
+
+
+def start_model_receiver(port):
+    handler = ModelReceiverHandler()
+    transport = TSocket.TServerSocket(port=port)
+    tfactory = TTransport.TBufferedTransportFactory()
+    pfactory = TBinaryProtocol.TBinaryProtocolFactory()
+    server = TServer.TThreadedServer(ModelReceiverProcessor(handler), transport, tfactory, pfactory, daemon=True)
+    threading.Thread(target=server.serve, daemon=True).start()
+    return handler
+
+
+def collect_pushed_models(receiver, node_client, files, callback_address, compression, timeout, job="",
+                          version=0, settings=None):
+    """Wait up to timeout seconds for the models of files to be pushed.
+
+    Saturated files are resubmitted, files that are still missing afterwards
+    are left to the polling loop.
+    """
+    models = {}
+    deadline = time.time() + timeout
+    while len(models) < len(files):
+        try:
+            filename, model = receiver.pushed.get(timeout=max(deadline - time.time(), 0))
+        except queue.Empty:
+            break
+
+        if model.status == 'done':
+            models[filename] = model
+            print(f"Received model for {filename}")
+        elif model.status == 'saturated':
+            print(f"Node saturated, resubmitting {filename}...")
+            time.sleep(1)
+            node_client.put_data_batch([filename], callback_address, compression, job, version, settings)
+        else:
+            print(f"Error with {filename}")
+    return models
+
+
 def average_models(models):
     
     model_list = list(models)
@@ -39,8 +94,7 @@ def average_models(models):
     sum_W = None
     
     for model in model_list: 
-        gradV = np.array(model.V, dtype=float)
-        gradW = np.array(model.W, dtype=float)
+        gradV, gradW = model_weights(model)
         
         if sum_V is None:
             sum_V = gradV
@@ -57,14 +111,227 @@ def average_models(models):
     return avg_V, avg_W    
 
 
+def collect_models(node_client, files, callback_address, compression, receiver, job="", version=0, settings=None):
+    """Collect the models of files, pushed to receiver if given, else by polling."""
+    models = {}
+    attempts = 0
+    max_attempts = 10
+    wait_timeout_ms = 5000
+
+    if receiver:
+        models = collect_pushed_models(receiver, node_client, files, callback_address, compression,
+                                       max_attempts * wait_timeout_ms / 1000, job, version, settings)
+    
+    while len(models) < len(files) and attempts < max_attempts:
+        pending = [filename for filename in files if filename not in models]
+        try:
+            results = node_client.get_models(pending, compression, job)
+        except Exception as e:
+            print(f"Error retrieving models: {e}")
+            results = {}
+
+        saturated = []
+        waiting = []
+        for filename in pending:
+            model = results.get(filename)
+            if model is None:
+                continue
+            if model.status == 'done':
+                models[filename] = model
+                print(f"Acquired model for {filename}")
+            elif model.status == 'wait':
+                print(f"Waiting for {filename}...")
+                waiting.append(filename)
+            elif model.status == 'saturated':
+                saturated.append(filename)
+            else:
+                print(f"Error with {filename}")
+
+        if saturated:
+            print(f"Nodes saturated, resubmitting {len(saturated)} files...")
+            node_client.put_data_batch(saturated, callback_address, compression, job, version, settings)
+        
+        # Block until the first waiting file is done, then collect everything finished
+        if waiting:
+            model = node_client.wait_model(waiting[0], wait_timeout_ms, compression, job)
+            if model.status != 'wait':
+                continue
+        if len(models) < len(files):
+            print(f"Retry {attempts+1}/{max_attempts}")
+            if not waiting:
+                time.sleep(5)
+            attempts += 1
+
+    return models
+
+
+def super_addresses(supernode_ip, supernode_port):
+    """Return the address of every compute node, from the supernode."""
+    super_client, super_trans = connect_to_supernode(supernode_ip, supernode_port)
+    try:
+        return list(super_client.get_compute_node_addresses().values())
+    finally:
+        super_trans.close()
+
+
+def get_aggregate(address, job, files):
+    """Ask the node at address for the sum of the finished gradients it owns among files."""
+    ip, port = address.split(':')
+    client, transport = connect_to_compute_node(ip, int(port))
+    try:
+        return client.get_aggregate(job, files)
+    finally:
+        transport.close()
+
+
+def collect_aggregate(addresses, node_client, job, files, ring=False, max_attempts=10, wait_timeout_ms=5000,
+                      settings=None):
+    """Collect the summed gradients of files from the nodes that own them.
+
+    Every node returns one aggregate of the finished files it owns, or with
+    ring the nodes reduce them along the ring and node_client returns their
+    average. Files that are not finished yet are asked for again once one of
+    them is. An aggregate including a file already counted is left out, its
+    other files are asked for again. Every pass that counts no new file uses
+    up one of max_attempts. Saturated files are resubmitted with settings.
+    Returns (avg_V, avg_W, number of models averaged).
+    """
+    sum_V = None
+    sum_W = None
+    count = 0
+    counted = set()
+    remaining = list(files)
+    attempts = 0
+
+    while remaining and attempts < max_attempts:
+        counted_before = len(counted)
+        if ring:
+            aggregates = [("the ring", node_client.all_reduce(job, remaining))]
+        else:
+            aggregates = [(address, get_aggregate(address, job, remaining)) for address in addresses]
+
+        for source, aggregate in aggregates:
+            if not aggregate.count:
+                continue
+            if counted.intersection(aggregate.filenames):
+                print(f"Skipping {aggregate.count} summed models from {source}, some were already counted")
+                continue
+
+            V = unpack(aggregate.V_tensor).astype(float)
+            W = unpack(aggregate.W_tensor).astype(float)
+            if ring:
+                # all_reduce averages, weight it back into the sum
+                V *= aggregate.count
+                W *= aggregate.count
+            sum_V = V if sum_V is None else sum_V + V
+            sum_W = W if sum_W is None else sum_W + W
+            count += aggregate.count
+            print(f"Received {aggregate.count} summed models ({aggregate.samples} samples) from {source}")
+            counted.update(aggregate.filenames)
+            remaining = [f for f in remaining if f not in counted]
+
+        if not remaining:
+            break
+        if len(counted) == counted_before:
+            attempts += 1
+            print(f"Retry {attempts}/{max_attempts}")
+
+        # Block until the first unfinished file is done, then aggregate again
+        model = node_client.wait_model(remaining[0], wait_timeout_ms, "", job)
+        if model.status == 'saturated':
+            print(f"Node saturated, resubmitting {remaining[0]}...")
+            time.sleep(1)
+            node_client.put_data_batch([remaining[0]], "", "", job, 0, settings)
+
+    if count == 0:
+        return None, None, 0
+    return sum_V / count, sum_W / count, count
+
+
+# Bytes per chunk of a broadcast global model.
+BROADCAST_CHUNK = 16384
+
+
+def broadcast_global_model(node_client, origin, job, version, V, W, chunk_size=BROADCAST_CHUNK):
+    """Broadcast the job's global model of a round along the ring, starting at node origin.
+
+    The serialized model is sent to node_client in chunks, which every node
+    forwards to its successor while receiving the next, so the client sends
+    the model once however many nodes there are. Returns True once every
+    node in the chain has it.
+    """
+    data = serialize(Model(V_tensor=pack(np.asarray(V, dtype=float)),
+                           W_tensor=pack(np.asarray(W, dtype=float))))
+    chunks = [data[i:i + chunk_size] for i in range(0, len(data), chunk_size)]
+    ok = True
+    for index, chunk in enumerate(chunks):
+        ok = node_client.broadcast_chunk(job, version, origin, index, len(chunks), chunk) and ok
+    return ok
+
+
+def publish_global_model(addresses, job, version, V, W):
+    """Publish the job's global model of a round to every reachable compute node."""
+    V_tensor = pack(np.asarray(V, dtype=float))
+    W_tensor = pack(np.asarray(W, dtype=float))
+    for address in addresses:
+        ip, port = address.split(':')
+        try:
+            client, transport = connect_to_compute_node(ip, int(port))
+        except Exception as e:
+            print(f"Error connecting to node {address}: {e}")
+            continue
+        try:
+            client.publish_model(job, version, V_tensor, W_tensor)
+        finally:
+            transport.close()
+
+
+def validate_weights(V, W, validation="validate_letters.txt"):
+    """Return the validation error of a model with weights V and W."""
+    model = mlp()
+    model.init_training_model(validation, V, W)
+    return model.validate(validation)
+
+
 if __name__ == "__main__":
     
-    if len(sys.argv) != 3:
-        print("Usage: python client.py <supernode_ip> <supernode_port>")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(description="Train on the letters shards across the ring")
+    parser.add_argument("supernode_ip")
+    parser.add_argument("supernode_port", type=int)
+    parser.add_argument("callback_address", nargs='?', default="",
+                        help="host:port to receive pushed models on instead of polling for them")
+    parser.add_argument("--compression", default="",
+                        help="gradient compression, e.g. float16, int8, topk:0.1, optionally +zlib")
+    parser.add_argument("--aggregate", nargs='?', const="nodes", choices=("nodes", "ring"),
+                        help="have every node sum the gradients it owns and send one aggregate, "
+                             "or with ring reduce them along the ring into one average")
+    parser.add_argument("--job", default="",
+                        help="name the nodes keep the models under, defaults to host and process id")
+    parser.add_argument("--delete-models", action="store_true",
+                        help="delete the job's models from the nodes once validated")
+    parser.add_argument("--precision", choices=sorted(PRECISION_MODES),
+                        help="precision the nodes train these files in, defaults to each node's own")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="rows per shuffled mini-batch the nodes train these files on, "
+                             "defaults to each node's own")
+    args = parser.parse_args()
+    try:
+        parse_compression(args.compression)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    supernode_ip = args.supernode_ip
+    supernode_port = args.supernode_port
+    compression = args.compression
+    settings = TrainingSettings(precision=args.precision, batch_size=args.batch_size)
 
-    supernode_ip = sys.argv[1]
-    supernode_port = int(sys.argv[2])
+    # Optionally let the nodes push finished models instead of polling for them
+    callback_address = args.callback_address
+    receiver = None
+    if callback_address:
+        receiver = start_model_receiver(int(callback_address.rsplit(':', 1)[1]))
 
     # Get initial node
     super_client, super_trans = connect_to_supernode(supernode_ip, supernode_port)
@@ -84,51 +351,34 @@ if __name__ == "__main__":
         print("Error: letters directory not found")
         sys.exit(1)
 
-    # Distribute both files
+    # Distribute the files, one batch per owner node, the nodes keep their models under job
+    job = args.job or f"{socket.gethostname()}-{os.getpid()}"
+    try:
+        statuses = node_client.put_data_batch(files, callback_address, compression, job, 0, settings)
+    except Exception as e:
+        print(f"Error submitting files: {e}")
+        sys.exit(1)
     for filename in files:
-        
-        try:
-            node_client.put_data(filename)
-            print(f"Submitted {filename}",int(hashlib.sha1(filename.encode()).hexdigest(), 16) % (2 ** 6))
-        except Exception as e:
-            print(f"Error submitting {filename}: {e}")
-            sys.exit(1)
-
-    # Collect models with retries
-    models = {}
-    attempts = 0
-    max_attempts = 10
-    
-    while len(models) < no_of_files and attempts < max_attempts:
-        for filename in files:
-            if filename in models:
-                continue
-                
-            try:
-                model = node_client.get_model(filename)
-                if model.status == 'done':
-                    models[filename] = model
-                    print(f"Acquired model for {filename}")
-                elif model.status == 'wait':
-                    print(f"Waiting for {filename}...")
-                else:
-                    print(f"Error with {filename}")
-            except Exception as e:
-                print(f"Error retrieving {filename}: {e}")
-        
-        if len(models) < no_of_files:
-            print(f"Retry {attempts+1}/{max_attempts}")
-            time.sleep(5)
-            attempts += 1
+        print(f"Submitted {filename}",int(hashlib.sha1(filename.encode()).hexdigest(), 16) % (2 ** 6), statuses.get(filename))
 
-    if len(models) != no_of_files:
-        print("Failed to collect both models")
-        sys.exit(1)
-    
-    # Aggregate and validate
-    print("Aggregating models...")
-    avg_V, avg_W = average_models(models.values())
+    # Collect the gradients and average them
+    if args.aggregate:
+        print("Aggregating models on the nodes...")
+        ring = args.aggregate == "ring"
+        addresses = [] if ring else super_addresses(supernode_ip, supernode_port)
+        avg_V, avg_W, count = collect_aggregate(addresses, node_client, job, files, ring, settings=settings)
+        if count != no_of_files:
+            print("Failed to collect all models")
+            sys.exit(1)
+    else:
+        models = collect_models(node_client, files, callback_address, compression, receiver, job, settings=settings)
+        if len(models) != no_of_files:
+            print("Failed to collect both models")
+            sys.exit(1)
 
+        # Aggregate and validate
+        print("Aggregating models...")
+        avg_V, avg_W = average_models(models.values())
 
     final_model = mlp()
     avg_V = np.multiply(avg_V, 0.1)
@@ -137,4 +387,7 @@ if __name__ == "__main__":
     error = final_model.validate("validate_letters.txt")
     print(f"Final validation error: {error:.2f}%")
 
+    if args.delete_models:
+        print(f"Deleted {node_client.delete_job(job, True)} models of job {job}")
+
     node_trans.close()
\ No newline at end of file
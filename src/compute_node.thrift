@@ -1,17 +1,74 @@
 namespace py compute_node
 
+struct Tensor {
+    1: list<i32> shape,
+    2: string dtype,
+    3: binary data,
+    4: string compression,
+    5: double scale,
+    6: binary indices
+}
+
 struct Model {
     1: list<list<double>> V,
     2: list<list<double>> W,
     3: double error_rate,
-    4: string status
+    4: string status,
+    5: Tensor V_tensor,
+    6: Tensor W_tensor,
+    7: i64 samples
+}
+
+struct Aggregate {
+    1: Tensor V_tensor,
+    2: Tensor W_tensor,
+    3: i32 count,
+    4: i64 samples,
+    5: list<string> filenames
+}
+
+struct QueueStatus {
+    1: i32 depth,
+    2: i32 capacity,
+    3: i32 running,
+    4: i32 workers,
+    5: bool saturated
+}
+
+struct TrainingSettings {
+    1: string precision,
+    2: i32 batch_size
 }
 
 service ComputeNode {
-  oneway void put_data(1: string filename),
+  oneway void put_data(1: string filename, 2: string callback_address = "", 3: string compression = ""),
+  
+  string submit_data(1: string filename, 2: i32 priority, 3: i64 deadline_ms),
+  
+  QueueStatus get_queue_status(),
+  
+  map<string, string> put_data_batch(1: list<string> filenames, 2: string callback_address = "", 3: string compression = "", 4: string job = "", 5: i32 version = 0, 6: TrainingSettings settings),
+  
+  map<string, Model> get_models(1: list<string> filenames, 2: string compression = "", 3: string job = ""),
+  
+  map<string, string> get_statuses(1: list<string> filenames, 2: string job = ""),
+  
+  Aggregate get_aggregate(1: string job, 2: list<string> filenames),
+  
+  Aggregate reduce_aggregate(1: string job, 2: list<string> filenames, 3: i32 limit),
+  
+  Aggregate all_reduce(1: string job, 2: list<string> filenames),
+  
+  i32 delete_job(1: string job, 2: bool forward = true),
+  
+  bool publish_model(1: string job, 2: i32 version, 3: Tensor V_tensor, 4: Tensor W_tensor),
+  
+  bool broadcast_chunk(1: string job, 2: i32 version, 3: i32 origin, 4: i32 index, 5: i32 total, 6: binary data),
   
   Model get_model(1: string filename),
   
+  Model wait_model(1: string filename, 2: i32 timeout_ms, 3: string compression = "", 4: string job = ""),
+  
   void fix_fingers(),
   
   i32 find_successor(1: i32 node_id),
@@ -31,4 +88,8 @@ service ComputeNode {
   void set_successor(),
 
   void print_finger_table()
+}
+
+service ModelReceiver {
+  oneway void model_ready(1: string filename, 2: Model model)
 }
\ No newline at end of file
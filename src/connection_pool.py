@@ -0,0 +1,106 @@
+import collections
+import select
+import threading
+import time
+from thrift.transport import TSocket, TTransport
+from thrift.protocol import TBinaryProtocol
+
+
+class PooledTransport:
+    """Transport of a pooled connection, close() hands it back to the pool."""
+
+    def __init__(self, pool, key, client, transport, socket):
+        self.pool = pool
+        self.key = key
+        self.client = client
+        self.transport = transport
+        self.socket = socket
+        self.released = False
+
+    def close(self):
+        if not self.released:
+            self.released = True
+            self.pool.release(self)
+
+    def __getattr__(self, name):
+        return getattr(self.transport, name)
+
+
+class ConnectionPool:
+    """Per-peer pool of open Thrift connections.
+
+    Every connection is leased to one caller at a time. Idle connections are
+    health checked before reuse and dropped after idle_timeout seconds, at
+    most max_idle of them are kept per peer.
+    """
+
+    def __init__(self, client_class, max_idle=4, idle_timeout=60.0):
+        self.client_class = client_class
+        self.max_idle = max_idle
+        self.idle_timeout = idle_timeout
+        self.idle = collections.defaultdict(collections.deque)
+        self.lock = threading.Lock()
+
+    def connect(self, ip, port):
+        """Lease a connection to ip:port, opening one if no idle one is healthy.
+
+        Returns (client, transport), raises on connection failure like
+        transport.open() does.
+        """
+        key = (ip, int(port))
+        while True:
+            with self.lock:
+                if not self.idle[key]:
+                    break
+                lease, last_used = self.idle[key].pop()
+            if time.monotonic() - last_used < self.idle_timeout and self.is_healthy(lease):
+                lease.released = False
+                return lease.client, lease
+            lease.transport.close()
+
+        socket = TSocket.TSocket(ip, int(port))
+        transport = TTransport.TBufferedTransport(socket)
+        protocol = TBinaryProtocol.TBinaryProtocol(transport)
+        client = self.client_class(protocol)
+        transport.open()
+        lease = PooledTransport(self, key, client, transport, socket)
+        return client, lease
+
+    def release(self, lease):
+        """Return a leased connection, closing it if the peer has enough idle ones."""
+        with self.lock:
+            idle = self.idle[lease.key]
+            if len(idle) < self.max_idle:
+                idle.append((lease, time.monotonic()))
+                return
+        lease.transport.close()
+
+    def is_healthy(self, lease):
+        """Return whether an idle connection can be reused.
+
+        A healthy idle connection has nothing to read, readable data means
+        the peer closed it or a failed call left a response behind.
+        """
+        handle = lease.socket.handle
+        if handle is None:
+            return False
+        try:
+            readable, _, _ = select.select([handle], [], [], 0)
+        except (OSError, ValueError):
+            return False
+        return not readable
+
+    def discard(self, ip, port):
+        """Close every idle connection to ip:port."""
+        with self.lock:
+            idle = self.idle.pop((ip, int(port)), ())
+        for lease, _ in idle:
+            lease.transport.close()
+
+    def close_all(self):
+        """Close every idle connection."""
+        with self.lock:
+            idle, self.idle = self.idle, collections.defaultdict(collections.deque)
+        for connections in idle.values():
+            for lease, _ in connections:
+                lease.transport.close()
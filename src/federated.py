@@ -0,0 +1,263 @@
+import argparse
+import os
+import socket
+import sys
+import time
+import numpy as np
+sys.path.append("gen-py")
+from ML.ML import PRECISION_MODES, mlp
+from compute_node.ComputeNode import TrainingSettings
+from client import (
+    broadcast_global_model,
+    connect_to_compute_node,
+    connect_to_supernode,
+    publish_global_model,
+    super_addresses,
+    validate_weights
+)
+from tensor_codec import model_weights, parse_compression
+
+# Phases of a round in order, each one timed.
+PHASES = ('submit', 'train', 'collect', 'aggregate', 'validate')
+
+# How the gradients of the files are weighted in the average.
+WEIGHTINGS = ('samples', 'uniform')
+
+
+class RoundFailed(Exception):
+    """A round could not train or collect every file."""
+
+
+class RoundReport:
+    """Validation error and wall time per phase of one round."""
+
+    def __init__(self, version, error, timings):
+        self.version = version
+        self.error = error
+        self.timings = timings
+
+    def total(self):
+        """Wall time of the whole round in seconds."""
+        return sum(self.timings.values())
+
+    def __str__(self):
+        phases = "  ".join(f"{phase} {self.timings[phase]:6.2f}s" for phase in PHASES)
+        return f"Round {self.version:3d}  error {self.error:.4f}  {phases}  total {self.total():6.2f}s"
+
+
+class FederatedTrainer:
+    """Runs federated averaging rounds over the ring.
+
+    Every round broadcasts the global model to the nodes as a new version of
+    the job, trains every file from it, and moves the global model by
+    server_lr times the average of the files' gradients, weighted by their
+    training samples or uniformly. The nodes train in precision and on
+    mini-batches of batch_size rows, or with their own settings if not given.
+    """
+
+    def __init__(self, supernode_ip, supernode_port, files, job, validation="validate_letters.txt",
+                 compression="", weighting='samples', server_lr=1.0, wait_timeout_ms=5000, max_waits=60,
+                 precision=None, batch_size=None):
+        if weighting not in WEIGHTINGS:
+            raise ValueError(f"Unknown weighting {weighting}")
+        if precision and precision not in PRECISION_MODES:
+            raise ValueError(f"Unknown precision {precision}")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"Batch size must be positive, got {batch_size}")
+        parse_compression(compression)
+        self.files = list(files)
+        self.job = job
+        self.validation = validation
+        self.compression = compression
+        self.settings = TrainingSettings(precision=precision, batch_size=batch_size)
+        self.weighting = weighting
+        self.server_lr = server_lr
+        self.wait_timeout_ms = wait_timeout_ms
+        self.max_waits = max_waits
+
+        super_client, super_trans = connect_to_supernode(supernode_ip, supernode_port)
+        try:
+            node_id, node_ip, node_port = super_client.get_node().split(':')
+        finally:
+            super_trans.close()
+        self.origin = int(node_id)
+        self.node_client, self.node_trans = connect_to_compute_node(node_ip, int(node_port))
+        self.addresses = super_addresses(supernode_ip, supernode_port)
+
+        init_model = mlp()
+        init_model.init_training_random(validation, 26, 20)
+        self.V, self.W = init_model.get_weights()
+        self.version = 0
+
+    def run(self, rounds, patience=0, min_delta=0.0):
+        """Run up to rounds rounds and return their reports.
+
+        With a patience, training stops once that many rounds in a row did
+        not beat the best validation error by more than min_delta. The global
+        model is left at the round with the lowest validation error.
+        """
+        reports = []
+        best = None
+        plateau_error = None
+        stale = 0
+        for _ in range(rounds):
+            report = self.run_round()
+            reports.append(report)
+            print(report)
+
+            if best is None or report.error < best[0]:
+                best = (report.error, self.V, self.W)
+            if plateau_error is None or report.error < plateau_error - min_delta:
+                plateau_error = report.error
+                stale = 0
+            else:
+                stale += 1
+                if patience and stale >= patience:
+                    print(f"Stopping, no improvement over {min_delta} for {stale} rounds")
+                    break
+
+        if best:
+            _, self.V, self.W = best
+        return reports
+
+    def run_round(self):
+        """Run the next round, return its RoundReport, raise RoundFailed if files are lost."""
+        self.version += 1
+        marks = [time.perf_counter()]
+        self.submit()
+        marks.append(time.perf_counter())
+        self.wait_trained()
+        marks.append(time.perf_counter())
+        gradients = self.collect()
+        marks.append(time.perf_counter())
+        self.aggregate(gradients)
+        marks.append(time.perf_counter())
+        error = validate_weights(self.V, self.W, self.validation)
+        marks.append(time.perf_counter())
+        return RoundReport(self.version, error, dict(zip(PHASES, np.diff(marks))))
+
+    def submit(self):
+        """Send the global model to the nodes and submit every file to train from it.
+
+        Nodes the broadcast along the ring did not reach get the model from
+        the trainer directly.
+        """
+        if not broadcast_global_model(self.node_client, self.origin, self.job, self.version, self.V, self.W):
+            publish_global_model(self.addresses, self.job, self.version, self.V, self.W)
+        failed = self.files
+        for attempt in range(2):
+            if attempt:
+                publish_global_model(self.addresses, self.job, self.version, self.V, self.W)
+            statuses = self.node_client.put_data_batch(failed, "", self.compression, self.job, self.version,
+                                                       self.settings)
+            failed = [f for f in failed if statuses.get(f) == 'error']
+            if not failed:
+                return
+        raise RoundFailed(f"Round {self.version}: could not submit {len(failed)} files")
+
+    def wait_trained(self):
+        """Block until every file of the round has trained, resubmitting saturated ones."""
+        pending = self.files
+        for _ in range(self.max_waits):
+            statuses = self.node_client.get_statuses(pending, self.job)
+            failed = [f for f in pending if statuses.get(f) in ('failed', 'error', 'not_found')]
+            if failed:
+                raise RoundFailed(f"Round {self.version}: training failed for {len(failed)} files")
+
+            saturated = [f for f in pending if statuses.get(f) == 'saturated']
+            pending = [f for f in pending if statuses.get(f) != 'done']
+            if not pending:
+                return
+            if saturated:
+                time.sleep(1)
+                self.node_client.put_data_batch(saturated, "", self.compression, self.job, self.version,
+                                                self.settings)
+            else:
+                self.node_client.wait_model(pending[0], self.wait_timeout_ms, self.compression, self.job)
+        raise RoundFailed(f"Round {self.version}: {len(pending)} files still training")
+
+    def collect(self):
+        """Fetch the gradients of every file, return (grad_V, grad_W, samples) tuples."""
+        models = self.node_client.get_models(self.files, self.compression, self.job)
+        missing = [f for f in self.files if f not in models or models[f].status != 'done']
+        if missing:
+            raise RoundFailed(f"Round {self.version}: could not collect {len(missing)} models")
+        return [model_weights(models[f]) + (models[f].samples or 0,) for f in self.files]
+
+    def aggregate(self, gradients):
+        """Move the global model by the weighted average of the gradients."""
+        weights = np.ones(len(gradients))
+        if self.weighting == 'samples':
+            weights = np.array([samples for _, _, samples in gradients], dtype=float)
+            if not weights.sum():
+                weights = np.ones(len(gradients))
+        weights /= weights.sum()
+
+        self.V = self.V + self.server_lr * sum(w * grad_V for w, (grad_V, _, _) in zip(weights, gradients))
+        self.W = self.W + self.server_lr * sum(w * grad_W for w, (_, grad_W, _) in zip(weights, gradients))
+
+    def close(self, delete_models=False):
+        """Disconnect, deleting the job's models and global models from the nodes if asked."""
+        if delete_models:
+            print(f"Deleted {self.node_client.delete_job(self.job, True)} models of job {self.job}")
+        self.node_trans.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run federated averaging rounds on the letters shards across the ring")
+    parser.add_argument("supernode_ip")
+    parser.add_argument("supernode_port", type=int)
+    parser.add_argument("--files", type=int, default=20,
+                        help="number of shards from the letters directory to train on")
+    parser.add_argument("--rounds", type=int, default=10,
+                        help="maximum number of rounds")
+    parser.add_argument("--patience", type=int, default=2,
+                        help="stop after this many rounds without improvement, 0 runs every round")
+    parser.add_argument("--min-delta", type=float, default=0.001,
+                        help="smallest drop in validation error that counts as an improvement")
+    parser.add_argument("--weighting", choices=WEIGHTINGS, default='samples',
+                        help="weight the gradients of the files by their training samples or uniformly")
+    parser.add_argument("--server-lr", type=float, default=1.0,
+                        help="scale of the averaged gradient applied to the global model")
+    parser.add_argument("--compression", default="",
+                        help="gradient compression, e.g. float16, int8, topk:0.1, optionally +zlib")
+    parser.add_argument("--job", default="",
+                        help="name the nodes keep the models under, defaults to host and process id")
+    parser.add_argument("--delete-models", action="store_true",
+                        help="delete the job's models from the nodes when done")
+    parser.add_argument("--precision", choices=sorted(PRECISION_MODES),
+                        help="precision the nodes train in, defaults to each node's own")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="rows per shuffled mini-batch the nodes train on, defaults to each node's own")
+    args = parser.parse_args()
+    try:
+        parse_compression(args.compression)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.batch_size is not None and args.batch_size < 1:
+        parser.error("--batch-size must be positive")
+
+    try:
+        files = sorted(os.listdir("letters"))[:args.files]
+    except FileNotFoundError:
+        print("Error: letters directory not found")
+        sys.exit(1)
+
+    job = args.job or f"{socket.gethostname()}-{os.getpid()}"
+    trainer = FederatedTrainer(args.supernode_ip, args.supernode_port, files, job,
+                               compression=args.compression, weighting=args.weighting,
+                               server_lr=args.server_lr, precision=args.precision,
+                               batch_size=args.batch_size)
+    try:
+        reports = trainer.run(args.rounds, args.patience, args.min_delta)
+    except RoundFailed as e:
+        print(e)
+        sys.exit(1)
+    finally:
+        trainer.close(args.delete_models)
+
+    best = min(reports, key=lambda report: report.error)
+    elapsed = sum(report.total() for report in reports[:reports.index(best) + 1])
+    print(f"Best validation error {best.error:.4f} in round {best.version}, after {elapsed:.2f}s")
+    for phase in PHASES:
+        print(f"  {phase:9s} {sum(report.timings[phase] for report in reports):7.2f}s")
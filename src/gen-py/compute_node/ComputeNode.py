@@ -19,10 +19,118 @@ all_structs = []
 
 
 class Iface(object):
-    def put_data(self, filename):
+    def put_data(self, filename, callback_address, compression):
         """
         Parameters:
          - filename
+         - callback_address
+         - compression
+
+        """
+        pass
+
+    def submit_data(self, filename, priority, deadline_ms):
+        """
+        Parameters:
+         - filename
+         - priority
+         - deadline_ms
+
+        """
+        pass
+
+    def get_queue_status(self):
+        pass
+
+    def put_data_batch(self, filenames, callback_address, compression, job, version, settings):
+        """
+        Parameters:
+         - filenames
+         - callback_address
+         - compression
+         - job
+         - version
+         - settings
+
+        """
+        pass
+
+    def get_models(self, filenames, compression, job):
+        """
+        Parameters:
+         - filenames
+         - compression
+         - job
+
+        """
+        pass
+
+    def get_statuses(self, filenames, job):
+        """
+        Parameters:
+         - filenames
+         - job
+
+        """
+        pass
+
+    def get_aggregate(self, job, filenames):
+        """
+        Parameters:
+         - job
+         - filenames
+
+        """
+        pass
+
+    def reduce_aggregate(self, job, filenames, limit):
+        """
+        Parameters:
+         - job
+         - filenames
+         - limit
+
+        """
+        pass
+
+    def all_reduce(self, job, filenames):
+        """
+        Parameters:
+         - job
+         - filenames
+
+        """
+        pass
+
+    def delete_job(self, job, forward):
+        """
+        Parameters:
+         - job
+         - forward
+
+        """
+        pass
+
+    def publish_model(self, job, version, V_tensor, W_tensor):
+        """
+        Parameters:
+         - job
+         - version
+         - V_tensor
+         - W_tensor
+
+        """
+        pass
+
+    def broadcast_chunk(self, job, version, origin, index, total, data):
+        """
+        Parameters:
+         - job
+         - version
+         - origin
+         - index
+         - total
+         - data
 
         """
         pass
@@ -35,6 +143,17 @@ class Iface(object):
         """
         pass
 
+    def wait_model(self, filename, timeout_ms, compression, job):
+        """
+        Parameters:
+         - filename
+         - timeout_ms
+         - compression
+         - job
+
+        """
+        pass
+
     def fix_fingers(self):
         pass
 
@@ -99,40 +218,48 @@ class Client(Iface):
             self._oprot = oprot
         self._seqid = 0
 
-    def put_data(self, filename):
+    def put_data(self, filename, callback_address, compression):
         """
         Parameters:
          - filename
+         - callback_address
+         - compression
 
         """
-        self.send_put_data(filename)
+        self.send_put_data(filename, callback_address, compression)
 
-    def send_put_data(self, filename):
+    def send_put_data(self, filename, callback_address, compression):
         self._oprot.writeMessageBegin('put_data', TMessageType.ONEWAY, self._seqid)
         args = put_data_args()
         args.filename = filename
+        args.callback_address = callback_address
+        args.compression = compression
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def get_model(self, filename):
+    def submit_data(self, filename, priority, deadline_ms):
         """
         Parameters:
          - filename
+         - priority
+         - deadline_ms
 
         """
-        self.send_get_model(filename)
-        return self.recv_get_model()
+        self.send_submit_data(filename, priority, deadline_ms)
+        return self.recv_submit_data()
 
-    def send_get_model(self, filename):
-        self._oprot.writeMessageBegin('get_model', TMessageType.CALL, self._seqid)
-        args = get_model_args()
+    def send_submit_data(self, filename, priority, deadline_ms):
+        self._oprot.writeMessageBegin('submit_data', TMessageType.CALL, self._seqid)
+        args = submit_data_args()
         args.filename = filename
+        args.priority = priority
+        args.deadline_ms = deadline_ms
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_get_model(self):
+    def recv_submit_data(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -140,25 +267,25 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = get_model_result()
+        result = submit_data_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_model failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "submit_data failed: unknown result")
 
-    def fix_fingers(self):
-        self.send_fix_fingers()
-        self.recv_fix_fingers()
+    def get_queue_status(self):
+        self.send_get_queue_status()
+        return self.recv_get_queue_status()
 
-    def send_fix_fingers(self):
-        self._oprot.writeMessageBegin('fix_fingers', TMessageType.CALL, self._seqid)
-        args = fix_fingers_args()
+    def send_get_queue_status(self):
+        self._oprot.writeMessageBegin('get_queue_status', TMessageType.CALL, self._seqid)
+        args = get_queue_status_args()
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_fix_fingers(self):
+    def recv_get_queue_status(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -166,29 +293,41 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = fix_fingers_result()
+        result = get_queue_status_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        return
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_queue_status failed: unknown result")
 
-    def find_successor(self, node_id):
+    def put_data_batch(self, filenames, callback_address, compression, job, version, settings):
         """
         Parameters:
-         - node_id
+         - filenames
+         - callback_address
+         - compression
+         - job
+         - version
+         - settings
 
         """
-        self.send_find_successor(node_id)
-        return self.recv_find_successor()
-
-    def send_find_successor(self, node_id):
-        self._oprot.writeMessageBegin('find_successor', TMessageType.CALL, self._seqid)
-        args = find_successor_args()
-        args.node_id = node_id
+        self.send_put_data_batch(filenames, callback_address, compression, job, version, settings)
+        return self.recv_put_data_batch()
+
+    def send_put_data_batch(self, filenames, callback_address, compression, job, version, settings):
+        self._oprot.writeMessageBegin('put_data_batch', TMessageType.CALL, self._seqid)
+        args = put_data_batch_args()
+        args.filenames = filenames
+        args.callback_address = callback_address
+        args.compression = compression
+        args.job = job
+        args.version = version
+        args.settings = settings
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_find_successor(self):
+    def recv_put_data_batch(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -196,31 +335,35 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = find_successor_result()
+        result = put_data_batch_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "find_successor failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "put_data_batch failed: unknown result")
 
-    def find_predecessor(self, node_id):
+    def get_models(self, filenames, compression, job):
         """
         Parameters:
-         - node_id
+         - filenames
+         - compression
+         - job
 
         """
-        self.send_find_predecessor(node_id)
-        return self.recv_find_predecessor()
-
-    def send_find_predecessor(self, node_id):
-        self._oprot.writeMessageBegin('find_predecessor', TMessageType.CALL, self._seqid)
-        args = find_predecessor_args()
-        args.node_id = node_id
+        self.send_get_models(filenames, compression, job)
+        return self.recv_get_models()
+
+    def send_get_models(self, filenames, compression, job):
+        self._oprot.writeMessageBegin('get_models', TMessageType.CALL, self._seqid)
+        args = get_models_args()
+        args.filenames = filenames
+        args.compression = compression
+        args.job = job
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_find_predecessor(self):
+    def recv_get_models(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -228,33 +371,33 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = find_predecessor_result()
+        result = get_models_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "find_predecessor failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_models failed: unknown result")
 
-    def update_finger_table(self, node_id, index):
+    def get_statuses(self, filenames, job):
         """
         Parameters:
-         - node_id
-         - index
+         - filenames
+         - job
 
         """
-        self.send_update_finger_table(node_id, index)
-        self.recv_update_finger_table()
-
-    def send_update_finger_table(self, node_id, index):
-        self._oprot.writeMessageBegin('update_finger_table', TMessageType.CALL, self._seqid)
-        args = update_finger_table_args()
-        args.node_id = node_id
-        args.index = index
+        self.send_get_statuses(filenames, job)
+        return self.recv_get_statuses()
+
+    def send_get_statuses(self, filenames, job):
+        self._oprot.writeMessageBegin('get_statuses', TMessageType.CALL, self._seqid)
+        args = get_statuses_args()
+        args.filenames = filenames
+        args.job = job
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_update_finger_table(self):
+    def recv_get_statuses(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -262,23 +405,33 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = update_finger_table_result()
+        result = get_statuses_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        return
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_statuses failed: unknown result")
 
-    def get_predecessor(self):
-        self.send_get_predecessor()
-        return self.recv_get_predecessor()
+    def get_aggregate(self, job, filenames):
+        """
+        Parameters:
+         - job
+         - filenames
 
-    def send_get_predecessor(self):
-        self._oprot.writeMessageBegin('get_predecessor', TMessageType.CALL, self._seqid)
-        args = get_predecessor_args()
+        """
+        self.send_get_aggregate(job, filenames)
+        return self.recv_get_aggregate()
+
+    def send_get_aggregate(self, job, filenames):
+        self._oprot.writeMessageBegin('get_aggregate', TMessageType.CALL, self._seqid)
+        args = get_aggregate_args()
+        args.job = job
+        args.filenames = filenames
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_get_predecessor(self):
+    def recv_get_aggregate(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -286,25 +439,35 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = get_predecessor_result()
+        result = get_aggregate_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_predecessor failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_aggregate failed: unknown result")
 
-    def get_successor(self):
-        self.send_get_successor()
-        return self.recv_get_successor()
+    def reduce_aggregate(self, job, filenames, limit):
+        """
+        Parameters:
+         - job
+         - filenames
+         - limit
 
-    def send_get_successor(self):
-        self._oprot.writeMessageBegin('get_successor', TMessageType.CALL, self._seqid)
-        args = get_successor_args()
+        """
+        self.send_reduce_aggregate(job, filenames, limit)
+        return self.recv_reduce_aggregate()
+
+    def send_reduce_aggregate(self, job, filenames, limit):
+        self._oprot.writeMessageBegin('reduce_aggregate', TMessageType.CALL, self._seqid)
+        args = reduce_aggregate_args()
+        args.job = job
+        args.filenames = filenames
+        args.limit = limit
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_get_successor(self):
+    def recv_reduce_aggregate(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -312,31 +475,33 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = get_successor_result()
+        result = reduce_aggregate_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_successor failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "reduce_aggregate failed: unknown result")
 
-    def set_predecessor(self, node_id):
+    def all_reduce(self, job, filenames):
         """
         Parameters:
-         - node_id
+         - job
+         - filenames
 
         """
-        self.send_set_predecessor(node_id)
-        return self.recv_set_predecessor()
-
-    def send_set_predecessor(self, node_id):
-        self._oprot.writeMessageBegin('set_predecessor', TMessageType.CALL, self._seqid)
-        args = set_predecessor_args()
-        args.node_id = node_id
+        self.send_all_reduce(job, filenames)
+        return self.recv_all_reduce()
+
+    def send_all_reduce(self, job, filenames):
+        self._oprot.writeMessageBegin('all_reduce', TMessageType.CALL, self._seqid)
+        args = all_reduce_args()
+        args.job = job
+        args.filenames = filenames
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_set_predecessor(self):
+    def recv_all_reduce(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -344,31 +509,33 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = set_predecessor_result()
+        result = all_reduce_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "set_predecessor failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "all_reduce failed: unknown result")
 
-    def closest_preceding_node(self, node_id):
+    def delete_job(self, job, forward):
         """
         Parameters:
-         - node_id
+         - job
+         - forward
 
         """
-        self.send_closest_preceding_node(node_id)
-        return self.recv_closest_preceding_node()
-
-    def send_closest_preceding_node(self, node_id):
-        self._oprot.writeMessageBegin('closest_preceding_node', TMessageType.CALL, self._seqid)
-        args = closest_preceding_node_args()
-        args.node_id = node_id
+        self.send_delete_job(job, forward)
+        return self.recv_delete_job()
+
+    def send_delete_job(self, job, forward):
+        self._oprot.writeMessageBegin('delete_job', TMessageType.CALL, self._seqid)
+        args = delete_job_args()
+        args.job = job
+        args.forward = forward
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_closest_preceding_node(self):
+    def recv_delete_job(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -376,25 +543,37 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = closest_preceding_node_result()
+        result = delete_job_result()
         result.read(iprot)
         iprot.readMessageEnd()
         if result.success is not None:
             return result.success
-        raise TApplicationException(TApplicationException.MISSING_RESULT, "closest_preceding_node failed: unknown result")
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "delete_job failed: unknown result")
 
-    def set_successor(self):
-        self.send_set_successor()
-        self.recv_set_successor()
+    def publish_model(self, job, version, V_tensor, W_tensor):
+        """
+        Parameters:
+         - job
+         - version
+         - V_tensor
+         - W_tensor
 
-    def send_set_successor(self):
-        self._oprot.writeMessageBegin('set_successor', TMessageType.CALL, self._seqid)
-        args = set_successor_args()
+        """
+        self.send_publish_model(job, version, V_tensor, W_tensor)
+        return self.recv_publish_model()
+
+    def send_publish_model(self, job, version, V_tensor, W_tensor):
+        self._oprot.writeMessageBegin('publish_model', TMessageType.CALL, self._seqid)
+        args = publish_model_args()
+        args.job = job
+        args.version = version
+        args.V_tensor = V_tensor
+        args.W_tensor = W_tensor
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_set_successor(self):
+    def recv_publish_model(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -402,23 +581,41 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = set_successor_result()
+        result = publish_model_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        return
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "publish_model failed: unknown result")
 
-    def print_finger_table(self):
-        self.send_print_finger_table()
-        self.recv_print_finger_table()
+    def broadcast_chunk(self, job, version, origin, index, total, data):
+        """
+        Parameters:
+         - job
+         - version
+         - origin
+         - index
+         - total
+         - data
 
-    def send_print_finger_table(self):
-        self._oprot.writeMessageBegin('print_finger_table', TMessageType.CALL, self._seqid)
-        args = print_finger_table_args()
+        """
+        self.send_broadcast_chunk(job, version, origin, index, total, data)
+        return self.recv_broadcast_chunk()
+
+    def send_broadcast_chunk(self, job, version, origin, index, total, data):
+        self._oprot.writeMessageBegin('broadcast_chunk', TMessageType.CALL, self._seqid)
+        args = broadcast_chunk_args()
+        args.job = job
+        args.version = version
+        args.origin = origin
+        args.index = index
+        args.total = total
+        args.data = data
         args.write(self._oprot)
         self._oprot.writeMessageEnd()
         self._oprot.trans.flush()
 
-    def recv_print_finger_table(self):
+    def recv_broadcast_chunk(self):
         iprot = self._iprot
         (fname, mtype, rseqid) = iprot.readMessageBegin()
         if mtype == TMessageType.EXCEPTION:
@@ -426,183 +623,436 @@ class Client(Iface):
             x.read(iprot)
             iprot.readMessageEnd()
             raise x
-        result = print_finger_table_result()
+        result = broadcast_chunk_result()
         result.read(iprot)
         iprot.readMessageEnd()
-        return
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "broadcast_chunk failed: unknown result")
 
+    def get_model(self, filename):
+        """
+        Parameters:
+         - filename
 
-class Processor(Iface, TProcessor):
-    def __init__(self, handler):
-        self._handler = handler
-        self._processMap = {}
-        self._processMap["put_data"] = Processor.process_put_data
-        self._processMap["get_model"] = Processor.process_get_model
-        self._processMap["fix_fingers"] = Processor.process_fix_fingers
-        self._processMap["find_successor"] = Processor.process_find_successor
-        self._processMap["find_predecessor"] = Processor.process_find_predecessor
-        self._processMap["update_finger_table"] = Processor.process_update_finger_table
-        self._processMap["get_predecessor"] = Processor.process_get_predecessor
-        self._processMap["get_successor"] = Processor.process_get_successor
-        self._processMap["set_predecessor"] = Processor.process_set_predecessor
-        self._processMap["closest_preceding_node"] = Processor.process_closest_preceding_node
-        self._processMap["set_successor"] = Processor.process_set_successor
-        self._processMap["print_finger_table"] = Processor.process_print_finger_table
-        self._on_message_begin = None
+        """
+        self.send_get_model(filename)
+        return self.recv_get_model()
 
-    def on_message_begin(self, func):
-        self._on_message_begin = func
+    def send_get_model(self, filename):
+        self._oprot.writeMessageBegin('get_model', TMessageType.CALL, self._seqid)
+        args = get_model_args()
+        args.filename = filename
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process(self, iprot, oprot):
-        (name, type, seqid) = iprot.readMessageBegin()
-        if self._on_message_begin:
-            self._on_message_begin(name, type, seqid)
-        if name not in self._processMap:
-            iprot.skip(TType.STRUCT)
+    def recv_get_model(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
             iprot.readMessageEnd()
-            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
-            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
-            x.write(oprot)
-            oprot.writeMessageEnd()
-            oprot.trans.flush()
-            return
-        else:
-            self._processMap[name](self, seqid, iprot, oprot)
-        return True
-
-    def process_put_data(self, seqid, iprot, oprot):
-        args = put_data_args()
-        args.read(iprot)
+            raise x
+        result = get_model_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        try:
-            self._handler.put_data(args.filename)
-        except TTransport.TTransportException:
-            raise
-        except Exception:
-            logging.exception('Exception in oneway handler')
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_model failed: unknown result")
 
-    def process_get_model(self, seqid, iprot, oprot):
-        args = get_model_args()
-        args.read(iprot)
+    def wait_model(self, filename, timeout_ms, compression, job):
+        """
+        Parameters:
+         - filename
+         - timeout_ms
+         - compression
+         - job
+
+        """
+        self.send_wait_model(filename, timeout_ms, compression, job)
+        return self.recv_wait_model()
+
+    def send_wait_model(self, filename, timeout_ms, compression, job):
+        self._oprot.writeMessageBegin('wait_model', TMessageType.CALL, self._seqid)
+        args = wait_model_args()
+        args.filename = filename
+        args.timeout_ms = timeout_ms
+        args.compression = compression
+        args.job = job
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_wait_model(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = wait_model_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = get_model_result()
-        try:
-            result.success = self._handler.get_model(args.filename)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_model", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "wait_model failed: unknown result")
 
-    def process_fix_fingers(self, seqid, iprot, oprot):
+    def fix_fingers(self):
+        self.send_fix_fingers()
+        self.recv_fix_fingers()
+
+    def send_fix_fingers(self):
+        self._oprot.writeMessageBegin('fix_fingers', TMessageType.CALL, self._seqid)
         args = fix_fingers_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_fix_fingers(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
         result = fix_fingers_result()
-        try:
-            self._handler.fix_fingers()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("fix_fingers", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
 
-    def process_find_successor(self, seqid, iprot, oprot):
+    def find_successor(self, node_id):
+        """
+        Parameters:
+         - node_id
+
+        """
+        self.send_find_successor(node_id)
+        return self.recv_find_successor()
+
+    def send_find_successor(self, node_id):
+        self._oprot.writeMessageBegin('find_successor', TMessageType.CALL, self._seqid)
         args = find_successor_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
+        args.node_id = node_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_find_successor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
         result = find_successor_result()
-        try:
-            result.success = self._handler.find_successor(args.node_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("find_successor", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "find_successor failed: unknown result")
 
-    def process_find_predecessor(self, seqid, iprot, oprot):
+    def find_predecessor(self, node_id):
+        """
+        Parameters:
+         - node_id
+
+        """
+        self.send_find_predecessor(node_id)
+        return self.recv_find_predecessor()
+
+    def send_find_predecessor(self, node_id):
+        self._oprot.writeMessageBegin('find_predecessor', TMessageType.CALL, self._seqid)
         args = find_predecessor_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
+        args.node_id = node_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_find_predecessor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
         result = find_predecessor_result()
-        try:
-            result.success = self._handler.find_predecessor(args.node_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("find_predecessor", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "find_predecessor failed: unknown result")
 
-    def process_update_finger_table(self, seqid, iprot, oprot):
+    def update_finger_table(self, node_id, index):
+        """
+        Parameters:
+         - node_id
+         - index
+
+        """
+        self.send_update_finger_table(node_id, index)
+        self.recv_update_finger_table()
+
+    def send_update_finger_table(self, node_id, index):
+        self._oprot.writeMessageBegin('update_finger_table', TMessageType.CALL, self._seqid)
         args = update_finger_table_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = update_finger_table_result()
-        try:
-            self._handler.update_finger_table(args.node_id, args.index)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("update_finger_table", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+        args.node_id = node_id
+        args.index = index
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
 
-    def process_get_predecessor(self, seqid, iprot, oprot):
-        args = get_predecessor_args()
-        args.read(iprot)
+    def recv_update_finger_table(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = update_finger_table_result()
+        result.read(iprot)
         iprot.readMessageEnd()
-        result = get_predecessor_result()
-        try:
-            result.success = self._handler.get_predecessor()
+        return
+
+    def get_predecessor(self):
+        self.send_get_predecessor()
+        return self.recv_get_predecessor()
+
+    def send_get_predecessor(self):
+        self._oprot.writeMessageBegin('get_predecessor', TMessageType.CALL, self._seqid)
+        args = get_predecessor_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_predecessor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_predecessor_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_predecessor failed: unknown result")
+
+    def get_successor(self):
+        self.send_get_successor()
+        return self.recv_get_successor()
+
+    def send_get_successor(self):
+        self._oprot.writeMessageBegin('get_successor', TMessageType.CALL, self._seqid)
+        args = get_successor_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_get_successor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = get_successor_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "get_successor failed: unknown result")
+
+    def set_predecessor(self, node_id):
+        """
+        Parameters:
+         - node_id
+
+        """
+        self.send_set_predecessor(node_id)
+        return self.recv_set_predecessor()
+
+    def send_set_predecessor(self, node_id):
+        self._oprot.writeMessageBegin('set_predecessor', TMessageType.CALL, self._seqid)
+        args = set_predecessor_args()
+        args.node_id = node_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_set_predecessor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = set_predecessor_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "set_predecessor failed: unknown result")
+
+    def closest_preceding_node(self, node_id):
+        """
+        Parameters:
+         - node_id
+
+        """
+        self.send_closest_preceding_node(node_id)
+        return self.recv_closest_preceding_node()
+
+    def send_closest_preceding_node(self, node_id):
+        self._oprot.writeMessageBegin('closest_preceding_node', TMessageType.CALL, self._seqid)
+        args = closest_preceding_node_args()
+        args.node_id = node_id
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_closest_preceding_node(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = closest_preceding_node_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        if result.success is not None:
+            return result.success
+        raise TApplicationException(TApplicationException.MISSING_RESULT, "closest_preceding_node failed: unknown result")
+
+    def set_successor(self):
+        self.send_set_successor()
+        self.recv_set_successor()
+
+    def send_set_successor(self):
+        self._oprot.writeMessageBegin('set_successor', TMessageType.CALL, self._seqid)
+        args = set_successor_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_set_successor(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = set_successor_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
+    def print_finger_table(self):
+        self.send_print_finger_table()
+        self.recv_print_finger_table()
+
+    def send_print_finger_table(self):
+        self._oprot.writeMessageBegin('print_finger_table', TMessageType.CALL, self._seqid)
+        args = print_finger_table_args()
+        args.write(self._oprot)
+        self._oprot.writeMessageEnd()
+        self._oprot.trans.flush()
+
+    def recv_print_finger_table(self):
+        iprot = self._iprot
+        (fname, mtype, rseqid) = iprot.readMessageBegin()
+        if mtype == TMessageType.EXCEPTION:
+            x = TApplicationException()
+            x.read(iprot)
+            iprot.readMessageEnd()
+            raise x
+        result = print_finger_table_result()
+        result.read(iprot)
+        iprot.readMessageEnd()
+        return
+
+
+class Processor(Iface, TProcessor):
+    def __init__(self, handler):
+        self._handler = handler
+        self._processMap = {}
+        self._processMap["put_data"] = Processor.process_put_data
+        self._processMap["submit_data"] = Processor.process_submit_data
+        self._processMap["get_queue_status"] = Processor.process_get_queue_status
+        self._processMap["put_data_batch"] = Processor.process_put_data_batch
+        self._processMap["get_models"] = Processor.process_get_models
+        self._processMap["get_statuses"] = Processor.process_get_statuses
+        self._processMap["get_aggregate"] = Processor.process_get_aggregate
+        self._processMap["reduce_aggregate"] = Processor.process_reduce_aggregate
+        self._processMap["all_reduce"] = Processor.process_all_reduce
+        self._processMap["delete_job"] = Processor.process_delete_job
+        self._processMap["publish_model"] = Processor.process_publish_model
+        self._processMap["broadcast_chunk"] = Processor.process_broadcast_chunk
+        self._processMap["get_model"] = Processor.process_get_model
+        self._processMap["wait_model"] = Processor.process_wait_model
+        self._processMap["fix_fingers"] = Processor.process_fix_fingers
+        self._processMap["find_successor"] = Processor.process_find_successor
+        self._processMap["find_predecessor"] = Processor.process_find_predecessor
+        self._processMap["update_finger_table"] = Processor.process_update_finger_table
+        self._processMap["get_predecessor"] = Processor.process_get_predecessor
+        self._processMap["get_successor"] = Processor.process_get_successor
+        self._processMap["set_predecessor"] = Processor.process_set_predecessor
+        self._processMap["closest_preceding_node"] = Processor.process_closest_preceding_node
+        self._processMap["set_successor"] = Processor.process_set_successor
+        self._processMap["print_finger_table"] = Processor.process_print_finger_table
+        self._on_message_begin = None
+
+    def on_message_begin(self, func):
+        self._on_message_begin = func
+
+    def process(self, iprot, oprot):
+        (name, type, seqid) = iprot.readMessageBegin()
+        if self._on_message_begin:
+            self._on_message_begin(name, type, seqid)
+        if name not in self._processMap:
+            iprot.skip(TType.STRUCT)
+            iprot.readMessageEnd()
+            x = TApplicationException(TApplicationException.UNKNOWN_METHOD, 'Unknown function %s' % (name))
+            oprot.writeMessageBegin(name, TMessageType.EXCEPTION, seqid)
+            x.write(oprot)
+            oprot.writeMessageEnd()
+            oprot.trans.flush()
+            return
+        else:
+            self._processMap[name](self, seqid, iprot, oprot)
+        return True
+
+    def process_put_data(self, seqid, iprot, oprot):
+        args = put_data_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        try:
+            self._handler.put_data(args.filename, args.callback_address, args.compression)
+        except TTransport.TTransportException:
+            raise
+        except Exception:
+            logging.exception('Exception in oneway handler')
+
+    def process_submit_data(self, seqid, iprot, oprot):
+        args = submit_data_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = submit_data_result()
+        try:
+            result.success = self._handler.submit_data(args.filename, args.priority, args.deadline_ms)
             msg_type = TMessageType.REPLY
         except TTransport.TTransportException:
             raise
@@ -614,130 +1064,2303 @@ class Processor(Iface, TProcessor):
             logging.exception('Unexpected exception in handler')
             msg_type = TMessageType.EXCEPTION
             result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_predecessor", msg_type, seqid)
+        oprot.writeMessageBegin("submit_data", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_queue_status(self, seqid, iprot, oprot):
+        args = get_queue_status_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_queue_status_result()
+        try:
+            result.success = self._handler.get_queue_status()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_queue_status", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_put_data_batch(self, seqid, iprot, oprot):
+        args = put_data_batch_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = put_data_batch_result()
+        try:
+            result.success = self._handler.put_data_batch(args.filenames, args.callback_address, args.compression, args.job, args.version, args.settings)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("put_data_batch", msg_type, seqid)
         result.write(oprot)
         oprot.writeMessageEnd()
         oprot.trans.flush()
 
-    def process_get_successor(self, seqid, iprot, oprot):
-        args = get_successor_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = get_successor_result()
-        try:
-            result.success = self._handler.get_successor()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("get_successor", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def process_get_models(self, seqid, iprot, oprot):
+        args = get_models_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_models_result()
+        try:
+            result.success = self._handler.get_models(args.filenames, args.compression, args.job)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_models", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_statuses(self, seqid, iprot, oprot):
+        args = get_statuses_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_statuses_result()
+        try:
+            result.success = self._handler.get_statuses(args.filenames, args.job)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_statuses", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_aggregate(self, seqid, iprot, oprot):
+        args = get_aggregate_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_aggregate_result()
+        try:
+            result.success = self._handler.get_aggregate(args.job, args.filenames)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_aggregate", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_reduce_aggregate(self, seqid, iprot, oprot):
+        args = reduce_aggregate_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = reduce_aggregate_result()
+        try:
+            result.success = self._handler.reduce_aggregate(args.job, args.filenames, args.limit)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("reduce_aggregate", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_all_reduce(self, seqid, iprot, oprot):
+        args = all_reduce_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = all_reduce_result()
+        try:
+            result.success = self._handler.all_reduce(args.job, args.filenames)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("all_reduce", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_delete_job(self, seqid, iprot, oprot):
+        args = delete_job_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = delete_job_result()
+        try:
+            result.success = self._handler.delete_job(args.job, args.forward)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("delete_job", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_publish_model(self, seqid, iprot, oprot):
+        args = publish_model_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = publish_model_result()
+        try:
+            result.success = self._handler.publish_model(args.job, args.version, args.V_tensor, args.W_tensor)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("publish_model", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_broadcast_chunk(self, seqid, iprot, oprot):
+        args = broadcast_chunk_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = broadcast_chunk_result()
+        try:
+            result.success = self._handler.broadcast_chunk(args.job, args.version, args.origin, args.index, args.total, args.data)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("broadcast_chunk", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_model(self, seqid, iprot, oprot):
+        args = get_model_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_model_result()
+        try:
+            result.success = self._handler.get_model(args.filename)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_model", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_wait_model(self, seqid, iprot, oprot):
+        args = wait_model_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = wait_model_result()
+        try:
+            result.success = self._handler.wait_model(args.filename, args.timeout_ms, args.compression, args.job)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("wait_model", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_fix_fingers(self, seqid, iprot, oprot):
+        args = fix_fingers_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = fix_fingers_result()
+        try:
+            self._handler.fix_fingers()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("fix_fingers", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_find_successor(self, seqid, iprot, oprot):
+        args = find_successor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = find_successor_result()
+        try:
+            result.success = self._handler.find_successor(args.node_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("find_successor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_find_predecessor(self, seqid, iprot, oprot):
+        args = find_predecessor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = find_predecessor_result()
+        try:
+            result.success = self._handler.find_predecessor(args.node_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("find_predecessor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_update_finger_table(self, seqid, iprot, oprot):
+        args = update_finger_table_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = update_finger_table_result()
+        try:
+            self._handler.update_finger_table(args.node_id, args.index)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("update_finger_table", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_predecessor(self, seqid, iprot, oprot):
+        args = get_predecessor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_predecessor_result()
+        try:
+            result.success = self._handler.get_predecessor()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_predecessor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_get_successor(self, seqid, iprot, oprot):
+        args = get_successor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = get_successor_result()
+        try:
+            result.success = self._handler.get_successor()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("get_successor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_set_predecessor(self, seqid, iprot, oprot):
+        args = set_predecessor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = set_predecessor_result()
+        try:
+            result.success = self._handler.set_predecessor(args.node_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("set_predecessor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_closest_preceding_node(self, seqid, iprot, oprot):
+        args = closest_preceding_node_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = closest_preceding_node_result()
+        try:
+            result.success = self._handler.closest_preceding_node(args.node_id)
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("closest_preceding_node", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_set_successor(self, seqid, iprot, oprot):
+        args = set_successor_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = set_successor_result()
+        try:
+            self._handler.set_successor()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("set_successor", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+    def process_print_finger_table(self, seqid, iprot, oprot):
+        args = print_finger_table_args()
+        args.read(iprot)
+        iprot.readMessageEnd()
+        result = print_finger_table_result()
+        try:
+            self._handler.print_finger_table()
+            msg_type = TMessageType.REPLY
+        except TTransport.TTransportException:
+            raise
+        except TApplicationException as ex:
+            logging.exception('TApplication exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = ex
+        except Exception:
+            logging.exception('Unexpected exception in handler')
+            msg_type = TMessageType.EXCEPTION
+            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
+        oprot.writeMessageBegin("print_finger_table", msg_type, seqid)
+        result.write(oprot)
+        oprot.writeMessageEnd()
+        oprot.trans.flush()
+
+# HELPER FUNCTIONS AND STRUCTURES
+
+
+class put_data_args(object):
+    """
+    Attributes:
+     - filename
+     - callback_address
+     - compression
+
+    """
+
+
+    def __init__(self, filename=None, callback_address="", compression="",):
+        self.filename = filename
+        self.callback_address = callback_address
+        self.compression = compression
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.callback_address = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.compression = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('put_data_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.callback_address is not None:
+            oprot.writeFieldBegin('callback_address', TType.STRING, 2)
+            oprot.writeString(self.callback_address.encode('utf-8') if sys.version_info[0] == 2 else self.callback_address)
+            oprot.writeFieldEnd()
+        if self.compression is not None:
+            oprot.writeFieldBegin('compression', TType.STRING, 3)
+            oprot.writeString(self.compression.encode('utf-8') if sys.version_info[0] == 2 else self.compression)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(put_data_args)
+put_data_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.STRING, 'callback_address', 'UTF8', "", ),  # 2
+    (3, TType.STRING, 'compression', 'UTF8', "", ),  # 3
+)
+
+
+class submit_data_args(object):
+    """
+    Attributes:
+     - filename
+     - priority
+     - deadline_ms
+
+    """
+
+
+    def __init__(self, filename=None, priority=None, deadline_ms=None,):
+        self.filename = filename
+        self.priority = priority
+        self.deadline_ms = deadline_ms
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.priority = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.deadline_ms = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('submit_data_args')
+        if self.filename is not None:
+            oprot.writeFieldBegin('filename', TType.STRING, 1)
+            oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
+            oprot.writeFieldEnd()
+        if self.priority is not None:
+            oprot.writeFieldBegin('priority', TType.I32, 2)
+            oprot.writeI32(self.priority)
+            oprot.writeFieldEnd()
+        if self.deadline_ms is not None:
+            oprot.writeFieldBegin('deadline_ms', TType.I64, 3)
+            oprot.writeI64(self.deadline_ms)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(submit_data_args)
+submit_data_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'priority', None, None, ),  # 2
+    (3, TType.I64, 'deadline_ms', None, None, ),  # 3
+)
+
+
+class submit_data_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRING:
+                    self.success = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('submit_data_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRING, 0)
+            oprot.writeString(self.success.encode('utf-8') if sys.version_info[0] == 2 else self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(submit_data_result)
+submit_data_result.thrift_spec = (
+    (0, TType.STRING, 'success', 'UTF8', None, ),  # 0
+)
+
+
+class get_queue_status_args(object):
+
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_queue_status_args')
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_queue_status_args)
+get_queue_status_args.thrift_spec = (
+)
+
+
+class get_queue_status_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = QueueStatus()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_queue_status_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_queue_status_result)
+get_queue_status_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [QueueStatus, None], None, ),  # 0
+)
+
+
+class put_data_batch_args(object):
+    """
+    Attributes:
+     - filenames
+     - callback_address
+     - compression
+     - job
+     - version
+     - settings
+
+    """
+
+
+    def __init__(self, filenames=None, callback_address="", compression="", job="", version=0, settings=None,):
+        self.filenames = filenames
+        self.callback_address = callback_address
+        self.compression = compression
+        self.job = job
+        self.version = version
+        self.settings = settings
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype45, _size42) = iprot.readListBegin()
+                    for _i46 in range(_size42):
+                        _elem47 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem47)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.callback_address = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.compression = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.settings = TrainingSettings()
+                    self.settings.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('put_data_batch_args')
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter48 in self.filenames:
+                oprot.writeString(iter48.encode('utf-8') if sys.version_info[0] == 2 else iter48)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.callback_address is not None:
+            oprot.writeFieldBegin('callback_address', TType.STRING, 2)
+            oprot.writeString(self.callback_address.encode('utf-8') if sys.version_info[0] == 2 else self.callback_address)
+            oprot.writeFieldEnd()
+        if self.compression is not None:
+            oprot.writeFieldBegin('compression', TType.STRING, 3)
+            oprot.writeString(self.compression.encode('utf-8') if sys.version_info[0] == 2 else self.compression)
+            oprot.writeFieldEnd()
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 4)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 5)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.settings is not None:
+            oprot.writeFieldBegin('settings', TType.STRUCT, 6)
+            self.settings.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(put_data_batch_args)
+put_data_batch_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRING, 'callback_address', 'UTF8', "", ),  # 2
+    (3, TType.STRING, 'compression', 'UTF8', "", ),  # 3
+    (4, TType.STRING, 'job', 'UTF8', "", ),  # 4
+    (5, TType.I32, 'version', None, 0, ),  # 5
+    (6, TType.STRUCT, 'settings', [TrainingSettings, None], None, ),  # 6
+)
+
+
+class put_data_batch_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype50, _vtype51, _size49) = iprot.readMapBegin()
+                    for _i53 in range(_size49):
+                        _key54 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        _val55 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.success[_key54] = _val55
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('put_data_batch_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter56, viter57 in self.success.items():
+                oprot.writeString(kiter56.encode('utf-8') if sys.version_info[0] == 2 else kiter56)
+                oprot.writeString(viter57.encode('utf-8') if sys.version_info[0] == 2 else viter57)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(put_data_batch_result)
+put_data_batch_result.thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING, 'UTF8', TType.STRING, 'UTF8', False), None, ),  # 0
+)
+
+
+class get_models_args(object):
+    """
+    Attributes:
+     - filenames
+     - compression
+     - job
+
+    """
+
+
+    def __init__(self, filenames=None, compression="", job="",):
+        self.filenames = filenames
+        self.compression = compression
+        self.job = job
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype61, _size58) = iprot.readListBegin()
+                    for _i62 in range(_size58):
+                        _elem63 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem63)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.compression = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_models_args')
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter64 in self.filenames:
+                oprot.writeString(iter64.encode('utf-8') if sys.version_info[0] == 2 else iter64)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.compression is not None:
+            oprot.writeFieldBegin('compression', TType.STRING, 2)
+            oprot.writeString(self.compression.encode('utf-8') if sys.version_info[0] == 2 else self.compression)
+            oprot.writeFieldEnd()
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 3)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_models_args)
+get_models_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRING, 'compression', 'UTF8', "", ),  # 2
+    (3, TType.STRING, 'job', 'UTF8', "", ),  # 3
+)
+
+
+class get_models_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype66, _vtype67, _size65) = iprot.readMapBegin()
+                    for _i69 in range(_size65):
+                        _key70 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        _val71 = Model()
+                        _val71.read(iprot)
+                        self.success[_key70] = _val71
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_models_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRUCT, len(self.success))
+            for kiter72, viter73 in self.success.items():
+                oprot.writeString(kiter72.encode('utf-8') if sys.version_info[0] == 2 else kiter72)
+                viter73.write(oprot)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_models_result)
+get_models_result.thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING, 'UTF8', TType.STRUCT, [Model, None], False), None, ),  # 0
+)
+
+
+class get_statuses_args(object):
+    """
+    Attributes:
+     - filenames
+     - job
+
+    """
+
+
+    def __init__(self, filenames=None, job="",):
+        self.filenames = filenames
+        self.job = job
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype77, _size74) = iprot.readListBegin()
+                    for _i78 in range(_size74):
+                        _elem79 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem79)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_statuses_args')
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 1)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter80 in self.filenames:
+                oprot.writeString(iter80.encode('utf-8') if sys.version_info[0] == 2 else iter80)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 2)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_statuses_args)
+get_statuses_args.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 1
+    (2, TType.STRING, 'job', 'UTF8', "", ),  # 2
+)
+
+
+class get_statuses_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.MAP:
+                    self.success = {}
+                    (_ktype82, _vtype83, _size81) = iprot.readMapBegin()
+                    for _i85 in range(_size81):
+                        _key86 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        _val87 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.success[_key86] = _val87
+                    iprot.readMapEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_statuses_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.MAP, 0)
+            oprot.writeMapBegin(TType.STRING, TType.STRING, len(self.success))
+            for kiter88, viter89 in self.success.items():
+                oprot.writeString(kiter88.encode('utf-8') if sys.version_info[0] == 2 else kiter88)
+                oprot.writeString(viter89.encode('utf-8') if sys.version_info[0] == 2 else viter89)
+            oprot.writeMapEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_statuses_result)
+get_statuses_result.thrift_spec = (
+    (0, TType.MAP, 'success', (TType.STRING, 'UTF8', TType.STRING, 'UTF8', False), None, ),  # 0
+)
+
+
+class get_aggregate_args(object):
+    """
+    Attributes:
+     - job
+     - filenames
+
+    """
+
+
+    def __init__(self, job=None, filenames=None,):
+        self.job = job
+        self.filenames = filenames
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype93, _size90) = iprot.readListBegin()
+                    for _i94 in range(_size90):
+                        _elem95 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem95)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_aggregate_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter96 in self.filenames:
+                oprot.writeString(iter96.encode('utf-8') if sys.version_info[0] == 2 else iter96)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_aggregate_args)
+get_aggregate_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 2
+)
+
+
+class get_aggregate_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Aggregate()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_aggregate_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_aggregate_result)
+get_aggregate_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Aggregate, None], None, ),  # 0
+)
+
+
+class reduce_aggregate_args(object):
+    """
+    Attributes:
+     - job
+     - filenames
+     - limit
+
+    """
+
+
+    def __init__(self, job=None, filenames=None, limit=None,):
+        self.job = job
+        self.filenames = filenames
+        self.limit = limit
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype100, _size97) = iprot.readListBegin()
+                    for _i101 in range(_size97):
+                        _elem102 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem102)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.limit = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reduce_aggregate_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter103 in self.filenames:
+                oprot.writeString(iter103.encode('utf-8') if sys.version_info[0] == 2 else iter103)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.limit is not None:
+            oprot.writeFieldBegin('limit', TType.I32, 3)
+            oprot.writeI32(self.limit)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reduce_aggregate_args)
+reduce_aggregate_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 2
+    (3, TType.I32, 'limit', None, None, ),  # 3
+)
+
+
+class reduce_aggregate_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Aggregate()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('reduce_aggregate_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(reduce_aggregate_result)
+reduce_aggregate_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Aggregate, None], None, ),  # 0
+)
+
+
+class all_reduce_args(object):
+    """
+    Attributes:
+     - job
+     - filenames
+
+    """
+
+
+    def __init__(self, job=None, filenames=None,):
+        self.job = job
+        self.filenames = filenames
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype107, _size104) = iprot.readListBegin()
+                    for _i108 in range(_size104):
+                        _elem109 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem109)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('all_reduce_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 2)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter110 in self.filenames:
+                oprot.writeString(iter110.encode('utf-8') if sys.version_info[0] == 2 else iter110)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(all_reduce_args)
+all_reduce_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 2
+)
+
+
+class all_reduce_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Aggregate()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('all_reduce_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(all_reduce_result)
+all_reduce_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Aggregate, None], None, ),  # 0
+)
+
+
+class delete_job_args(object):
+    """
+    Attributes:
+     - job
+     - forward
+
+    """
+
+
+    def __init__(self, job=None, forward=True,):
+        self.job = job
+        self.forward = forward
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.BOOL:
+                    self.forward = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('delete_job_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.forward is not None:
+            oprot.writeFieldBegin('forward', TType.BOOL, 2)
+            oprot.writeBool(self.forward)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(delete_job_args)
+delete_job_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.BOOL, 'forward', None, True, ),  # 2
+)
+
+
+class delete_job_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.I32:
+                    self.success = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('delete_job_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.I32, 0)
+            oprot.writeI32(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(delete_job_result)
+delete_job_result.thrift_spec = (
+    (0, TType.I32, 'success', None, None, ),  # 0
+)
+
+
+class publish_model_args(object):
+    """
+    Attributes:
+     - job
+     - version
+     - V_tensor
+     - W_tensor
+
+    """
+
+
+    def __init__(self, job=None, version=None, V_tensor=None, W_tensor=None,):
+        self.job = job
+        self.version = version
+        self.V_tensor = V_tensor
+        self.W_tensor = W_tensor
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRUCT:
+                    self.V_tensor = Tensor()
+                    self.V_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRUCT:
+                    self.W_tensor = Tensor()
+                    self.W_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('publish_model_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 2)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.V_tensor is not None:
+            oprot.writeFieldBegin('V_tensor', TType.STRUCT, 3)
+            self.V_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        if self.W_tensor is not None:
+            oprot.writeFieldBegin('W_tensor', TType.STRUCT, 4)
+            self.W_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(publish_model_args)
+publish_model_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'version', None, None, ),  # 2
+    (3, TType.STRUCT, 'V_tensor', [Tensor, None], None, ),  # 3
+    (4, TType.STRUCT, 'W_tensor', [Tensor, None], None, ),  # 4
+)
+
+
+class publish_model_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('publish_model_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(publish_model_result)
+publish_model_result.thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ),  # 0
+)
+
+
+class broadcast_chunk_args(object):
+    """
+    Attributes:
+     - job
+     - version
+     - origin
+     - index
+     - total
+     - data
+
+    """
+
+
+    def __init__(self, job=None, version=None, origin=None, index=None, total=None, data=None,):
+        self.job = job
+        self.version = version
+        self.origin = origin
+        self.index = index
+        self.total = total
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.version = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.origin = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.index = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.I32:
+                    self.total = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('broadcast_chunk_args')
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 1)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
+        if self.version is not None:
+            oprot.writeFieldBegin('version', TType.I32, 2)
+            oprot.writeI32(self.version)
+            oprot.writeFieldEnd()
+        if self.origin is not None:
+            oprot.writeFieldBegin('origin', TType.I32, 3)
+            oprot.writeI32(self.origin)
+            oprot.writeFieldEnd()
+        if self.index is not None:
+            oprot.writeFieldBegin('index', TType.I32, 4)
+            oprot.writeI32(self.index)
+            oprot.writeFieldEnd()
+        if self.total is not None:
+            oprot.writeFieldBegin('total', TType.I32, 5)
+            oprot.writeI32(self.total)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 6)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(broadcast_chunk_args)
+broadcast_chunk_args.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'job', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'version', None, None, ),  # 2
+    (3, TType.I32, 'origin', None, None, ),  # 3
+    (4, TType.I32, 'index', None, None, ),  # 4
+    (5, TType.I32, 'total', None, None, ),  # 5
+    (6, TType.STRING, 'data', 'BINARY', None, ),  # 6
+)
+
 
-    def process_set_predecessor(self, seqid, iprot, oprot):
-        args = set_predecessor_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = set_predecessor_result()
-        try:
-            result.success = self._handler.set_predecessor(args.node_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("set_predecessor", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+class broadcast_chunk_result(object):
+    """
+    Attributes:
+     - success
 
-    def process_closest_preceding_node(self, seqid, iprot, oprot):
-        args = closest_preceding_node_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = closest_preceding_node_result()
-        try:
-            result.success = self._handler.closest_preceding_node(args.node_id)
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("closest_preceding_node", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    """
 
-    def process_set_successor(self, seqid, iprot, oprot):
-        args = set_successor_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = set_successor_result()
-        try:
-            self._handler.set_successor()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("set_successor", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
 
-    def process_print_finger_table(self, seqid, iprot, oprot):
-        args = print_finger_table_args()
-        args.read(iprot)
-        iprot.readMessageEnd()
-        result = print_finger_table_result()
-        try:
-            self._handler.print_finger_table()
-            msg_type = TMessageType.REPLY
-        except TTransport.TTransportException:
-            raise
-        except TApplicationException as ex:
-            logging.exception('TApplication exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = ex
-        except Exception:
-            logging.exception('Unexpected exception in handler')
-            msg_type = TMessageType.EXCEPTION
-            result = TApplicationException(TApplicationException.INTERNAL_ERROR, 'Internal error')
-        oprot.writeMessageBegin("print_finger_table", msg_type, seqid)
-        result.write(oprot)
-        oprot.writeMessageEnd()
-        oprot.trans.flush()
+    def __init__(self, success=None,):
+        self.success = success
 
-# HELPER FUNCTIONS AND STRUCTURES
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.BOOL:
+                    self.success = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('broadcast_chunk_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.BOOL, 0)
+            oprot.writeBool(self.success)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
 
+    def validate(self):
+        return
 
-class put_data_args(object):
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(broadcast_chunk_result)
+broadcast_chunk_result.thrift_spec = (
+    (0, TType.BOOL, 'success', None, None, ),  # 0
+)
+
+
+class get_model_args(object):
     """
     Attributes:
      - filename
@@ -771,7 +3394,7 @@ class put_data_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('put_data_args')
+        oprot.writeStructBegin('get_model_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
@@ -792,23 +3415,91 @@ class put_data_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(put_data_args)
-put_data_args.thrift_spec = (
+all_structs.append(get_model_args)
+get_model_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
 )
 
 
-class get_model_args(object):
+class get_model_result(object):
+    """
+    Attributes:
+     - success
+
+    """
+
+
+    def __init__(self, success=None,):
+        self.success = success
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 0:
+                if ftype == TType.STRUCT:
+                    self.success = Model()
+                    self.success.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('get_model_result')
+        if self.success is not None:
+            oprot.writeFieldBegin('success', TType.STRUCT, 0)
+            self.success.write(oprot)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(get_model_result)
+get_model_result.thrift_spec = (
+    (0, TType.STRUCT, 'success', [Model, None], None, ),  # 0
+)
+
+
+class wait_model_args(object):
     """
     Attributes:
      - filename
+     - timeout_ms
+     - compression
+     - job
 
     """
 
 
-    def __init__(self, filename=None,):
+    def __init__(self, filename=None, timeout_ms=None, compression="", job="",):
         self.filename = filename
+        self.timeout_ms = timeout_ms
+        self.compression = compression
+        self.job = job
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -824,6 +3515,21 @@ class get_model_args(object):
                     self.filename = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.timeout_ms = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.compression = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.job = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -833,11 +3539,23 @@ class get_model_args(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_model_args')
+        oprot.writeStructBegin('wait_model_args')
         if self.filename is not None:
             oprot.writeFieldBegin('filename', TType.STRING, 1)
             oprot.writeString(self.filename.encode('utf-8') if sys.version_info[0] == 2 else self.filename)
             oprot.writeFieldEnd()
+        if self.timeout_ms is not None:
+            oprot.writeFieldBegin('timeout_ms', TType.I32, 2)
+            oprot.writeI32(self.timeout_ms)
+            oprot.writeFieldEnd()
+        if self.compression is not None:
+            oprot.writeFieldBegin('compression', TType.STRING, 3)
+            oprot.writeString(self.compression.encode('utf-8') if sys.version_info[0] == 2 else self.compression)
+            oprot.writeFieldEnd()
+        if self.job is not None:
+            oprot.writeFieldBegin('job', TType.STRING, 4)
+            oprot.writeString(self.job.encode('utf-8') if sys.version_info[0] == 2 else self.job)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -854,14 +3572,17 @@ class get_model_args(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_model_args)
-get_model_args.thrift_spec = (
+all_structs.append(wait_model_args)
+wait_model_args.thrift_spec = (
     None,  # 0
     (1, TType.STRING, 'filename', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'timeout_ms', None, None, ),  # 2
+    (3, TType.STRING, 'compression', 'UTF8', "", ),  # 3
+    (4, TType.STRING, 'job', 'UTF8', "", ),  # 4
 )
 
 
-class get_model_result(object):
+class wait_model_result(object):
     """
     Attributes:
      - success
@@ -896,7 +3617,7 @@ class get_model_result(object):
         if oprot._fast_encode is not None and self.thrift_spec is not None:
             oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
             return
-        oprot.writeStructBegin('get_model_result')
+        oprot.writeStructBegin('wait_model_result')
         if self.success is not None:
             oprot.writeFieldBegin('success', TType.STRUCT, 0)
             self.success.write(oprot)
@@ -917,8 +3638,8 @@ class get_model_result(object):
 
     def __ne__(self, other):
         return not (self == other)
-all_structs.append(get_model_result)
-get_model_result.thrift_spec = (
+all_structs.append(wait_model_result)
+wait_model_result.thrift_spec = (
     (0, TType.STRUCT, 'success', [Model, None], None, ),  # 0
 )
 
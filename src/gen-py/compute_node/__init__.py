@@ -1 +1 @@
-__all__ = ['ttypes', 'constants', 'ComputeNode']
+__all__ = ['ttypes', 'constants', 'ComputeNode', 'ModelReceiver']
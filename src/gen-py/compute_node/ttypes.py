@@ -16,6 +16,136 @@ from thrift.transport import TTransport
 all_structs = []
 
 
+class Tensor(object):
+    """
+    Attributes:
+     - shape
+     - dtype
+     - data
+     - compression
+     - scale
+     - indices
+
+    """
+
+
+    def __init__(self, shape=None, dtype=None, data=None, compression=None, scale=None, indices=None,):
+        self.shape = shape
+        self.dtype = dtype
+        self.data = data
+        self.compression = compression
+        self.scale = scale
+        self.indices = indices
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.LIST:
+                    self.shape = []
+                    (_etype3, _size0) = iprot.readListBegin()
+                    for _i4 in range(_size0):
+                        _elem5 = iprot.readI32()
+                        self.shape.append(_elem5)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.dtype = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.compression = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.DOUBLE:
+                    self.scale = iprot.readDouble()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRING:
+                    self.indices = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Tensor')
+        if self.shape is not None:
+            oprot.writeFieldBegin('shape', TType.LIST, 1)
+            oprot.writeListBegin(TType.I32, len(self.shape))
+            for iter6 in self.shape:
+                oprot.writeI32(iter6)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        if self.dtype is not None:
+            oprot.writeFieldBegin('dtype', TType.STRING, 2)
+            oprot.writeString(self.dtype.encode('utf-8') if sys.version_info[0] == 2 else self.dtype)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 3)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
+        if self.compression is not None:
+            oprot.writeFieldBegin('compression', TType.STRING, 4)
+            oprot.writeString(self.compression.encode('utf-8') if sys.version_info[0] == 2 else self.compression)
+            oprot.writeFieldEnd()
+        if self.scale is not None:
+            oprot.writeFieldBegin('scale', TType.DOUBLE, 5)
+            oprot.writeDouble(self.scale)
+            oprot.writeFieldEnd()
+        if self.indices is not None:
+            oprot.writeFieldBegin('indices', TType.STRING, 6)
+            oprot.writeBinary(self.indices)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Tensor)
+Tensor.thrift_spec = (
+    None,  # 0
+    (1, TType.LIST, 'shape', (TType.I32, None, False), None, ),  # 1
+    (2, TType.STRING, 'dtype', 'UTF8', None, ),  # 2
+    (3, TType.STRING, 'data', 'BINARY', None, ),  # 3
+    (4, TType.STRING, 'compression', 'UTF8', None, ),  # 4
+    (5, TType.DOUBLE, 'scale', None, None, ),  # 5
+    (6, TType.STRING, 'indices', 'BINARY', None, ),  # 6
+)
+
+
 class Model(object):
     """
     Attributes:
@@ -23,15 +153,21 @@ class Model(object):
      - W
      - error_rate
      - status
+     - V_tensor
+     - W_tensor
+     - samples
 
     """
 
 
-    def __init__(self, V=None, W=None, error_rate=None, status=None,):
+    def __init__(self, V=None, W=None, error_rate=None, status=None, V_tensor=None, W_tensor=None, samples=None,):
         self.V = V
         self.W = W
         self.error_rate = error_rate
         self.status = status
+        self.V_tensor = V_tensor
+        self.W_tensor = W_tensor
+        self.samples = samples
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -45,30 +181,30 @@ class Model(object):
             if fid == 1:
                 if ftype == TType.LIST:
                     self.V = []
-                    (_etype3, _size0) = iprot.readListBegin()
-                    for _i4 in range(_size0):
-                        _elem5 = []
-                        (_etype9, _size6) = iprot.readListBegin()
-                        for _i10 in range(_size6):
-                            _elem11 = iprot.readDouble()
-                            _elem5.append(_elem11)
+                    (_etype10, _size7) = iprot.readListBegin()
+                    for _i11 in range(_size7):
+                        _elem12 = []
+                        (_etype16, _size13) = iprot.readListBegin()
+                        for _i17 in range(_size13):
+                            _elem18 = iprot.readDouble()
+                            _elem12.append(_elem18)
                         iprot.readListEnd()
-                        self.V.append(_elem5)
+                        self.V.append(_elem12)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 2:
                 if ftype == TType.LIST:
                     self.W = []
-                    (_etype15, _size12) = iprot.readListBegin()
-                    for _i16 in range(_size12):
-                        _elem17 = []
-                        (_etype21, _size18) = iprot.readListBegin()
-                        for _i22 in range(_size18):
-                            _elem23 = iprot.readDouble()
-                            _elem17.append(_elem23)
+                    (_etype22, _size19) = iprot.readListBegin()
+                    for _i23 in range(_size19):
+                        _elem24 = []
+                        (_etype28, _size25) = iprot.readListBegin()
+                        for _i29 in range(_size25):
+                            _elem30 = iprot.readDouble()
+                            _elem24.append(_elem30)
                         iprot.readListEnd()
-                        self.W.append(_elem17)
+                        self.W.append(_elem24)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -82,6 +218,23 @@ class Model(object):
                     self.status = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
                 else:
                     iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRUCT:
+                    self.V_tensor = Tensor()
+                    self.V_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.STRUCT:
+                    self.W_tensor = Tensor()
+                    self.W_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 7:
+                if ftype == TType.I64:
+                    self.samples = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -95,20 +248,20 @@ class Model(object):
         if self.V is not None:
             oprot.writeFieldBegin('V', TType.LIST, 1)
             oprot.writeListBegin(TType.LIST, len(self.V))
-            for iter24 in self.V:
-                oprot.writeListBegin(TType.DOUBLE, len(iter24))
-                for iter25 in iter24:
-                    oprot.writeDouble(iter25)
+            for iter31 in self.V:
+                oprot.writeListBegin(TType.DOUBLE, len(iter31))
+                for iter32 in iter31:
+                    oprot.writeDouble(iter32)
                 oprot.writeListEnd()
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.W is not None:
             oprot.writeFieldBegin('W', TType.LIST, 2)
             oprot.writeListBegin(TType.LIST, len(self.W))
-            for iter26 in self.W:
-                oprot.writeListBegin(TType.DOUBLE, len(iter26))
-                for iter27 in iter26:
-                    oprot.writeDouble(iter27)
+            for iter33 in self.W:
+                oprot.writeListBegin(TType.DOUBLE, len(iter33))
+                for iter34 in iter33:
+                    oprot.writeDouble(iter34)
                 oprot.writeListEnd()
             oprot.writeListEnd()
             oprot.writeFieldEnd()
@@ -120,6 +273,18 @@ class Model(object):
             oprot.writeFieldBegin('status', TType.STRING, 4)
             oprot.writeString(self.status.encode('utf-8') if sys.version_info[0] == 2 else self.status)
             oprot.writeFieldEnd()
+        if self.V_tensor is not None:
+            oprot.writeFieldBegin('V_tensor', TType.STRUCT, 5)
+            self.V_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        if self.W_tensor is not None:
+            oprot.writeFieldBegin('W_tensor', TType.STRUCT, 6)
+            self.W_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        if self.samples is not None:
+            oprot.writeFieldBegin('samples', TType.I64, 7)
+            oprot.writeI64(self.samples)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -143,6 +308,313 @@ Model.thrift_spec = (
     (2, TType.LIST, 'W', (TType.LIST, (TType.DOUBLE, None, False), False), None, ),  # 2
     (3, TType.DOUBLE, 'error_rate', None, None, ),  # 3
     (4, TType.STRING, 'status', 'UTF8', None, ),  # 4
+    (5, TType.STRUCT, 'V_tensor', [Tensor, None], None, ),  # 5
+    (6, TType.STRUCT, 'W_tensor', [Tensor, None], None, ),  # 6
+    (7, TType.I64, 'samples', None, None, ),  # 7
+)
+
+
+class Aggregate(object):
+    """
+    Attributes:
+     - V_tensor
+     - W_tensor
+     - count
+     - samples
+     - filenames
+
+    """
+
+
+    def __init__(self, V_tensor=None, W_tensor=None, count=None, samples=None, filenames=None,):
+        self.V_tensor = V_tensor
+        self.W_tensor = W_tensor
+        self.count = count
+        self.samples = samples
+        self.filenames = filenames
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRUCT:
+                    self.V_tensor = Tensor()
+                    self.V_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.W_tensor = Tensor()
+                    self.W_tensor.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.count = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I64:
+                    self.samples = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.LIST:
+                    self.filenames = []
+                    (_etype38, _size35) = iprot.readListBegin()
+                    for _i39 in range(_size35):
+                        _elem40 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.filenames.append(_elem40)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('Aggregate')
+        if self.V_tensor is not None:
+            oprot.writeFieldBegin('V_tensor', TType.STRUCT, 1)
+            self.V_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        if self.W_tensor is not None:
+            oprot.writeFieldBegin('W_tensor', TType.STRUCT, 2)
+            self.W_tensor.write(oprot)
+            oprot.writeFieldEnd()
+        if self.count is not None:
+            oprot.writeFieldBegin('count', TType.I32, 3)
+            oprot.writeI32(self.count)
+            oprot.writeFieldEnd()
+        if self.samples is not None:
+            oprot.writeFieldBegin('samples', TType.I64, 4)
+            oprot.writeI64(self.samples)
+            oprot.writeFieldEnd()
+        if self.filenames is not None:
+            oprot.writeFieldBegin('filenames', TType.LIST, 5)
+            oprot.writeListBegin(TType.STRING, len(self.filenames))
+            for iter41 in self.filenames:
+                oprot.writeString(iter41.encode('utf-8') if sys.version_info[0] == 2 else iter41)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(Aggregate)
+Aggregate.thrift_spec = (
+    None,  # 0
+    (1, TType.STRUCT, 'V_tensor', [Tensor, None], None, ),  # 1
+    (2, TType.STRUCT, 'W_tensor', [Tensor, None], None, ),  # 2
+    (3, TType.I32, 'count', None, None, ),  # 3
+    (4, TType.I64, 'samples', None, None, ),  # 4
+    (5, TType.LIST, 'filenames', (TType.STRING, 'UTF8', False), None, ),  # 5
+)
+
+
+class QueueStatus(object):
+    """
+    Attributes:
+     - depth
+     - capacity
+     - running
+     - workers
+     - saturated
+
+    """
+
+
+    def __init__(self, depth=None, capacity=None, running=None, workers=None, saturated=None,):
+        self.depth = depth
+        self.capacity = capacity
+        self.running = running
+        self.workers = workers
+        self.saturated = saturated
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I32:
+                    self.depth = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.capacity = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.running = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.workers = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.BOOL:
+                    self.saturated = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('QueueStatus')
+        if self.depth is not None:
+            oprot.writeFieldBegin('depth', TType.I32, 1)
+            oprot.writeI32(self.depth)
+            oprot.writeFieldEnd()
+        if self.capacity is not None:
+            oprot.writeFieldBegin('capacity', TType.I32, 2)
+            oprot.writeI32(self.capacity)
+            oprot.writeFieldEnd()
+        if self.running is not None:
+            oprot.writeFieldBegin('running', TType.I32, 3)
+            oprot.writeI32(self.running)
+            oprot.writeFieldEnd()
+        if self.workers is not None:
+            oprot.writeFieldBegin('workers', TType.I32, 4)
+            oprot.writeI32(self.workers)
+            oprot.writeFieldEnd()
+        if self.saturated is not None:
+            oprot.writeFieldBegin('saturated', TType.BOOL, 5)
+            oprot.writeBool(self.saturated)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(QueueStatus)
+QueueStatus.thrift_spec = (
+    None,  # 0
+    (1, TType.I32, 'depth', None, None, ),  # 1
+    (2, TType.I32, 'capacity', None, None, ),  # 2
+    (3, TType.I32, 'running', None, None, ),  # 3
+    (4, TType.I32, 'workers', None, None, ),  # 4
+    (5, TType.BOOL, 'saturated', None, None, ),  # 5
+)
+
+
+class TrainingSettings(object):
+    """
+    Attributes:
+     - precision
+     - batch_size
+
+    """
+
+
+    def __init__(self, precision=None, batch_size=None,):
+        self.precision = precision
+        self.batch_size = batch_size
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.precision = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.batch_size = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('TrainingSettings')
+        if self.precision is not None:
+            oprot.writeFieldBegin('precision', TType.STRING, 1)
+            oprot.writeString(self.precision.encode('utf-8') if sys.version_info[0] == 2 else self.precision)
+            oprot.writeFieldEnd()
+        if self.batch_size is not None:
+            oprot.writeFieldBegin('batch_size', TType.I32, 2)
+            oprot.writeI32(self.batch_size)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+all_structs.append(TrainingSettings)
+TrainingSettings.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'precision', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'batch_size', None, None, ),  # 2
 )
 fix_spec(all_structs)
 del all_structs
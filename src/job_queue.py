@@ -0,0 +1,56 @@
+import heapq
+import itertools
+import threading
+
+
+class QueueFull(Exception):
+    """Raised when a job is pushed onto a full JobQueue."""
+
+
+class JobQueue:
+    """Bounded, thread-safe priority queue of training jobs.
+
+    Jobs with a higher priority are popped first. Within a priority they are
+    popped in arrival order ('fifo') or earliest deadline first ('edf'), jobs
+    without a deadline after those with one.
+    """
+
+    ORDERS = ('fifo', 'edf')
+
+    def __init__(self, capacity, order='fifo'):
+        if order not in self.ORDERS:
+            raise ValueError(f"Unknown queue order {order}")
+        self.capacity = capacity
+        self.order = order
+        self.heap = []
+        self.counter = itertools.count()
+        self.not_empty = threading.Condition(threading.Lock())
+
+    def push(self, job, priority=0, deadline=None):
+        """Queue the job, raise QueueFull if the queue is at capacity."""
+        with self.not_empty:
+            if len(self.heap) >= self.capacity:
+                raise QueueFull(f"Job queue is full ({self.capacity} jobs)")
+            if self.order == 'edf' and deadline:
+                key = (-priority, 0, deadline)
+            else:
+                key = (-priority, 1, 0)
+            heapq.heappush(self.heap, key + (next(self.counter), job))
+            self.not_empty.notify()
+
+    def pop_many(self, n):
+        """Wait for a job, then pop it and up to n - 1 more in queue order."""
+        with self.not_empty:
+            while not self.heap:
+                self.not_empty.wait()
+            return [heapq.heappop(self.heap)[-1] for _ in range(min(n, len(self.heap)))]
+
+    def depth(self):
+        """Return the number of queued jobs."""
+        with self.not_empty:
+            return len(self.heap)
+
+    def is_full(self):
+        """Return whether pushing a job would raise QueueFull."""
+        with self.not_empty:
+            return len(self.heap) >= self.capacity
@@ -0,0 +1,336 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+import numpy as np
+import tensor_codec
+from compute_node.ttypes import Model
+
+# Bumped whenever the layout of stored model files changes.
+STORE_VERSION = 2
+
+
+class ModelStore:
+    """Thread-safe store of the models trained on a compute node and their status.
+
+    RPC threads read it while the training callbacks write it, every access
+    goes through one lock so a file's status and model always change together.
+    Models are kept per job, jobs that submit the same file each get their own
+    entry, keyed by (job, filename).
+
+    With a directory, every trained model is also written there as a .model
+    file. At most max_resident trained models stay in memory, the least
+    recently used ones are read back from disk when asked for again, and a
+    restarted store reloads every file whose checksum matches. delete_job()
+    removes a job's models, and with a job_ttl jobs unused for that many
+    seconds expire.
+
+    Models can carry the key of their training inputs, find() returns the
+    stored model trained with a key so equal inputs are not trained twice.
+    """
+
+    def __init__(self, directory=None, max_resident=64, job_ttl=0):
+        # resident models by (job, filename), least recently used first
+        self.models = OrderedDict()
+        self.training_status = {}
+        # set when the training file finishes, for wait()
+        self.done_events = {}
+        # (callback address, compression) to push the file's next model to
+        self.callbacks = {}
+        # compressed copies of the resident models, by compression spec
+        self.variants = {}
+        # file of every model written to the directory
+        self.paths = {}
+        # when every job was last used
+        self.jobs = {}
+        # training key of every entry, and the entry holding the model of every key
+        self.file_keys = {}
+        self.keys = {}
+        self.directory = directory
+        self.max_resident = max_resident
+        self.job_ttl = job_ttl
+        self.lock = threading.Lock()
+        if directory:
+            self.reload()
+
+    def start(self, job, filename, key=None):
+        """Mark the file as training for job, return False if it already is.
+
+        The model put next is stored as trained with key.
+        """
+        entry = (job, filename)
+        with self.lock:
+            if self.training_status.get(entry) == 'training':
+                return False
+            self.drop(entry)
+            self.training_status[entry] = 'training'
+            if key:
+                self.file_keys[entry] = key
+            self.jobs[job] = time.time()
+            self.done_events[entry] = threading.Event()
+            return True
+
+    def put(self, job, filename, model):
+        """Store the trained model of the job's file, its status becomes the model's.
+
+        Returns the (callback address, compression) pairs registered for the
+        file, which are cleared so every callback receives one model.
+        """
+        entry = (job, filename)
+        path = None
+        if self.directory and model.status == 'done' and model.V_tensor is not None:
+            with self.lock:
+                key = self.file_keys.get(entry)
+            path = self.write(job, filename, key, model)
+
+        with self.lock:
+            self.models[entry] = model
+            self.models.move_to_end(entry)
+            self.training_status[entry] = model.status
+            if path:
+                self.paths[entry] = path
+            if model.status == 'done' and entry in self.file_keys:
+                self.keys[self.file_keys[entry]] = entry
+            else:
+                self.file_keys.pop(entry, None)
+            self.variants.pop(entry, None)
+            event = self.done_events.pop(entry, None)
+            callbacks = self.callbacks.pop(entry, [])
+            self.evict()
+            self.expire()
+        if event:
+            event.set()
+        return callbacks
+
+    def add_callback(self, job, filename, address, compression=""):
+        """Register an address to push the job's next stored model of the file to."""
+        with self.lock:
+            callbacks = self.callbacks.setdefault((job, filename), [])
+            if (address, compression) not in callbacks:
+                callbacks.append((address, compression))
+
+    def get_variant(self, job, filename, compression, model):
+        """Return the copy of model compressed as compression, or None if there is none."""
+        entry = (job, filename)
+        with self.lock:
+            if self.models.get(entry) is not model:
+                return None
+            return self.variants.get(entry, {}).get(compression)
+
+    def put_variant(self, job, filename, compression, model, variant):
+        """Store a compressed copy of model, unless the job's file has a newer model.
+
+        Returns variant.
+        """
+        entry = (job, filename)
+        with self.lock:
+            if self.models.get(entry) is model:
+                self.variants.setdefault(entry, {})[compression] = variant
+        return variant
+
+    def get(self, job, filename):
+        """Return the job's stored model of the file, reading it from disk if needed, or None."""
+        entry = (job, filename)
+        with self.lock:
+            self.expire()
+            if entry in self.training_status:
+                self.jobs[job] = time.time()
+            model = self.models.get(entry)
+            if model is not None:
+                self.models.move_to_end(entry)
+                return model
+            path = self.paths.get(entry)
+        if path is None:
+            return None
+
+        loaded = self.read(path)
+        with self.lock:
+            if self.paths.get(entry) != path:
+                return self.models.get(entry)
+            if loaded is None:
+                print(f"Dropping corrupt model of {filename} for job {job} at {path}")
+                self.remove(entry)
+                return None
+            model = self.models.setdefault(entry, loaded[4])
+            self.evict()
+            return model
+
+    def find(self, key):
+        """Return a stored model trained with key, of any job, or None."""
+        with self.lock:
+            entry = self.keys.get(key)
+        if entry is None:
+            return None
+        model = self.get(*entry)
+        with self.lock:
+            if self.file_keys.get(entry) != key:
+                return None
+        return model
+
+    def status(self, job, filename):
+        """Return the training status of the job's file, or None if it is unknown."""
+        with self.lock:
+            return self.training_status.get((job, filename))
+
+    def wait(self, job, filename, timeout):
+        """Wait up to timeout seconds for the job's file to stop training.
+
+        Returns the stored model of the file, or None if there is none yet.
+        """
+        with self.lock:
+            event = self.done_events.get((job, filename))
+        if event:
+            event.wait(timeout)
+        return self.get(job, filename)
+
+    def delete_job(self, job):
+        """Remove the models of job's files that are not training, return how many."""
+        with self.lock:
+            return self.delete_files(job)
+
+    # The helpers below expect the lock to be held.
+
+    def delete_files(self, job):
+        """Remove the models of job's files that are not training, return how many."""
+        entries = [entry for entry, status in self.training_status.items()
+                   if entry[0] == job and status != 'training']
+        for entry in entries:
+            self.remove(entry)
+        if not any(j == job for j, _ in self.training_status):
+            self.jobs.pop(job, None)
+        return len(entries)
+
+    def expire(self):
+        """Remove the models of jobs unused for longer than job_ttl seconds."""
+        if not self.job_ttl:
+            return
+        now = time.time()
+        for job, last_used in list(self.jobs.items()):
+            if now - last_used > self.job_ttl:
+                print(f"Expired {self.delete_files(job)} models of job {job}")
+
+    def evict(self):
+        """Drop the least recently used models written to disk beyond max_resident."""
+        resident = [entry for entry in self.models if entry in self.paths]
+        for entry in resident[:max(0, len(resident) - self.max_resident)]:
+            del self.models[entry]
+            self.variants.pop(entry, None)
+
+    def drop(self, entry):
+        """Forget the stored model of the (job, filename) entry, in memory and on disk."""
+        self.models.pop(entry, None)
+        self.variants.pop(entry, None)
+        key = self.file_keys.pop(entry, None)
+        if key and self.keys.get(key) == entry:
+            del self.keys[key]
+        path = self.paths.pop(entry, None)
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def remove(self, entry):
+        """Forget the (job, filename) entry entirely."""
+        self.drop(entry)
+        self.training_status.pop(entry, None)
+
+    # Model files, read and written without the lock.
+
+    def reload(self):
+        """Register the models left in the directory by an earlier run.
+
+        Files that fail their checksum are deleted. Reloaded models are read
+        into memory only when asked for.
+        """
+        try:
+            entries = sorted(os.listdir(self.directory))
+        except FileNotFoundError:
+            return
+
+        for entry in entries:
+            path = os.path.join(self.directory, entry)
+            if entry.endswith('.tmp'):
+                os.remove(path)
+                continue
+            if not entry.endswith('.model'):
+                continue
+
+            loaded = self.read(path)
+            if loaded is None:
+                print(f"Dropping corrupt model file {path}")
+                os.remove(path)
+                continue
+            filename, job, key, stored, _ = loaded
+            entry = (job, filename)
+            self.paths[entry] = path
+            self.training_status[entry] = 'done'
+            if key:
+                self.file_keys[entry] = key
+                self.keys[key] = entry
+            self.jobs[job] = max(self.jobs.get(job, 0), stored)
+        print(f"Reloaded {len(self.paths)} models from {self.directory}")
+
+    def write(self, job, filename, key, model):
+        """Write a job's trained model to the directory, return its path or None on failure.
+
+        The file is an .npz archive of the V and W gradients, a JSON header
+        and the SHA-256 checksum of both.
+        """
+        V = tensor_codec.unpack(model.V_tensor)
+        W = tensor_codec.unpack(model.W_tensor)
+        meta = json.dumps({
+            'version': STORE_VERSION,
+            'filename': filename,
+            'job': job,
+            'key': key,
+            'error_rate': model.error_rate,
+            'samples': model.samples,
+            'stored': time.time(),
+        }).encode()
+
+        name = hashlib.sha1(json.dumps([job, filename]).encode()).hexdigest()
+        path = os.path.join(self.directory, name + ".model")
+        tmp_path = "%s.%d.tmp" % (path, os.getpid())
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_path, 'wb') as file:
+                np.savez(file, meta=np.frombuffer(meta, dtype=np.uint8), V=V, W=W,
+                         checksum=np.frombuffer(checksum(meta, V, W), dtype=np.uint8))
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Failed to store model of {filename} - {e}")
+            return None
+        return path
+
+    def read(self, path):
+        """Read a model file, return (filename, job, training key, stored time, Model) or None if it is corrupt."""
+        try:
+            with np.load(path) as data:
+                meta = data['meta'].tobytes()
+                V = data['V']
+                W = data['W']
+                stored_checksum = data['checksum'].tobytes()
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            return None
+        if stored_checksum != checksum(meta, V, W):
+            return None
+
+        meta = json.loads(meta)
+        if meta.get('version') != STORE_VERSION:
+            return None
+        model = Model(V_tensor=tensor_codec.pack(V), W_tensor=tensor_codec.pack(W),
+                      error_rate=meta['error_rate'], status='done', samples=meta['samples'])
+        return meta['filename'], meta['job'], meta['key'], meta['stored'], model
+
+
+def checksum(meta, V, W):
+    """SHA-256 of a model file's header and gradients, shapes included."""
+    digest = hashlib.sha256(meta)
+    for array in (V, W):
+        digest.update(repr(array.shape).encode())
+        digest.update(np.ascontiguousarray(array).tobytes())
+    return digest.digest()
@@ -10,5 +10,6 @@ service Supernode {
   bool confirm_join(1: i32 node_id),
   string get_node(),
   string get_compute_node_address(1: i32 node_id)
+  map<i32, string> get_compute_node_addresses(),
   void remove_join(1: i32 node_id)
 }
\ No newline at end of file
@@ -0,0 +1,106 @@
+import math
+import zlib
+import numpy as np
+import sys
+sys.path.append("gen-py")
+from compute_node.ttypes import Tensor
+
+# Lossy encodings a receiver can ask for, optionally followed by "+zlib",
+# e.g. "int8", "topk:0.05+zlib" or just "zlib".
+COMPRESSIONS = ('none', 'float16', 'int8', 'topk')
+
+# Fraction of the values kept by "topk" when the spec gives none.
+TOPK_RATIO = 0.1
+
+
+def pack(array):
+    """Pack a numpy array into a Tensor of raw little-endian bytes."""
+    array = np.asarray(array)
+    dtype = array.dtype.newbyteorder('<')
+    data = np.ascontiguousarray(array, dtype=dtype).tobytes()
+    return Tensor(shape=list(array.shape), dtype=dtype.str, data=data)
+
+
+def unpack(tensor):
+    """Unpack a Tensor, decompressing it if needed, into a numpy array.
+
+    Uncompressed tensors are returned as read-only arrays backed by their bytes.
+    """
+    method, _, use_zlib = parse_compression(tensor.compression)
+    data = zlib.decompress(tensor.data) if use_zlib else tensor.data
+    dtype = np.dtype(tensor.dtype)
+
+    if method == 'none':
+        return np.frombuffer(data, dtype=dtype).reshape(tensor.shape)
+    if method == 'float16':
+        return np.frombuffer(data, dtype='<f2').astype(dtype).reshape(tensor.shape)
+    if method == 'int8':
+        return (np.frombuffer(data, dtype=np.int8) * tensor.scale).astype(dtype).reshape(tensor.shape)
+
+    indices = zlib.decompress(tensor.indices) if use_zlib else tensor.indices
+    array = np.zeros(math.prod(tensor.shape), dtype=dtype)
+    array[np.frombuffer(indices, dtype='<i4')] = np.frombuffer(data, dtype='<f4')
+    return array.reshape(tensor.shape)
+
+
+def parse_compression(spec):
+    """Split a compression spec like "topk:0.05+zlib" into (method, topk ratio, zlib)."""
+    parts = [part for part in (spec or '').split('+') if part]
+    use_zlib = 'zlib' in parts
+    parts = [part for part in parts if part != 'zlib']
+    if len(parts) > 1:
+        raise ValueError(f"Unknown compression {spec}")
+
+    method, _, ratio = (parts[0] if parts else 'none').partition(':')
+    if method not in COMPRESSIONS or (ratio and method != 'topk'):
+        raise ValueError(f"Unknown compression {spec}")
+    ratio = float(ratio) if ratio else TOPK_RATIO
+    if not 0 < ratio <= 1:
+        raise ValueError(f"Top-k ratio must be in (0, 1], got {ratio}")
+    return method, ratio, use_zlib
+
+
+def compress(array, spec, residual=None):
+    """Pack a float array into a Tensor compressed as spec asks.
+
+    float16 and int8 quantize every value, int8 with a scale of max|x| / 127.
+    topk keeps the largest values with their indices. With error feedback,
+    residual holds what earlier compressions of the same gradient dropped, it
+    is added before compressing.
+    Returns (tensor, residual), the new residual is what this tensor drops.
+    """
+    method, ratio, use_zlib = parse_compression(spec)
+    array = np.asarray(array, dtype=float)
+    if residual is not None:
+        array = array + residual
+
+    tensor = pack(array)
+    tensor.compression = spec
+    if method == 'float16':
+        tensor.data = array.astype('<f2').tobytes()
+    elif method == 'int8':
+        peak = np.max(np.abs(array)) if array.size else 0.0
+        tensor.scale = float(peak / 127) if peak > 0 else 1.0
+        tensor.data = np.round(array / tensor.scale).astype(np.int8).tobytes()
+    elif method == 'topk':
+        flat = array.ravel()
+        k = min(flat.size, max(1, math.ceil(ratio * flat.size)))
+        keep = np.sort(np.argpartition(np.abs(flat), flat.size - k)[flat.size - k:])
+        tensor.indices = keep.astype('<i4').tobytes()
+        tensor.data = flat[keep].astype('<f4').tobytes()
+        if use_zlib:
+            tensor.indices = zlib.compress(tensor.indices)
+
+    if use_zlib:
+        tensor.data = zlib.compress(tensor.data)
+    return tensor, array - unpack(tensor)
+
+
+def model_weights(model):
+    """Return the V and W gradients of a Model as float arrays.
+
+    Reads the packed tensors, or the nested lists sent by older nodes.
+    """
+    if model.V_tensor is not None and model.W_tensor is not None:
+        return unpack(model.V_tensor).astype(float), unpack(model.W_tensor).astype(float)
+    return np.array(model.V, dtype=float), np.array(model.W, dtype=float)
@@ -0,0 +1,14 @@
+import os
+import sys
+import pytest
+
+# The modules import each other, and the Thrift code, from the src directory.
+SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [SRC, os.path.join(SRC, "gen-py")]
+
+
+@pytest.fixture
+def shards():
+    """Paths of the letter shards shipped with the repo."""
+    letters = os.path.join(SRC, "letters")
+    return [os.path.join(letters, name) for name in sorted(os.listdir(letters))]
@@ -0,0 +1,54 @@
+import pytest
+from job_queue import JobQueue, QueueFull
+
+
+def drain(queue):
+    return queue.pop_many(queue.depth())
+
+
+def test_fifo_pops_by_priority_then_arrival():
+    queue = JobQueue(10)
+    for job, priority in [('a', 0), ('b', 1), ('c', 0), ('d', 1), ('e', 2)]:
+        queue.push(job, priority)
+    assert drain(queue) == ['e', 'b', 'd', 'a', 'c']
+
+
+def test_fifo_ignores_deadlines():
+    queue = JobQueue(10)
+    queue.push('a', deadline=30)
+    queue.push('b', deadline=10)
+    assert drain(queue) == ['a', 'b']
+
+
+def test_edf_pops_earliest_deadline_first():
+    queue = JobQueue(10, order='edf')
+    queue.push('late', deadline=30)
+    queue.push('none')
+    queue.push('early', deadline=10)
+    queue.push('urgent', priority=1)
+    assert drain(queue) == ['urgent', 'early', 'late', 'none']
+
+
+def test_pop_many_takes_at_most_n():
+    queue = JobQueue(10)
+    for job in 'abc':
+        queue.push(job)
+    assert queue.pop_many(2) == ['a', 'b']
+    assert queue.pop_many(5) == ['c']
+    assert queue.depth() == 0
+
+
+def test_full_queue_raises():
+    queue = JobQueue(2)
+    queue.push('a')
+    queue.push('b')
+    assert queue.is_full()
+    with pytest.raises(QueueFull):
+        queue.push('c')
+    queue.pop_many(1)
+    queue.push('c')
+
+
+def test_unknown_order_is_rejected():
+    with pytest.raises(ValueError):
+        JobQueue(1, order='lifo')
@@ -0,0 +1,70 @@
+import numpy as np
+from ML.ML import mlp, softmax
+from ML.worker import DEFAULT_CONFIG
+
+K = DEFAULT_CONFIG['k']
+H = DEFAULT_CONFIG['h']
+
+
+def new_model(cache_dir, vectorized=True):
+    model = mlp()
+    model.set_cache_dir(str(cache_dir))
+    model.set_vectorized(vectorized)
+    return model
+
+
+def test_vectorized_forward_pass_matches_loops(shards, tmp_path):
+    model = new_model(tmp_path)
+    model.init_training_random(shards[0], K, H)
+    Y = model.Y.copy()
+
+    model.set_vectorized(False)
+    model.forward_propogate(model.X)
+    np.testing.assert_allclose(Y, model.Y, rtol=0, atol=1e-12)
+
+
+def test_softmax_does_not_overflow():
+    Y = softmax(np.array([[1000.0, 0.0, -1000.0], [1.0, 1.0, 1.0]]))
+    np.testing.assert_allclose(Y, [[1, 0, 0], [1 / 3, 1 / 3, 1 / 3]])
+
+
+def train(model, epochs=30):
+    """Train the model, return (error rate, V, W)."""
+    rate = model.train(DEFAULT_CONFIG['eta'], epochs)
+    return (rate,) + model.get_weights()
+
+
+def assert_same_training(result, expected, atol):
+    rate, V, W = result
+    assert rate == expected[0]
+    np.testing.assert_allclose(V, expected[1], rtol=0, atol=atol)
+    np.testing.assert_allclose(W, expected[2], rtol=0, atol=atol)
+
+
+def test_workspace_training_matches_loops(shards, tmp_path):
+    results = []
+    for vectorized in (True, False):
+        model = new_model(tmp_path, vectorized)
+        model.init_training_random(shards[0], K, H)
+        results.append(train(model))
+    assert_same_training(results[0], results[1], atol=1e-12)
+
+
+def test_retraining_reuses_the_workspace(shards, tmp_path):
+    model = new_model(tmp_path)
+    model.init_training_random(shards[0], K, H)
+    buffers = dict(model.workspace)
+    train(model)
+    assert all(model.workspace[name] is buffer for name, buffer in buffers.items())
+
+
+def test_streamed_training_matches_in_memory(shards, tmp_path):
+    model = new_model(tmp_path)
+    model.init_training_random(shards[0], K, H)
+    expected = train(model)
+
+    # chunks that do not divide the shard evenly
+    streamed = new_model(tmp_path)
+    streamed.init_training_stream(shards[0], K, H, 128)
+    assert_same_training(train(streamed), expected, atol=1e-12)
+    assert streamed.n == model.n
@@ -0,0 +1,79 @@
+import os
+import numpy as np
+import tensor_codec
+from compute_node.ttypes import Model
+from model_store import ModelStore
+
+
+def trained(seed):
+    rng = np.random.default_rng(seed)
+    return Model(V_tensor=tensor_codec.pack(rng.normal(size=(4, 3))),
+                 W_tensor=tensor_codec.pack(rng.normal(size=(3, 2))),
+                 error_rate=0.1 * seed, status='done', samples=10 + seed)
+
+
+def store(directory, filename, model, job="", key=None, models=None):
+    models = models or ModelStore(directory)
+    models.start(job, filename, key)
+    models.put(job, filename, model)
+    return models
+
+
+def assert_same(model, expected):
+    for name in ('V_tensor', 'W_tensor'):
+        np.testing.assert_array_equal(tensor_codec.unpack(getattr(model, name)),
+                                      tensor_codec.unpack(getattr(expected, name)))
+    assert model.error_rate == expected.error_rate
+    assert model.samples == expected.samples
+    assert model.status == 'done'
+
+
+def test_evicted_models_read_back_equal(tmp_path):
+    models = ModelStore(str(tmp_path), max_resident=1)
+    expected = {f"shard{i}.txt": trained(i) for i in range(3)}
+    for filename, model in expected.items():
+        store(None, filename, model, models=models)
+
+    assert list(models.models) == [("", "shard2.txt")]
+    for filename, model in expected.items():
+        assert_same(models.get("", filename), model)
+
+
+def test_reload_restores_models_jobs_and_keys(tmp_path):
+    expected = trained(1)
+    store(str(tmp_path), "shard1.txt", expected, job="job1", key="key1")
+
+    models = ModelStore(str(tmp_path))
+    assert models.status("job1", "shard1.txt") == 'done'
+    assert models.status("", "shard1.txt") is None
+    assert_same(models.find("key1"), expected)
+    assert models.delete_job("job1") == 1
+    assert os.listdir(tmp_path) == []
+
+
+def test_checksum_mismatch_is_dropped(tmp_path):
+    store(str(tmp_path), "shard1.txt", trained(1))
+    store(str(tmp_path), "shard2.txt", trained(2), models=ModelStore(str(tmp_path)))
+    corrupt = ModelStore(str(tmp_path)).paths[("", "shard1.txt")]
+    with np.load(corrupt) as data:
+        arrays = dict(data)
+    arrays['V'] = arrays['V'] + 1
+    with open(corrupt, 'wb') as file:
+        np.savez(file, **arrays)
+
+    models = ModelStore(str(tmp_path))
+    assert models.status("", "shard1.txt") is None
+    assert models.get("", "shard1.txt") is None
+    assert not os.path.exists(corrupt)
+    assert_same(models.get("", "shard2.txt"), trained(2))
+
+
+def test_jobs_sharing_a_file_keep_their_own_models(tmp_path):
+    models = store(str(tmp_path), "shard1.txt", trained(1), job="job1")
+    store(None, "shard1.txt", trained(2), job="job2", models=models)
+    assert_same(models.get("job1", "shard1.txt"), trained(1))
+    assert_same(models.get("job2", "shard1.txt"), trained(2))
+
+    assert models.delete_job("job1") == 1
+    assert models.get("job1", "shard1.txt") is None
+    assert_same(ModelStore(str(tmp_path)).get("job2", "shard1.txt"), trained(2))
@@ -0,0 +1,22 @@
+import os
+import shutil
+
+from ML import shard_cache
+
+
+def test_publish_keeps_other_writers_temp_files(shards, tmp_path):
+    shard = str(tmp_path / "shard.txt")
+    shutil.copy(shards[0], shard)
+    cache_dir = str(tmp_path / "cache")
+
+    shard_cache.load(shard, cache_dir)
+    prefix, old_key = shard_cache.cache_key(shard)
+    in_flight = os.path.join(cache_dir, "%s-0-0-v%d.npy.99999.tmp" % (prefix, shard_cache.CACHE_VERSION))
+    open(in_flight, 'wb').close()
+
+    os.utime(shard, ns=(0, 10**9))
+    shard_cache.load(shard, cache_dir)
+    _, new_key = shard_cache.cache_key(shard)
+
+    assert sorted(os.listdir(cache_dir)) == sorted([new_key + ".npy", os.path.basename(in_flight)])
+    assert old_key != new_key
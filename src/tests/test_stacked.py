@@ -0,0 +1,32 @@
+import numpy as np
+from ML.ML import mlp
+from ML.stacked import stacked_mlp
+from ML.worker import DEFAULT_CONFIG
+
+K = DEFAULT_CONFIG['k']
+H = DEFAULT_CONFIG['h']
+EPOCHS = 60
+
+
+def test_stacked_training_matches_individual(shards, tmp_path):
+    # a shorter shard is padded in the stack
+    short = tmp_path / "short.txt"
+    with open(shards[2]) as file:
+        short.write_text("".join(file.readlines()[:300]))
+    fnames = shards[:2] + [str(short)]
+
+    stacked = stacked_mlp()
+    stacked.set_cache_dir(str(tmp_path))
+    stacked.init_training_random(fnames, K, H)
+    rates = stacked.train(DEFAULT_CONFIG['eta'], EPOCHS)
+    assert stacked.fnames == fnames
+
+    for s, fname in enumerate(fnames):
+        model = mlp()
+        model.set_cache_dir(str(tmp_path))
+        model.init_training_random(fname, K, H)
+        assert rates[s] == model.train(DEFAULT_CONFIG['eta'], EPOCHS)
+        V, W = stacked.get_shard_weights(s)
+        expected_V, expected_W = model.get_weights()
+        np.testing.assert_array_equal(V, expected_V)
+        np.testing.assert_array_equal(W, expected_W)
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+import tensor_codec
+from compute_node.ttypes import Model
+
+
+@pytest.mark.parametrize('dtype', ['<f8', '<f4', '>f8', '<i4'])
+def test_pack_round_trip(dtype):
+    array = np.arange(24).reshape(2, 3, 4).astype(dtype)
+    unpacked = tensor_codec.unpack(tensor_codec.pack(array))
+    assert unpacked.shape == array.shape
+    np.testing.assert_array_equal(unpacked, array)
+
+
+def test_model_weights_reads_tensors_and_lists():
+    V = np.arange(6.0).reshape(3, 2)
+    W = np.arange(4.0).reshape(2, 2)
+    packed = Model(V_tensor=tensor_codec.pack(V), W_tensor=tensor_codec.pack(W))
+    listed = Model(V=V.tolist(), W=W.tolist())
+    for model in (packed, listed):
+        model_V, model_W = tensor_codec.model_weights(model)
+        np.testing.assert_array_equal(model_V, V)
+        np.testing.assert_array_equal(model_W, W)
+
+
+@pytest.mark.parametrize('spec, tolerance', [
+    ('none', 0), ('zlib', 0), ('float16', 1e-3), ('float16+zlib', 1e-3),
+    ('int8', 1 / 254), ('int8+zlib', 1 / 254),
+])
+def test_compress_round_trip(spec, tolerance):
+    array = np.random.default_rng(0).uniform(-1, 1, size=(30, 20))
+    tensor, residual = tensor_codec.compress(array, spec)
+    unpacked = tensor_codec.unpack(tensor)
+    assert unpacked.shape == array.shape
+    assert np.max(np.abs(unpacked - array)) <= tolerance * np.max(np.abs(array)) + 1e-12
+    np.testing.assert_allclose(unpacked + residual, array)
+
+
+def test_topk_keeps_largest_values():
+    array = np.random.default_rng(0).normal(size=(10, 10))
+    tensor, residual = tensor_codec.compress(array, 'topk:0.2+zlib')
+    unpacked = tensor_codec.unpack(tensor)
+    kept = unpacked != 0
+    assert kept.sum() == 20
+    assert np.min(np.abs(array[kept])) >= np.max(np.abs(array[~kept]))
+    np.testing.assert_allclose(unpacked[kept], array[kept], rtol=1e-6)
+    np.testing.assert_allclose(unpacked + residual, array)
+
+
+def test_error_feedback_adds_residual():
+    array = np.random.default_rng(0).normal(size=50)
+    _, residual = tensor_codec.compress(array, 'topk:0.1')
+    tensor, new_residual = tensor_codec.compress(array, 'topk:0.1', residual)
+    np.testing.assert_allclose(tensor_codec.unpack(tensor) + new_residual, array + residual)
+
+
+@pytest.mark.parametrize('spec', ['gzip', 'int8+float16', 'int8:0.5', 'topk:0', 'topk:2'])
+def test_unknown_compression_is_rejected(spec):
+    with pytest.raises(ValueError):
+        tensor_codec.parse_compression(spec)
@@ -0,0 +1,11 @@
+from ML import worker
+
+
+def test_content_hashes_are_capped(shards, monkeypatch):
+    monkeypatch.setattr(worker, "MAX_CONTENT_HASHES", 2)
+    monkeypatch.setattr(worker, "_content_hashes", worker.OrderedDict())
+
+    hashes = [worker.content_hash(shard) for shard in shards[:3]]
+    assert len(worker._content_hashes) == 2
+    assert worker.content_hash(shards[0]) == hashes[0]
+    assert list(worker._content_hashes.values()) == [hashes[2], hashes[0]]